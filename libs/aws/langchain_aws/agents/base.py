@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 import time
 import uuid
@@ -18,6 +17,8 @@ from langchain_core.runnables import RunnableConfig, RunnableSerializable, ensur
 from langchain_core.tools import BaseTool
 from pydantic import model_validator
 
+from langchain_aws.serializers import json_dumps, json_loads
+
 _DEFAULT_ACTION_GROUP_NAME = "DEFAULT_AG_"
 _TEST_AGENT_ALIAS_ID = "TSTALIASID"
 
@@ -61,18 +62,20 @@ def parse_agent_response(response: Any) -> OutputType:
     event_stream = response["completion"]
     session_id = response["sessionId"]
     trace_log_elements = []
+    return_control = None
     for event in event_stream:
         if "trace" in event:
             trace_log_elements.append(event["trace"])
 
         if "returnControl" in event:
-            response_text = json.dumps(event)
+            return_control = event["returnControl"]
+            response_text = json_dumps(event).decode()
             break
 
         if "chunk" in event:
             response_text = event["chunk"]["bytes"].decode("utf-8")
 
-    trace_log = json.dumps(trace_log_elements)
+    trace_log = json_dumps(trace_log_elements).decode()
 
     agent_finish = BedrockAgentFinish(
         return_values={"output": response_text},
@@ -80,13 +83,6 @@ def parse_agent_response(response: Any) -> OutputType:
         session_id=session_id,
         trace_log=trace_log,
     )
-    if not response_text:
-        return agent_finish
-
-    if "returnControl" not in response_text:
-        return agent_finish
-
-    return_control = json.loads(response_text).get("returnControl")
     if not return_control:
         return agent_finish
 
@@ -592,7 +588,7 @@ class BedrockAgentsRunnable(RunnableSerializable[Dict, OutputType]):
                 if type(message) is AIMessage:
                     response = intermediate_steps[last_step][1]
                     session_state = {
-                        "invocationId": json.loads(message.content)  # type: ignore[arg-type]
+                        "invocationId": json_loads(message.content)  # type: ignore[arg-type]
                         .get("returnControl", {})
                         .get("invocationId", ""),
                         "returnControlInvocationResults": [
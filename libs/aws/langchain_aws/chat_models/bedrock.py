@@ -1,3 +1,4 @@
+import copy
 import logging
 import re
 import warnings
@@ -38,9 +39,12 @@ from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResu
 from langchain_core.runnables import Runnable, RunnableMap, RunnablePassthrough
 from langchain_core.tools import BaseTool
 from langchain_core.utils.pydantic import TypeBaseModel, is_basemodel_subclass
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
 
-from langchain_aws.chat_models.bedrock_converse import ChatBedrockConverse
+from langchain_aws.chat_models.bedrock_converse import (
+    ChatBedrockConverse,
+    _estimate_tokens,
+)
 from langchain_aws.function_calling import (
     ToolsOutputParser,
     _lc_tool_calls_to_anthropic_tool_use_blocks,
@@ -216,15 +220,16 @@ def _merge_messages(
     messages: Sequence[BaseMessage],
 ) -> List[Union[SystemMessage, AIMessage, HumanMessage]]:
     """Merge runs of human/tool messages into single human messages with content blocks."""  # noqa: E501
+    # Messages are only copied when they are merged, the others are returned as is
+    # rather than deep copied on every call.
     merged: list = []
     for curr in messages:
-        curr = curr.model_copy(deep=True)
         if isinstance(curr, ToolMessage):
             if isinstance(curr.content, list) and all(
                 isinstance(block, dict) and block.get("type") == "tool_result"
                 for block in curr.content
             ):
-                curr = HumanMessage(curr.content)  # type: ignore[misc]
+                curr = HumanMessage(list(curr.content))  # type: ignore[misc]
             else:
                 curr = HumanMessage(  # type: ignore[misc]
                     [
@@ -240,22 +245,108 @@ def _merge_messages(
             if isinstance(last.content, str):
                 new_content: List = [{"type": "text", "text": last.content}]
             else:
-                new_content = last.content
+                new_content = list(last.content)
             if isinstance(curr.content, str):
                 new_content.append({"type": "text", "text": curr.content})
             else:
                 new_content.extend(curr.content)
-            last.content = new_content
+            merged[-1] = last.model_copy(update={"content": new_content})
         else:
             merged.append(curr)
     return merged
 
 
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _format_anthropic_system_blocks(content: List) -> List[Dict]:
+    """Format the content blocks of a system message for anthropic."""
+    blocks: List[Dict] = []
+    for item in content:
+        if isinstance(item, str):
+            blocks.append({"type": "text", "text": item})
+        elif isinstance(item, dict) and item.get("type") == "text":
+            blocks.append(item)
+        elif isinstance(item, dict) and item.get("type") == "cache_point":
+            if blocks:
+                blocks[-1] = {**blocks[-1], "cache_control": _EPHEMERAL}
+        else:
+            raise ValueError(
+                "System message content must be a string or text blocks, "
+                f"instead was: {item}"
+            )
+    return blocks
+
+
+def _has_cache_control(blocks: Any) -> bool:
+    return isinstance(blocks, list) and any(
+        isinstance(block, dict) and "cache_control" in block for block in blocks
+    )
+
+
+def _with_cache_control(content: Union[str, List]) -> List:
+    """Return ``content`` as blocks with a cache breakpoint on the last one."""
+    if isinstance(content, str):
+        return [{"type": "text", "text": content, "cache_control": _EPHEMERAL}]
+    if not content or not isinstance(content[-1], dict):
+        return content
+    return [*content[:-1], {**content[-1], "cache_control": _EPHEMERAL}]
+
+
+def _add_anthropic_cache_control(
+    system: Optional[Union[str, List[Dict]]],
+    messages: List[Dict],
+    tools: Optional[List[Dict]],
+    min_tokens: int,
+) -> Tuple[Optional[Union[str, List[Dict]]], List[Dict], Optional[List[Dict]]]:
+    """Add cache breakpoints after the tools, system prompt and last message.
+
+    Like `ChatBedrockConverse` cache points, a breakpoint is placed at the end of
+    each part once the prompt up to there is estimated at ``min_tokens`` or more,
+    and nothing is added if the request already has one.
+    """
+    if (
+        _has_cache_control(tools)
+        or _has_cache_control(system)
+        or any(_has_cache_control(message["content"]) for message in messages)
+    ):
+        return system, messages, tools
+
+    size = 0.0
+    if tools:
+        size += _estimate_tokens(tools, min_tokens)
+        if size >= min_tokens:
+            tools = _with_cache_control(tools)
+    if system:
+        size += _estimate_tokens(system, min_tokens)
+        if size >= min_tokens:
+            system = _with_cache_control(system)
+    if messages:
+        size += _estimate_tokens(messages, min_tokens)
+        if size >= min_tokens:
+            last = messages[-1]
+            messages = [
+                *messages[:-1],
+                {**last, "content": _with_cache_control(last["content"])},
+            ]
+    return system, messages, tools
+
+
+def _prepend_system_prompt(
+    prompt: str, system: Optional[Union[str, List[Dict]]]
+) -> Union[str, List[Dict]]:
+    if not system:
+        return prompt
+    if isinstance(system, str):
+        return prompt + f"\n{system}"
+    return [{"type": "text", "text": prompt}, *system]
+
+
 def _format_anthropic_messages(
     messages: List[BaseMessage],
-) -> Tuple[Optional[str], List[Dict]]:
+) -> Tuple[Optional[Union[str, List[Dict]]], List[Dict]]:
     """Format messages for anthropic."""
-    system: Optional[str] = None
+    system: Optional[Union[str, List[Dict]]] = None
     formatted_messages: List[Dict] = []
 
     merged_messages = _merge_messages(messages)
@@ -263,12 +354,10 @@ def _format_anthropic_messages(
         if message.type == "system":
             if i != 0:
                 raise ValueError("System message must be at beginning of message list.")
-            if not isinstance(message.content, str):
-                raise ValueError(
-                    "System message must be a string, "
-                    f"instead was: {type(message.content)}"
-                )
-            system = message.content
+            if isinstance(message.content, str):
+                system = message.content
+            else:
+                system = _format_anthropic_system_blocks(message.content)
             continue
 
         role = _message_type_lookups[message.type]
@@ -307,15 +396,23 @@ def _format_anthropic_messages(
                                 _lc_tool_calls_to_anthropic_tool_use_blocks(overlapping)
                             )
                         else:
-                            item.pop("text", None)
-                            content.append(item)
+                            content.append(
+                                {k: v for k, v in item.items() if k != "text"}
+                            )
                     elif item["type"] == "text":
                         text = item.get("text", "")
                         # Only add non-empty strings for now as empty ones are not
                         # accepted.
                         # https://github.com/anthropics/anthropic-sdk-python/issues/461
                         if text.strip():
-                            content.append({"type": "text", "text": text})
+                            text_block = {"type": "text", "text": text}
+                            if "cache_control" in item:
+                                text_block["cache_control"] = item["cache_control"]
+                            content.append(text_block)
+                    elif item["type"] == "cache_point":
+                        # Converse style cache point, marks the preceding block
+                        if content:
+                            content[-1] = {**content[-1], "cache_control": _EPHEMERAL}
                     else:
                         content.append(item)
                 else:
@@ -372,7 +469,7 @@ class ChatPromptAdapter:
     @classmethod
     def format_messages(
         cls, provider: str, messages: List[BaseMessage]
-    ) -> Tuple[Optional[str], List[Dict]]:
+    ) -> Tuple[Optional[Union[str, List[Dict]]], List[Dict]]:
         if provider == "anthropic":
             return _format_anthropic_messages(messages)
 
@@ -393,10 +490,24 @@ class ChatBedrock(BaseChatModel, BedrockBase):
     """A chat model that uses the Bedrock API."""
 
     system_prompt_with_tools: str = ""
+
+    prompt_caching: bool = False
+    """Whether to place prompt cache breakpoints automatically on Anthropic models,
+    after the tools, the system prompt and the last message once the prompt up to
+    them reaches `prompt_cache_min_tokens`. Requests that already contain a
+    ``cache_control`` block are left as they are."""
+
+    prompt_cache_min_tokens: int = 1024
+    """Estimated number of prompt tokens below which no cache breakpoint is
+    placed."""
+
     beta_use_converse_api: bool = False
     """Use the new Bedrock ``converse`` API which provides a standardized interface to 
     all Bedrock models. Support still in beta. See ChatBedrockConverse docs for more."""
 
+    _converse: Optional[ChatBedrockConverse] = PrivateAttr(default=None)
+    _converse_params: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
     @property
     def _llm_type(self) -> str:
         """Return type of chat model."""
@@ -473,10 +584,16 @@ class ChatBedrock(BaseChatModel, BedrockBase):
                 provider, messages
             )
             if self.system_prompt_with_tools:
-                if system:
-                    system = self.system_prompt_with_tools + f"\n{system}"
-                else:
-                    system = self.system_prompt_with_tools
+                system = _prepend_system_prompt(self.system_prompt_with_tools, system)
+            if self.prompt_caching:
+                system, formatted_messages, tools = _add_anthropic_cache_control(
+                    system,
+                    formatted_messages,
+                    kwargs.get("tools"),
+                    self.prompt_cache_min_tokens,
+                )
+                if tools:
+                    kwargs["tools"] = tools
         else:
             prompt = ChatPromptAdapter.convert_messages_to_prompt(
                 provider=provider, messages=messages, model=self._get_model()
@@ -561,10 +678,18 @@ class ChatBedrock(BaseChatModel, BedrockBase):
                 )
                 # use tools the new way with claude 3
                 if self.system_prompt_with_tools:
-                    if system:
-                        system = self.system_prompt_with_tools + f"\n{system}"
-                    else:
-                        system = self.system_prompt_with_tools
+                    system = _prepend_system_prompt(
+                        self.system_prompt_with_tools, system
+                    )
+                if self.prompt_caching:
+                    system, formatted_messages, tools = _add_anthropic_cache_control(
+                        system,
+                        formatted_messages,
+                        params.get("tools"),
+                        self.prompt_cache_min_tokens,
+                    )
+                    if tools:
+                        params["tools"] = tools
             else:
                 prompt = ChatPromptAdapter.convert_messages_to_prompt(
                     provider=provider, messages=messages, model=self._get_model()
@@ -583,13 +708,20 @@ class ChatBedrock(BaseChatModel, BedrockBase):
             )
         # usage metadata
         if usage := llm_output.get("usage"):
-            input_tokens = usage.get("prompt_tokens", 0)
+            cache_read = usage.get("cache_read_input_tokens", 0)
+            cache_write = usage.get("cache_write_input_tokens", 0)
+            input_tokens = usage.get("prompt_tokens", 0) + cache_read + cache_write
             output_tokens = usage.get("completion_tokens", 0)
             usage_metadata = UsageMetadata(
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
-                total_tokens=usage.get("total_tokens", input_tokens + output_tokens),
+                total_tokens=input_tokens + output_tokens,
             )
+            if cache_read or cache_write:
+                usage_metadata["input_token_details"] = {
+                    "cache_read": cache_read,
+                    "cache_creation": cache_write,
+                }
         else:
             usage_metadata = None
         logger.info(f"The message received from Bedrock: {completion}")
@@ -867,16 +999,31 @@ class ChatBedrock(BaseChatModel, BedrockBase):
             kwargs["max_tokens"] = self.max_tokens
         if self.temperature is not None:
             kwargs["temperature"] = self.temperature
-        return ChatBedrockConverse(
+        params = dict(
             model=self.model_id,
+            client=self.client,
             region_name=self.region_name,
             credentials_profile_name=self.credentials_profile_name,
             aws_access_key_id=self.aws_access_key_id,
             aws_secret_access_key=self.aws_secret_access_key,
             aws_session_token=self.aws_session_token,
             config=self.config,
+            region_pool=self.region_pool,
+            prompt_caching=self.prompt_caching,
+            prompt_cache_min_tokens=self.prompt_cache_min_tokens,
             provider=self.provider or "",
             base_url=self.endpoint_url,
-            guardrail_config=(self.guardrails if self._guardrails_enabled else None),  # type: ignore[call-arg]
+            guardrail_config=(self.guardrails if self._guardrails_enabled else None),
             **kwargs,
         )
+        # Rebuild the delegate only when the fields it is built from have changed.
+        # The key keeps copies of the values, so that in-place edits of e.g.
+        # `guardrails` or `model_kwargs` count as changes; the client, config and
+        # region pool are compared by identity.
+        if self._converse is None or params != self._converse_params:
+            self._converse = ChatBedrockConverse(**params)
+            self._converse_params = {
+                k: v if k in ("client", "config", "region_pool") else copy.deepcopy(v)
+                for k, v in params.items()
+            }
+        return self._converse
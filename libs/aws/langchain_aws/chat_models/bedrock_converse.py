@@ -1,13 +1,24 @@
+import asyncio
 import base64
 import json
 import logging
 import os
+import queue
 import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from operator import itemgetter
 from typing import (
+    AbstractSet,
     Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Literal,
@@ -21,8 +32,10 @@ from typing import (
     cast,
 )
 
-import boto3
-from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
 from langchain_core.language_models import BaseChatModel, LanguageModelInput
 from langchain_core.language_models.chat_models import LangSmithParams
 from langchain_core.messages import (
@@ -53,7 +66,17 @@ from langchain_core.utils.pydantic import TypeBaseModel, is_basemodel_subclass
 from pydantic import BaseModel, ConfigDict, Field, SecretStr, model_validator
 from typing_extensions import Self
 
+from langchain_aws.clients import get_client
 from langchain_aws.function_calling import ToolsOutputParser
+from langchain_aws.hedging import HedgingPolicy
+from langchain_aws.instrumentation import instrument
+from langchain_aws.rate_limiters import (
+    acall_with_rate_limit,
+    call_with_rate_limit,
+    record_model_usage,
+)
+from langchain_aws.region_pool import RegionPool, call_with_region_pool
+from langchain_aws.streams import ResponseStreamGuard
 
 logger = logging.getLogger(__name__)
 _BM = TypeVar("_BM", bound=BaseModel)
@@ -250,6 +273,26 @@ class ChatBedrockConverse(BaseChatModel):
 
             {'input_tokens': 25, 'output_tokens': 11, 'total_tokens': 36}
 
+    Prompt caching:
+        .. code-block:: python
+
+            llm = ChatBedrockConverse(
+                model="anthropic.claude-3-7-sonnet-20250219-v1:0",
+                prompt_caching=True,
+            )
+            # Or mark cache points yourself
+            messages = [
+                SystemMessage([long_instructions, {"type": "cache_point"}]),
+                HumanMessage("..."),
+            ]
+            ai_msg = llm.invoke(messages)
+            ai_msg.usage_metadata
+
+        .. code-block:: python
+
+            {'input_tokens': 3512, 'output_tokens': 11, 'total_tokens': 3523,
+             'input_token_details': {'cache_read': 3490, 'cache_creation': 0}}
+
     Response metadata
         .. code-block:: python
 
@@ -272,6 +315,15 @@ class ChatBedrockConverse(BaseChatModel):
 
     client: Any = Field(default=None, exclude=True)  #: :meta private:
 
+    async_client: Any = Field(default=None, exclude=True)  #: :meta private:
+    """Optional asynchronous Bedrock runtime client, e.g. one created with
+    aiobotocore, whose `converse` and `converse_stream` are awaitable and whose
+    response stream supports `async for`.
+
+    When set, `ainvoke` and `astream` use it directly instead of running `client`
+    calls in a thread pool executor. The caller owns its lifecycle.
+    """
+
     model_id: str = Field(alias="model")
     """Id of the model to call.
     
@@ -369,6 +421,13 @@ class ChatBedrockConverse(BaseChatModel):
     config: Any = None
     """An optional botocore.config.Config instance to pass to the client."""
 
+    region_pool: Optional[RegionPool] = Field(default=None, exclude=True)
+    """Regions to balance calls over and fail over between on throttling, server
+    and connection errors. Calls then use the clients of the pool instead of
+    `client`, except for calls with `async_client`. See
+    `langchain_aws.region_pool.RegionPool`.
+    """
+
     guardrail_config: Optional[Dict[str, Any]] = Field(default=None, alias="guardrails")
     """Configuration information for a guardrail that you want to use in the request."""
 
@@ -410,6 +469,38 @@ class ChatBedrockConverse(BaseChatModel):
     request_metadata: Optional[Dict[str, str]] = None
     """Key-Value pairs that you can use to filter invocation logs."""
 
+    hedging_policy: Optional[HedgingPolicy] = Field(default=None, exclude=True)
+    """Policy for sending a duplicate of requests that are slower than usual.
+
+    When set, a `converse` or `converse_stream` request that has not returned
+    within the policy's latency percentile is sent again, optionally to another
+    region or inference profile, and the first response is used. See
+    `langchain_aws.hedging.HedgingPolicy`.
+    """
+
+    prompt_caching: bool = False
+    """Whether to place prompt cache points automatically.
+
+    Cache points are added after the tools, the system prompt and the last message
+    once the prompt up to them reaches `prompt_cache_min_tokens`, so that repeated
+    prefixes are read from the cache. Requests that already contain a cache point
+    are left as they are. Only some models support prompt caching."""
+
+    prompt_cache_min_tokens: int = 1024
+    """Estimated number of prompt tokens below which no cache point is placed,
+    since shorter prefixes are not cached by Bedrock."""
+
+    stream_coalesce_chars: int = 0
+    """Number of characters of consecutive text deltas to merge into one streamed
+    chunk. Text is also flushed after `stream_coalesce_interval` seconds, at the
+    end of its content block and before any other event. 0 streams every delta as
+    its own chunk."""
+
+    stream_coalesce_interval: float = 0.05
+    """Maximum seconds text deltas are held back when `stream_coalesce_chars` is
+    set. Buffered text is flushed once this much time has passed since its first
+    delta, even if the model pauses and no further event arrives."""
+
     model_config = ConfigDict(
         extra="forbid",
         populate_by_name=True,
@@ -460,7 +551,7 @@ class ChatBedrockConverse(BaseChatModel):
                 "aws_session_token": self.aws_session_token,
             }
             if creds["aws_access_key_id"] and creds["aws_secret_access_key"]:
-                session_params = {
+                session_params: Dict[str, Any] = {
                     k: v.get_secret_value() for k, v in creds.items() if v
                 }
             elif any(creds.values()):
@@ -471,27 +562,22 @@ class ChatBedrockConverse(BaseChatModel):
                     f"{(k for k, v in creds.items() if v)}."
                 )
             elif self.credentials_profile_name is not None:
-                session_params = {"profile_name": self.credentials_profile_name}
+                session_params = {
+                    "credentials_profile_name": self.credentials_profile_name
+                }
             else:
                 # use default credentials
                 session_params = {}
 
             try:
-                session = boto3.Session(**session_params)
-
-                self.region_name = (
-                    self.region_name
-                    or os.getenv("AWS_DEFAULT_REGION")
-                    or session.region_name
+                self.client = get_client(
+                    "bedrock-runtime",
+                    region_name=self.region_name or os.getenv("AWS_DEFAULT_REGION"),
+                    endpoint_url=self.endpoint_url,
+                    config=self.config,
+                    **session_params,
                 )
-
-                client_params = {
-                    "endpoint_url": self.endpoint_url,
-                    "config": self.config,
-                    "region_name": self.region_name,
-                }
-                client_params = {k: v for k, v in client_params.items() if v}
-                self.client = session.client("bedrock-runtime", **client_params)
+                self.region_name = self.client.meta.region_name
             except ValueError as e:
                 raise ValueError(f"Error raised by bedrock service:\n\n{e}") from e
             except Exception as e:
@@ -511,20 +597,27 @@ class ChatBedrockConverse(BaseChatModel):
         **kwargs: Any,
     ) -> ChatResult:
         """Top Level call"""
-        logger.info(f"The input message: {messages}")
-        bedrock_messages, system = _messages_to_bedrock(messages)
-        logger.debug(f"input message to bedrock: {bedrock_messages}")
-        logger.debug(f"System message to bedrock: {system}")
-        params = self._converse_params(
-            stop=stop, **_snake_to_camel_keys(kwargs, excluded_keys={"inputSchema"})
-        )
-        logger.debug(f"Input params: {params}")
-        logger.info("Using Bedrock Converse API to generate response")
-        response = self.client.converse(
-            messages=bedrock_messages, system=system, **params
-        )
-        logger.debug(f"Response from Bedrock: {response}")
-        response_message = _parse_response(response)
+        with instrument(self, self.model_id, "converse") as call:
+            logger.info("The input message: %s", messages)
+            bedrock_messages, system = _messages_to_bedrock(messages)
+            logger.debug("input message to bedrock: %s", bedrock_messages)
+            logger.debug("System message to bedrock: %s", system)
+            params = self._converse_params(
+                stop=stop, **_snake_to_camel_keys(kwargs, excluded_keys={"inputSchema"})
+            )
+            if self.prompt_caching:
+                bedrock_messages, system, params = _add_cache_points(
+                    bedrock_messages, system, params, self.prompt_cache_min_tokens
+                )
+            logger.debug("Input params: %s", params)
+            logger.info("Using Bedrock Converse API to generate response")
+            with call.request():
+                response = self._call_converse(
+                    "converse", messages=bedrock_messages, system=system, **params
+                )
+            call.record_response(response)
+            logger.debug("Response from Bedrock: %s", response)
+            response_message = _parse_response(response)
         return ChatResult(generations=[ChatGeneration(message=response_message)])
 
     def _stream(
@@ -534,18 +627,121 @@ class ChatBedrockConverse(BaseChatModel):
         run_manager: Optional[CallbackManagerForLLMRun] = None,
         **kwargs: Any,
     ) -> Iterator[ChatGenerationChunk]:
-        bedrock_messages, system = _messages_to_bedrock(messages)
-        params = self._converse_params(
-            stop=stop, **_snake_to_camel_keys(kwargs, excluded_keys={"inputSchema"})
-        )
-        response = self.client.converse_stream(
-            messages=bedrock_messages, system=system, **params
-        )
-        for event in response["stream"]:
-            if message_chunk := _parse_stream_event(event):
-                yield ChatGenerationChunk(message=message_chunk)
+        with instrument(self, self.model_id, "converse_stream") as call:
+            bedrock_messages, system = _messages_to_bedrock(messages)
+            params = self._converse_params(
+                stop=stop, **_snake_to_camel_keys(kwargs, excluded_keys={"inputSchema"})
+            )
+            if self.prompt_caching:
+                bedrock_messages, system, params = _add_cache_points(
+                    bedrock_messages, system, params, self.prompt_cache_min_tokens
+                )
+            with call.request():
+                response = self._call_converse(
+                    "converse_stream",
+                    messages=bedrock_messages,
+                    system=system,
+                    **params,
+                )
+            with ResponseStreamGuard(response["stream"], self.max_tokens) as guard:
+                coalescer = _TextDeltaCoalescer(
+                    self.stream_coalesce_chars, self.stream_coalesce_interval
+                )
+                for event in _iter_events_with_flushes(response["stream"], coalescer):
+                    if event is None:
+                        for message_chunk in coalescer.flush():
+                            yield ChatGenerationChunk(message=message_chunk)
+                        continue
+                    _record_stream_event(call, event, params["modelId"])
+                    guard.chunks_read += 1
+                    for message_chunk in coalescer.feed(event):
+                        yield ChatGenerationChunk(message=message_chunk)
+                for message_chunk in coalescer.flush():
+                    yield ChatGenerationChunk(message=message_chunk)
+                guard.finish()
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.async_client is None:
+            return await super()._agenerate(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
 
-    # TODO: Add async support once there are async bedrock.converse methods.
+        with instrument(self, self.model_id, "converse") as call:
+            bedrock_messages, system = _messages_to_bedrock(messages)
+            params = self._converse_params(
+                stop=stop, **_snake_to_camel_keys(kwargs, excluded_keys={"inputSchema"})
+            )
+            if self.prompt_caching:
+                bedrock_messages, system, params = _add_cache_points(
+                    bedrock_messages, system, params, self.prompt_cache_min_tokens
+                )
+            logger.debug("Input params: %s", params)
+            logger.info("Using Bedrock Converse API to generate response")
+            with call.request():
+                response = await self._acall_converse(
+                    "converse", messages=bedrock_messages, system=system, **params
+                )
+            call.record_response(response)
+            logger.debug("Response from Bedrock: %s", response)
+            response_message = _parse_response(response)
+        return ChatResult(generations=[ChatGeneration(message=response_message)])
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        if self.async_client is None:
+            async for chunk in super()._astream(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            ):
+                yield chunk
+            return
+
+        with instrument(self, self.model_id, "converse_stream") as call:
+            bedrock_messages, system = _messages_to_bedrock(messages)
+            params = self._converse_params(
+                stop=stop, **_snake_to_camel_keys(kwargs, excluded_keys={"inputSchema"})
+            )
+            if self.prompt_caching:
+                bedrock_messages, system, params = _add_cache_points(
+                    bedrock_messages, system, params, self.prompt_cache_min_tokens
+                )
+            with call.request():
+                response = await self._acall_converse(
+                    "converse_stream",
+                    messages=bedrock_messages,
+                    system=system,
+                    **params,
+                )
+            async with ResponseStreamGuard(
+                response["stream"], self.max_tokens
+            ) as guard:
+                coalescer = _TextDeltaCoalescer(
+                    self.stream_coalesce_chars, self.stream_coalesce_interval
+                )
+                async for event in _aiter_events_with_flushes(
+                    response["stream"], coalescer
+                ):
+                    if event is None:
+                        for message_chunk in coalescer.flush():
+                            yield ChatGenerationChunk(message=message_chunk)
+                        continue
+                    _record_stream_event(call, event, params["modelId"])
+                    guard.chunks_read += 1
+                    for message_chunk in coalescer.feed(event):
+                        yield ChatGenerationChunk(message=message_chunk)
+                for message_chunk in coalescer.flush():
+                    yield ChatGenerationChunk(message=message_chunk)
+                guard.finish()
 
     def bind_tools(
         self,
@@ -630,6 +826,47 @@ class ChatBedrockConverse(BaseChatModel):
         else:
             return llm | output_parser
 
+    def _call_converse(self, method: str, **request: Any) -> Any:
+        """Call the Converse API ``method``, hedged if a hedging policy is set."""
+
+        def call(client: Any, model_id: str) -> Any:
+            def send(client: Any) -> Any:
+                return getattr(client, method)(**{**request, "modelId": model_id})
+
+            if client is self.client:
+                return call_with_rate_limit(
+                    model_id,
+                    lambda: call_with_region_pool(self.region_pool, client, send),
+                )
+            return call_with_rate_limit(model_id, lambda: send(client))
+
+        if self.hedging_policy is None:
+            return call(self.client, request["modelId"])
+        return self.hedging_policy.call(
+            call,
+            self.client,
+            request["modelId"],
+            discard=_close_stream if method == "converse_stream" else None,
+        )
+
+    async def _acall_converse(self, method: str, **request: Any) -> Any:
+        """Async version of `_call_converse`, calling the async client."""
+
+        def call(client: Any, model_id: str) -> Awaitable[Any]:
+            return acall_with_rate_limit(
+                model_id,
+                lambda: getattr(client, method)(**{**request, "modelId": model_id}),
+            )
+
+        if self.hedging_policy is None:
+            return await call(self.async_client, request["modelId"])
+        return await self.hedging_policy.acall(
+            call,
+            self.async_client,
+            request["modelId"],
+            discard=_close_stream if method == "converse_stream" else None,
+        )
+
     def _converse_params(
         self,
         *,
@@ -760,6 +997,98 @@ def _messages_to_bedrock(
     return bedrock_messages, bedrock_system
 
 
+def _usage_metadata(usage: Dict[str, Any]) -> UsageMetadata:
+    """Convert Converse token usage, in which input tokens exclude cached tokens."""
+    cache_read = usage.get("cacheReadInputTokens", 0)
+    cache_write = usage.get("cacheWriteInputTokens", 0)
+    input_tokens = usage["inputTokens"] + cache_read + cache_write
+    usage_metadata = UsageMetadata(
+        input_tokens=input_tokens,
+        output_tokens=usage["outputTokens"],
+        total_tokens=input_tokens + usage["outputTokens"],
+    )
+    if "cacheReadInputTokens" in usage or "cacheWriteInputTokens" in usage:
+        usage_metadata["input_token_details"] = {
+            "cache_read": cache_read,
+            "cache_creation": cache_write,
+        }
+    return usage_metadata
+
+
+def _cache_point() -> Dict[str, Any]:
+    return {"cachePoint": {"type": "default"}}
+
+
+def _has_cache_point(blocks: Sequence[Any]) -> bool:
+    return any(isinstance(block, dict) and "cachePoint" in block for block in blocks)
+
+
+def _estimate_tokens(obj: Any, limit: float) -> float:
+    """Roughly estimate the tokens of the text in ``obj``, four characters or bytes
+    per token. Stops counting once ``limit`` is reached."""
+    if isinstance(obj, (str, bytes)):
+        return len(obj) / 4
+    if isinstance(obj, dict):
+        values: Iterable = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        values = obj
+    else:
+        return 0
+    total = 0.0
+    for value in values:
+        total += _estimate_tokens(value, limit - total)
+        if total >= limit:
+            break
+    return total
+
+
+def _add_cache_points(
+    messages: List[Dict[str, Any]],
+    system: List[Dict[str, Any]],
+    params: Dict[str, Any],
+    min_tokens: int,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+    """Add cache points after the tools, system prompt and last message.
+
+    Tools come first in the prompt, then the system prompt, then the messages. A
+    cache point is placed at the end of each of them once the prompt up to there
+    is estimated at ``min_tokens`` or more. Nothing is added if the request
+    already has a cache point.
+    """
+    tools = params.get("toolConfig", {}).get("tools", [])
+    if (
+        _has_cache_point(tools)
+        or _has_cache_point(system)
+        or any(_has_cache_point(message["content"]) for message in messages)
+    ):
+        return messages, system, params
+
+    size = 0.0
+    if tools:
+        size += _estimate_tokens(tools, min_tokens)
+        if size >= min_tokens:
+            params = {
+                **params,
+                "toolConfig": {
+                    **params["toolConfig"],
+                    "tools": [*tools, _cache_point()],
+                },
+            }
+    if system:
+        size += _estimate_tokens(system, min_tokens)
+        if size >= min_tokens:
+            system = [*system, _cache_point()]
+    if messages:
+        size += _estimate_tokens(messages, min_tokens)
+        if size >= min_tokens:
+            last = messages[-1]
+            messages = [
+                *messages[:-1],
+                {**last, "content": [*last["content"], _cache_point()]},
+            ]
+    return messages, system, params
+
+
 def _extract_response_metadata(response: Dict[str, Any]) -> Dict[str, Any]:
     response_metadata = response
     # response_metadata only supports string, list or dict
@@ -772,7 +1101,7 @@ def _extract_response_metadata(response: Dict[str, Any]) -> Dict[str, Any]:
 def _parse_response(response: Dict[str, Any]) -> AIMessage:
     lc_content = _bedrock_to_lc(response.pop("output")["message"]["content"])
     tool_calls = _extract_tool_calls(lc_content)
-    usage = UsageMetadata(_camel_to_snake_keys(response.pop("usage")))  # type: ignore[misc]
+    usage = _usage_metadata(response.pop("usage"))
     return AIMessage(
         content=_str_if_single_text_block(lc_content),  # type: ignore[arg-type]
         usage_metadata=usage,
@@ -782,13 +1111,33 @@ def _parse_response(response: Dict[str, Any]) -> AIMessage:
 
 
 def _parse_stream_event(event: Dict[str, Any]) -> Optional[BaseMessageChunk]:
-    if "messageStart" in event:
-        # TODO: needed?
-        return (
-            AIMessageChunk(content=[])
-            if event["messageStart"]["role"] == "assistant"
-            else HumanMessageChunk(content=[])
-        )
+    """Convert a `converse_stream` event to a message chunk.
+
+    Returns None for events that carry nothing to merge into the message, i.e. the
+    start of an assistant message and the end of a content block.
+    """
+    if "contentBlockDelta" in event:
+        # Most events are deltas, which skip the generic block conversion.
+        delta = event["contentBlockDelta"]
+        index = delta["contentBlockIndex"]
+        if "text" in delta["delta"]:
+            return _text_delta_chunk(delta["delta"]["text"], index)
+        if "toolUse" in delta["delta"]:
+            args = delta["delta"]["toolUse"].get("input")
+            return AIMessageChunk(
+                content=[
+                    {"type": "tool_use", "input": args, "id": None, "index": index}
+                ],
+                tool_call_chunks=[
+                    tool_call_chunk(name=None, id=None, args=args, index=index)
+                ],
+            )
+        block = {**_bedrock_to_lc([delta["delta"]])[0], "index": index}
+        return AIMessageChunk(content=[block])
+    elif "messageStart" in event:
+        if event["messageStart"]["role"] == "assistant":
+            return None
+        return HumanMessageChunk(content=[])
     elif "contentBlockStart" in event:
         block = {
             **_bedrock_to_lc([event["contentBlockStart"]["start"]])[0],
@@ -805,32 +1154,13 @@ def _parse_stream_event(event: Dict[str, Any]) -> Optional[BaseMessageChunk]:
                 )
             )
         return AIMessageChunk(content=[block], tool_call_chunks=tool_call_chunks)
-    elif "contentBlockDelta" in event:
-        block = {
-            **_bedrock_to_lc([event["contentBlockDelta"]["delta"]])[0],
-            "index": event["contentBlockDelta"]["contentBlockIndex"],
-        }
-        tool_call_chunks = []
-        if block["type"] == "tool_use":
-            tool_call_chunks.append(
-                tool_call_chunk(
-                    name=block.get("name"),
-                    id=block.get("id"),
-                    args=block.get("input"),
-                    index=event["contentBlockDelta"]["contentBlockIndex"],
-                )
-            )
-        return AIMessageChunk(content=[block], tool_call_chunks=tool_call_chunks)
     elif "contentBlockStop" in event:
-        # TODO: needed?
-        return AIMessageChunk(
-            content=[{"index": event["contentBlockStop"]["contentBlockIndex"]}]
-        )
+        return None
     elif "messageStop" in event:
         # TODO: snake case response metadata?
         return AIMessageChunk(content=[], response_metadata=event["messageStop"])
     elif "metadata" in event:
-        usage = UsageMetadata(_camel_to_snake_keys(event["metadata"].pop("usage")))  # type: ignore[misc]
+        usage = _usage_metadata(event["metadata"].pop("usage"))
         return AIMessageChunk(
             content=[], response_metadata=event["metadata"], usage_metadata=usage
         )
@@ -849,7 +1179,7 @@ def _lc_content_to_bedrock(
     if isinstance(content, str):
         content = [{"text": content}]
     bedrock_content: List[Dict[str, Any]] = []
-    for block in _snake_to_camel_keys(content):
+    for block in _snake_to_camel_keys(content, excluded_keys=_OPAQUE_KEYS):
         if isinstance(block, str):
             bedrock_content.append({"text": block})
         # Assume block is already in bedrock format.
@@ -866,9 +1196,7 @@ def _lc_content_to_bedrock(
                     {
                         "image": {
                             "format": block["source"]["mediaType"].split("/")[1],
-                            "source": {
-                                "bytes": _b64str_to_bytes(block["source"]["data"])
-                            },
+                            "source": {"bytes": _media_bytes(block["source"]["data"])},
                         }
                     }
                 )
@@ -888,7 +1216,7 @@ def _lc_content_to_bedrock(
                             "video": {
                                 "format": block["source"]["mediaType"].split("/")[1],
                                 "source": {
-                                    "bytes": _b64str_to_bytes(block["source"]["data"])
+                                    "bytes": _media_bytes(block["source"]["data"])
                                 },
                             }
                         }
@@ -935,15 +1263,20 @@ def _lc_content_to_bedrock(
             bedrock_content.append({"json": block["json"]})
         elif block["type"] == "guard_content":
             bedrock_content.append({"guardContent": {"text": {"text": block["text"]}}})
+        elif block["type"] == "cache_point":
+            bedrock_content.append(_cache_point())
         else:
             raise ValueError(f"Unsupported content block type:\n{block}")
+        # Anthropic style cache breakpoint on the block
+        if isinstance(block, dict) and block.get("cacheControl"):
+            bedrock_content.append(_cache_point())
     # drop empty text blocks
     return [block for block in bedrock_content if block.get("text", True)]
 
 
 def _bedrock_to_lc(content: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     lc_content = []
-    for block in _camel_to_snake_keys(content):
+    for block in _camel_to_snake_keys(content, excluded_keys=_OPAQUE_KEYS):
         if "text" in block:
             lc_content.append({"type": "text", "text": block["text"]})
         elif "tool_use" in block:
@@ -1019,12 +1352,168 @@ def _bedrock_to_lc(content: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return lc_content
 
 
+def _text_delta_chunk(text: str, index: int) -> AIMessageChunk:
+    return AIMessageChunk(content=[{"type": "text", "text": text, "index": index}])
+
+
+class _TextDeltaCoalescer:
+    """Merges consecutive text deltas of a content block into fewer chunks.
+
+    Deltas are buffered as plain strings and turned into one message chunk once
+    ``max_chars`` characters or ``max_delay`` seconds are reached, or when any other
+    event arrives. With ``max_chars`` 0 every event is converted on its own. The
+    stream is read with `_iter_events_with_flushes` or `_aiter_events_with_flushes`
+    so that buffered text is also flushed when ``max_delay`` passes while the
+    model pauses.
+    """
+
+    def __init__(self, max_chars: int, max_delay: float) -> None:
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self._texts: List[str] = []
+        self._size = 0
+        self._index = 0
+        self._started = 0.0
+
+    def feed(self, event: Dict[str, Any]) -> List[BaseMessageChunk]:
+        """Return the chunks to emit after ``event``."""
+        delta = event.get("contentBlockDelta")
+        if not self.max_chars or delta is None or "text" not in delta["delta"]:
+            chunks = self.flush()
+            if (message_chunk := _parse_stream_event(event)) is not None:
+                chunks.append(message_chunk)
+            return chunks
+
+        chunks = []
+        if self._texts and delta["contentBlockIndex"] != self._index:
+            chunks = self.flush()
+        if not self._texts:
+            self._index = delta["contentBlockIndex"]
+            self._started = time.monotonic()
+        text = delta["delta"]["text"]
+        self._texts.append(text)
+        self._size += len(text)
+        if (
+            self._size >= self.max_chars
+            or time.monotonic() - self._started >= self.max_delay
+        ):
+            chunks.extend(self.flush())
+        return chunks
+
+    def flush_due_in(self) -> Optional[float]:
+        """Seconds until the buffered text is due, or None if nothing is buffered."""
+        if not self._texts:
+            return None
+        return max(0.0, self._started + self.max_delay - time.monotonic())
+
+    def flush(self) -> List[BaseMessageChunk]:
+        """Return the buffered text as a chunk, if any."""
+        if not self._texts:
+            return []
+        message_chunk = _text_delta_chunk("".join(self._texts), self._index)
+        self._texts = []
+        self._size = 0
+        return [message_chunk]
+
+
+_STREAM_END = object()
+
+
+def _iter_events_with_flushes(
+    events: Iterable[Dict[str, Any]], coalescer: _TextDeltaCoalescer
+) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield the events of a stream, and None whenever the coalescer's buffered
+    text becomes due while the next event has not arrived yet.
+
+    Reading blocks, so when coalescing, events are read on a separate thread and
+    waited for no longer than the buffered text may be held back.
+    """
+    if not coalescer.max_chars:
+        yield from events
+        return
+
+    items: queue.Queue = queue.Queue()
+    stopped = threading.Event()
+
+    def read() -> None:
+        try:
+            for event in events:
+                if stopped.is_set():
+                    return
+                items.put((event, None))
+        except Exception as e:
+            items.put((_STREAM_END, e))
+        else:
+            items.put((_STREAM_END, None))
+
+    threading.Thread(target=read, name="bedrock-stream", daemon=True).start()
+    try:
+        while True:
+            try:
+                event, error = items.get(timeout=coalescer.flush_due_in())
+            except queue.Empty:
+                yield None
+                continue
+            if event is _STREAM_END:
+                if error is not None:
+                    raise error
+                return
+            yield event
+    finally:
+        stopped.set()
+
+
+async def _aiter_events_with_flushes(
+    events: AsyncIterable[Dict[str, Any]], coalescer: _TextDeltaCoalescer
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """Async version of `_iter_events_with_flushes`."""
+    iterator = events.__aiter__()
+    next_event: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(iterator.__anext__())
+            timeout = coalescer.flush_due_in() if coalescer.max_chars else None
+            if timeout is not None:
+                done, _ = await asyncio.wait({next_event}, timeout=timeout)
+                if not done:
+                    yield None
+                    continue
+            try:
+                event = await next_event
+            except StopAsyncIteration:
+                return
+            finally:
+                next_event = None
+            yield event
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+
+
+def _record_stream_event(call: Any, event: Dict[str, Any], model_id: str) -> None:
+    """Record a streamed content delta, or the token usage of the metadata event
+    and charge it to the model's rate limiter."""
+    if "contentBlockDelta" in event:
+        call.chunk_received()
+    elif "metadata" in event:
+        call.record_response(event["metadata"])
+        usage = event["metadata"].get("usage") or {}
+        record_model_usage(model_id, usage.get("totalTokens", 0))
+
+
+def _close_stream(response: Dict[str, Any]) -> Any:
+    """Close the stream of a `converse_stream` response that will not be read."""
+    close = getattr(response.get("stream"), "close", None)
+    return close() if close is not None else None
+
+
 def _format_tools(
     tools: Sequence[Union[Dict[str, Any], TypeBaseModel, Callable, BaseTool],],
 ) -> List[Dict[Literal["toolSpec"], Dict[str, Union[Dict[str, Any], str]]]]:
     formatted_tools: List = []
     for tool in tools:
-        if isinstance(tool, dict) and "toolSpec" in tool:
+        if isinstance(tool, dict) and ("toolSpec" in tool or "cachePoint" in tool):
             formatted_tools.append(tool)
         else:
             spec = convert_to_openai_tool(tool)["function"]
@@ -1056,31 +1545,47 @@ def _extract_tool_calls(anthropic_content: List[dict]) -> List[ToolCall]:
     return tool_calls
 
 
+# Keys whose values are user data, e.g. tool arguments, rather than Converse
+# structures. Their values are passed through without converting their keys.
+_OPAQUE_KEYS = frozenset({"input", "json"})
+
+_CAMEL_TO_SNAKE_PATTERN = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+
+@lru_cache(maxsize=1024)
 def _snake_to_camel(text: str) -> str:
     split = text.split("_")
     return "".join(split[:1] + [s.title() for s in split[1:]])
 
 
+@lru_cache(maxsize=1024)
 def _camel_to_snake(text: str) -> str:
-    pattern = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
-    return pattern.sub("_", text).lower()
+    return _CAMEL_TO_SNAKE_PATTERN.sub("_", text).lower()
 
 
 _T = TypeVar("_T")
 
 
-def _camel_to_snake_keys(obj: _T) -> _T:
+def _camel_to_snake_keys(obj: _T, excluded_keys: AbstractSet[str] = frozenset()) -> _T:
     if isinstance(obj, list):
-        return cast(_T, [_camel_to_snake_keys(e) for e in obj])
-    elif isinstance(obj, dict):
         return cast(
-            _T, {_camel_to_snake(k): _camel_to_snake_keys(v) for k, v in obj.items()}
+            _T, [_camel_to_snake_keys(e, excluded_keys=excluded_keys) for e in obj]
         )
+    elif isinstance(obj, dict):
+        _dict = {}
+        for k, v in obj.items():
+            if k in excluded_keys:
+                _dict[k] = v
+            else:
+                _dict[_camel_to_snake(k)] = _camel_to_snake_keys(
+                    v, excluded_keys=excluded_keys
+                )
+        return cast(_T, _dict)
     else:
         return obj
 
 
-def _snake_to_camel_keys(obj: _T, excluded_keys: set = set()) -> _T:
+def _snake_to_camel_keys(obj: _T, excluded_keys: AbstractSet[str] = frozenset()) -> _T:
     if isinstance(obj, list):
         return cast(
             _T, [_snake_to_camel_keys(e, excluded_keys=excluded_keys) for e in obj]
@@ -1107,12 +1612,68 @@ def _drop_none(obj: Any) -> Any:
         return obj
 
 
+class _MediaCache:
+    """Bounded LRU of base64 conversions of media, keyed by the converted value.
+
+    The whole conversation is converted again on every turn, so without it the
+    same images and videos would be encoded or decoded again each time. str and
+    bytes objects cache their hash, so looking up a value that a message already
+    holds does not read it again.
+    """
+
+    def __init__(self, max_bytes: int, min_size: int) -> None:
+        self.max_bytes = max_bytes
+        self.min_size = min_size
+        self._entries: OrderedDict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, value: Union[str, bytes], convert: Callable[[Any], Any]) -> Any:
+        """Return ``convert(value)``, reusing the result of an earlier call."""
+        if not self.min_size <= len(value) <= self.max_bytes // 2:
+            return convert(value)
+        key = (type(value), value)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        converted = convert(value)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = converted
+                self._size += len(value) + len(converted)
+                while self._size > self.max_bytes:
+                    (_, evicted), result = self._entries.popitem(last=False)
+                    self._size -= len(evicted) + len(result)
+        return converted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_media_cache = _MediaCache(max_bytes=64 * 1024 * 1024, min_size=1024)
+
+
 def _b64str_to_bytes(base64_str: str) -> bytes:
-    return base64.b64decode(base64_str.encode("utf-8"))
+    return _media_cache.get(
+        base64_str, lambda data: base64.b64decode(data.encode("utf-8"))
+    )
 
 
 def _bytes_to_b64_str(bytes_: bytes) -> str:
-    return base64.b64encode(bytes_).decode("utf-8")
+    return _media_cache.get(bytes_, lambda data: base64.b64encode(data).decode("utf-8"))
+
+
+def _media_bytes(data: Union[str, bytes, bytearray, memoryview]) -> bytes:
+    """Bytes of the ``data`` of a media source, either base64 or raw bytes."""
+    if isinstance(data, str):
+        return _b64str_to_bytes(data)
+    if isinstance(data, memoryview):
+        # botocore only accepts bytes, bytearray and file-like blobs
+        return data.tobytes()
+    return data  # type: ignore[return-value]
 
 
 def _str_if_single_text_block(
@@ -1158,16 +1719,17 @@ def _format_openai_image_url(image_url: str) -> Dict:
 
     And throws an error if url is not a b64 image.
     """
-    regex = r"^data:image/(?P<media_type>.+);base64,(?P<data>.+)$"
-    match = re.match(regex, image_url)
-    if match is None:
+    # Split instead of matching a regex over the whole, often large, data URL
+    header, _, data = image_url.partition(";base64,")
+    media_type = header[len("data:image/") :]
+    if not header.startswith("data:image/") or not media_type or not data:
         raise ValueError(
             "The image URL provided is not supported. Expected image URL format is "
             "base64-encoded images. Example: data:image/png;base64,'/9j/4AAQSk'..."
         )
     return {
-        "format": match.group("media_type"),
-        "source": {"bytes": _b64str_to_bytes(match.group("data"))},
+        "format": media_type,
+        "source": {"bytes": _b64str_to_bytes(data)},
     }
 
 
@@ -1178,14 +1740,15 @@ def _format_openai_video_url(video_url: str) -> Dict:
 
     And throws an error if url is not a b64 video.
     """
-    regex = r"^data:video/(?P<media_type>.+);base64,(?P<data>.+)$"
-    match = re.match(regex, video_url)
-    if match is None:
+    # Split instead of matching a regex over the whole, often large, data URL
+    header, _, data = video_url.partition(";base64,")
+    media_type = header[len("data:video/") :]
+    if not header.startswith("data:video/") or not media_type or not data:
         raise ValueError(
             "The video URL provided is not supported. Expected video URL format is "
             "base64-encoded video. Example: data:video/mp4;base64,'/9j/4AAQSk'..."
         )
     return {
-        "format": match.group("media_type"),
-        "source": {"bytes": _b64str_to_bytes(match.group("data"))},
+        "format": media_type,
+        "source": {"bytes": _b64str_to_bytes(data)},
     }
@@ -0,0 +1,193 @@
+"""Process-wide pool of boto3 sessions and clients.
+
+Creating a boto3 session resolves credentials, and every client owns its own
+connection pool, so building them per model instance is slow and forfeits
+connection reuse. The models, embeddings, retrievers and document compressors in
+this package get their clients from `get_client`, which shares one client per
+service, region, credentials, endpoint and configuration.
+
+Example:
+    .. code-block:: python
+
+        from langchain_aws.clients import set_max_pool_connections
+
+        # Allow up to 50 concurrent connections per shared client.
+        set_max_pool_connections(50)
+"""
+
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+# botocore's default connection pool size.
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+_max_pool_connections = DEFAULT_MAX_POOL_CONNECTIONS
+_sessions: Dict[Tuple, Any] = {}
+_clients: Dict[Tuple, Any] = {}
+# Held while looking up or inserting entries, never while creating them
+_lock = threading.Lock()
+# One lock per key being created, so a slow creation only blocks its own key
+_creation_locks: Dict[Tuple, threading.Lock] = {}
+
+
+def set_max_pool_connections(max_pool_connections: int) -> None:
+    """Set the connection pool size of shared clients created without a config.
+
+    Only clients created after the call are affected.
+    """
+    global _max_pool_connections
+    if max_pool_connections < 1:
+        raise ValueError(
+            f"max_pool_connections must be positive, got {max_pool_connections}."
+        )
+    _max_pool_connections = max_pool_connections
+
+
+def clear_clients() -> None:
+    """Drop all shared sessions and clients, e.g. after credentials change."""
+    with _lock:
+        _sessions.clear()
+        _clients.clear()
+        _creation_locks.clear()
+
+
+def _config_key(config: Any) -> Optional[str]:
+    """Hashable representation of the options of a botocore ``Config``."""
+    if config is None:
+        return None
+    return repr(
+        [(option, getattr(config, option, None)) for option in Config.OPTION_DEFAULTS]
+    )
+
+
+def _get_or_create(
+    cache: Dict[Tuple, Any], key: Tuple, create: Callable[[], Any]
+) -> Any:
+    """Return ``cache[key]``, calling ``create`` for it at most once."""
+    with _lock:
+        if key in cache:
+            return cache[key]
+        creation_lock = _creation_locks.setdefault(key, threading.Lock())
+    with creation_lock:
+        with _lock:
+            if key in cache:
+                return cache[key]
+        value = create()
+        with _lock:
+            cache[key] = value
+            _creation_locks.pop(key, None)
+        return value
+
+
+def _session_params(
+    credentials_profile_name: Optional[str],
+    aws_access_key_id: Optional[str],
+    aws_secret_access_key: Optional[str],
+    aws_session_token: Optional[str],
+) -> Dict[str, str]:
+    session_params = {
+        "profile_name": credentials_profile_name,
+        "aws_access_key_id": aws_access_key_id,
+        "aws_secret_access_key": aws_secret_access_key,
+        "aws_session_token": aws_session_token,
+    }
+    return {k: v for k, v in session_params.items() if v}
+
+
+def _session_key(session_params: Dict[str, Any]) -> Tuple:
+    # Credentials are hashed so the pool does not hold them in its keys.
+    return tuple(
+        (k, hashlib.sha256(str(v).encode()).hexdigest())
+        for k, v in sorted(session_params.items())
+    )
+
+
+def get_session(
+    credentials_profile_name: Optional[str] = None,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    aws_session_token: Optional[str] = None,
+) -> Any:
+    """Return the shared boto3 session for a profile or explicit credentials.
+
+    Without arguments, the session uses the default credential chain.
+    """
+    session_params = _session_params(
+        credentials_profile_name,
+        aws_access_key_id,
+        aws_secret_access_key,
+        aws_session_token,
+    )
+    return _get_or_create(
+        _sessions,
+        ("session", _session_key(session_params)),
+        lambda: boto3.Session(**session_params),
+    )
+
+
+def get_client(
+    service_name: str,
+    *,
+    region_name: Optional[str] = None,
+    credentials_profile_name: Optional[str] = None,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    aws_session_token: Optional[str] = None,
+    endpoint_url: Optional[str] = None,
+    config: Any = None,
+    max_pool_connections: Optional[int] = None,
+) -> Any:
+    """Return a shared boto3 client, creating it on first use.
+
+    Args:
+        service_name: The AWS service, e.g. "bedrock-runtime".
+        region_name: The AWS region. Defaults to the session's region.
+        credentials_profile_name: The profile to load credentials from.
+        aws_access_key_id: Explicit AWS access key id.
+        aws_secret_access_key: Explicit AWS secret access key.
+        aws_session_token: Explicit AWS session token.
+        endpoint_url: Alternative endpoint URL for the service.
+        config: A botocore ``Config``. Used as-is when given.
+        max_pool_connections: Minimum connection pool size when no ``config`` is
+            given. The pool is never smaller than the size set with
+            `set_max_pool_connections`.
+    """
+    session = get_session(
+        credentials_profile_name,
+        aws_access_key_id,
+        aws_secret_access_key,
+        aws_session_token,
+    )
+    region_name = region_name or session.region_name
+    if config is None:
+        config = Config(
+            max_pool_connections=max(max_pool_connections or 0, _max_pool_connections)
+        )
+
+    key = (
+        service_name,
+        region_name,
+        _session_key(
+            _session_params(
+                credentials_profile_name,
+                aws_access_key_id,
+                aws_secret_access_key,
+                aws_session_token,
+            )
+        ),
+        endpoint_url,
+        _config_key(config),
+    )
+    client_params = {
+        "region_name": region_name,
+        "endpoint_url": endpoint_url,
+        "config": config,
+    }
+    client_params = {k: v for k, v in client_params.items() if v}
+    return _get_or_create(
+        _clients, key, lambda: session.client(service_name, **client_params)
+    )
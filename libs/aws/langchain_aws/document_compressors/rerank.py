@@ -1,13 +1,14 @@
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Sequence, Union
 
-import boto3
 from langchain_core.callbacks.manager import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
 from langchain_core.utils import from_env
 from pydantic import ConfigDict, Field, model_validator
 from typing_extensions import Self
 
+from langchain_aws.clients import get_client
+
 
 class BedrockRerank(BaseDocumentCompressor):
     """Document compressor that uses AWS Bedrock Rerank API."""
@@ -37,14 +38,10 @@ class BedrockRerank(BaseDocumentCompressor):
     def initialize_client(cls, values: Dict[str, Any]) -> Any:
         """Initialize the AWS Bedrock client."""
         if not values.get("client"):
-            session = (
-                boto3.Session(profile_name=values.get("credentials_profile_name"))
-                if values.get("credentials_profile_name", None)
-                else boto3.Session()
-            )
-            values["client"] = session.client(
+            values["client"] = get_client(
                 "bedrock-agent-runtime",
                 region_name=values.get("region_name"),
+                credentials_profile_name=values.get("credentials_profile_name"),
             )
         return values
 
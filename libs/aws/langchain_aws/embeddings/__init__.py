@@ -1,3 +1,13 @@
 from langchain_aws.embeddings.bedrock import BedrockEmbeddings
+from langchain_aws.embeddings.cache import (
+    InMemoryLRUEmbeddingStore,
+    MemmapEmbeddingStore,
+    TieredEmbeddingStore,
+)
 
-__all__ = ["BedrockEmbeddings"]
+__all__ = [
+    "BedrockEmbeddings",
+    "InMemoryLRUEmbeddingStore",
+    "MemmapEmbeddingStore",
+    "TieredEmbeddingStore",
+]
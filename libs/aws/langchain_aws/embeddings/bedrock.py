@@ -1,15 +1,103 @@
 import asyncio
+import hashlib
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import numpy as np
 from langchain_core.embeddings import Embeddings
-from langchain_core.runnables.config import run_in_executor
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from langchain_core.runnables.config import ContextThreadPoolExecutor, run_in_executor
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 from typing_extensions import Self
 
+from langchain_aws.instrumentation import instrument
+from langchain_aws.rate_limiters import acall_with_rate_limit, call_with_rate_limit
+from langchain_aws.region_pool import RegionPool, call_with_region_pool
+from langchain_aws.serializers import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Request limits of the Cohere embed models on Bedrock, see
+# https://docs.aws.amazon.com/bedrock/latest/userguide/model-parameters-embed.html
+COHERE_MAX_TEXTS_PER_REQUEST = 96
+COHERE_MAX_CHARACTERS_PER_REQUEST = COHERE_MAX_TEXTS_PER_REQUEST * 2048
+
+# Requests in flight in the async methods when `max_concurrency` is unset.
+_DEFAULT_ASYNC_CONCURRENCY = 16
+
+
+def _batch_texts(
+    texts: List[str], max_texts: int, max_characters: int
+) -> List[List[str]]:
+    """Pack texts, in order, into as few batches as the request limits allow.
+
+    A text that exceeds ``max_characters`` on its own is placed in a batch by itself.
+    """
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_characters = 0
+    for text in texts:
+        if batch and (
+            len(batch) == max_texts or batch_characters + len(text) > max_characters
+        ):
+            batches.append(batch)
+            batch, batch_characters = [], 0
+        batch.append(text)
+        batch_characters += len(text)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _float32_matrix(embeddings: List[List[float]]) -> np.ndarray:
+    """Stack embeddings into a contiguous ``(n, dim)`` float32 array."""
+    if not embeddings:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def _copy_cached(
+    embeddings: Sequence[Optional[List[float]]],
+) -> List[Optional[List[float]]]:
+    """Copy embeddings read from a cache, which may hand out its own lists, so
+    callers can mutate results without changing the cache."""
+    return [None if e is None else list(e) for e in embeddings]
+
+
+def _fan_out(embeddings: List[List[float]], positions: List[int]) -> List[List[float]]:
+    """Map embeddings of unique texts back to every input position.
+
+    Repeated positions get their own copy so callers can mutate results safely.
+    """
+    results = []
+    used = [False] * len(embeddings)
+    for position in positions:
+        embedding = embeddings[position]
+        results.append(list(embedding) if used[position] else embedding)
+        used[position] = True
+    return results
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale every row of ``matrix`` to unit length, in place."""
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix
+
 
 class BedrockEmbeddings(BaseModel, Embeddings):
     """Bedrock embedding models.
@@ -44,6 +132,13 @@ class BedrockEmbeddings(BaseModel, Embeddings):
 
     client: Any = Field(default=None, exclude=True)  #: :meta private:
     """Bedrock client."""
+    async_client: Any = Field(default=None, exclude=True)  #: :meta private:
+    """Optional asynchronous Bedrock runtime client, e.g. one created with
+    aiobotocore, whose `invoke_model` and response body `read` are awaitable.
+
+    When set, `aembed_query` and `aembed_documents` use it directly instead of
+    running `client` calls in a thread pool executor. The caller owns its lifecycle.
+    """
     region_name: Optional[str] = None
     """The aws region e.g., `us-west-2`. Fallsback to AWS_DEFAULT_REGION env variable
     or region specified in ~/.aws/config in case it is not provided here.
@@ -73,7 +168,41 @@ class BedrockEmbeddings(BaseModel, Embeddings):
     config: Any = None
     """An optional botocore.config.Config instance to pass to the client."""
 
+    region_pool: Optional[RegionPool] = Field(default=None, exclude=True)
+    """Regions to balance calls over and fail over between on throttling, server
+    and connection errors. Calls then use the clients of the pool instead of
+    `client`, except for calls with `async_client`. See
+    `langchain_aws.region_pool.RegionPool`.
+    """
+
+    cache: Any = Field(default=None, exclude=True)
+    """Optional store of previously computed embeddings.
+
+    Any `langchain_core.stores.BaseStore[str, List[float]]` can be used, e.g. the
+    `InMemoryLRUEmbeddingStore`, `MemmapEmbeddingStore` and `TieredEmbeddingStore`
+    from `langchain_aws.embeddings`. Entries are keyed by the model id, model kwargs,
+    `normalize` and a hash of the text; texts found in the cache are not sent to
+    Bedrock."""
+
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+    """Maximum number of concurrent requests sent to Bedrock in one call.
+
+    `embed_documents` issues requests from a thread pool that shares the one
+    Bedrock client, and `aembed_documents` keeps at most this many requests in
+    flight; results are returned in input order either way. When no `config` is
+    given, the shared client's connection pool is made at least this large.
+    When unset, `embed_documents` embeds texts one after another and
+    `aembed_documents` allows 16 requests in flight."""
+
+    deduplicate: bool = True
+    """Whether to embed texts that occur several times in one call only once.
+
+    The number of texts saved this way is reported by `deduplicated_texts`."""
+
+    _deduplicated_texts: int = PrivateAttr(default=0)
+
     model_config = ConfigDict(
+        arbitrary_types_allowed=True,
         extra="forbid",
         protected_namespaces=(),
     )
@@ -86,25 +215,16 @@ class BedrockEmbeddings(BaseModel, Embeddings):
             return self
 
         try:
-            import boto3
-
-            if self.credentials_profile_name is not None:
-                session = boto3.Session(profile_name=self.credentials_profile_name)
-            else:
-                # use default credentials
-                session = boto3.Session()
-
-            client_params = {}
-            if self.region_name:
-                client_params["region_name"] = self.region_name
-
-            if self.endpoint_url:
-                client_params["endpoint_url"] = self.endpoint_url
-
-            if self.config:
-                client_params["config"] = self.config
-
-            self.client = session.client("bedrock-runtime", **client_params)
+            from langchain_aws.clients import get_client
+
+            self.client = get_client(
+                "bedrock-runtime",
+                region_name=self.region_name,
+                credentials_profile_name=self.credentials_profile_name,
+                endpoint_url=self.endpoint_url,
+                config=self.config,
+                max_pool_connections=self.max_concurrency,
+            )
 
         except ImportError:
             raise ModuleNotFoundError(
@@ -120,49 +240,282 @@ class BedrockEmbeddings(BaseModel, Embeddings):
 
         return self
 
+    def _get_provider(self) -> str:
+        return self.model_id.split(".")[0]
+
     def _embedding_func(self, text: str) -> List[float]:
         """Call out to Bedrock embedding endpoint."""
+        return self._batch_embedding_func([text])[0]
+
+    def _batch_embedding_func(self, texts: List[str]) -> List[List[float]]:
+        """Call out to Bedrock embedding endpoint with one request for all texts.
+
+        Only Cohere accepts more than one text per request, see `_request_batches`.
+        """
+        response_body = self._invoke_model(self._input_body(texts))
+        return self._output_embeddings(response_body)
+
+    async def _abatch_embedding_func(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronous call out to Bedrock embedding endpoint with one request for
+        all texts."""
+        response_body = await self._ainvoke_model(self._input_body(texts))
+        return self._output_embeddings(response_body)
+
+    def _request_batches(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into the groups that are each sent in a single request."""
+        if self._get_provider() == "cohere":
+            return _batch_texts(
+                texts,
+                max_texts=COHERE_MAX_TEXTS_PER_REQUEST,
+                max_characters=COHERE_MAX_CHARACTERS_PER_REQUEST,
+            )
+        return [[text] for text in texts]
+
+    def _input_body(self, texts: List[str]) -> Dict[str, Any]:
+        """Format the request body for provider."""
         # replace newlines, which can negatively affect performance.
-        text = text.replace(os.linesep, " ")
+        texts = [text.replace(os.linesep, " ") for text in texts]
 
-        # format input body for provider
-        provider = self.model_id.split(".")[0]
         input_body: Dict[str, Any] = {}
-        if provider == "cohere":
+        if self._get_provider() == "cohere":
             input_body["input_type"] = "search_document"
-            input_body["texts"] = [text]
-        else:
+            input_body["texts"] = texts
+        elif len(texts) == 1:
             # includes common provider == "amazon"
-            input_body["inputText"] = text
+            input_body["inputText"] = texts[0]
+        else:
+            raise ValueError(
+                f"Model {self.model_id} only supports one text per request."
+            )
 
         if self.model_kwargs:
             input_body = {**input_body, **self.model_kwargs}
 
-        body = json.dumps(input_body)
+        return input_body
+
+    def _output_embeddings(self, response_body: Dict[str, Any]) -> List[List[float]]:
+        if self._get_provider() == "cohere":
+            return response_body.get("embeddings")  # type: ignore[return-value]
+        return [response_body.get("embedding")]  # type: ignore[list-item]
 
+    def _request_options(self, input_body: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "body": json_dumps(input_body),
+            "modelId": self.model_id,
+            "accept": "application/json",
+            "contentType": "application/json",
+        }
+
+    def _invoke_model(self, input_body: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request body to the model and return the parsed response body."""
         try:
-            response = self.client.invoke_model(
-                body=body,
-                modelId=self.model_id,
-                accept="application/json",
-                contentType="application/json",
-            )
+            with instrument(self, self.model_id, "invoke_model") as call:
+                request_options = self._request_options(input_body)
+                with call.request():
+                    response = call_with_rate_limit(
+                        self.model_id,
+                        lambda: call_with_region_pool(
+                            self.region_pool,
+                            self.client,
+                            lambda client: client.invoke_model(**request_options),
+                        ),
+                    )
+                call.record_response(response)
+
+                return json_loads(response.get("body").read())
 
-            response_body = json.loads(response.get("body").read())
-            if provider == "cohere":
-                return response_body.get("embeddings")[0]
-            else:
-                return response_body.get("embedding")
+        except Exception as e:
+            logging.error(f"Error raised by inference endpoint: {e}")
+            raise e
+
+    async def _ainvoke_model(self, input_body: Dict[str, Any]) -> Dict[str, Any]:
+        """Asynchronously send a request body to the model and return the parsed
+        response body.
+
+        Uses `async_client` if set, otherwise runs the blocking client call in the
+        default executor.
+        """
+        if self.async_client is None:
+            return await run_in_executor(None, self._invoke_model, input_body)
+
+        try:
+            with instrument(self, self.model_id, "invoke_model") as call:
+                request_options = self._request_options(input_body)
+                with call.request():
+                    response = await acall_with_rate_limit(
+                        self.model_id,
+                        lambda: self.async_client.invoke_model(**request_options),
+                    )
+                call.record_response(response)
+
+                return json_loads(await response.get("body").read())
 
         except Exception as e:
             logging.error(f"Error raised by inference endpoint: {e}")
             raise e
 
-    def _normalize_vector(self, embeddings: List[float]) -> List[float]:
-        """Normalize the embedding to a unit vector."""
-        emb = np.array(embeddings)
-        norm_emb = emb / np.linalg.norm(emb)
-        return norm_emb.tolist()
+    def _map_concurrently(self, func: Callable[[_T], _R], items: List[_T]) -> List[_R]:
+        """Apply ``func`` to every item using up to ``max_concurrency`` threads.
+
+        Results are returned in the order of ``items``. If any call fails, the
+        remaining pending calls are cancelled and the first failure in input order
+        is re-raised.
+        """
+        max_concurrency = self.max_concurrency or 1
+        if max_concurrency <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+
+        max_workers = min(max_concurrency, len(items))
+        with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(func, item) for item in items]
+            results = []
+            for i, future in enumerate(futures):
+                try:
+                    results.append(future.result())
+                except Exception:
+                    for pending in futures[i + 1 :]:
+                        pending.cancel()
+                    logging.error(f"Embedding failed for item {i} of {len(items)}")
+                    raise
+            return results
+
+    async def _agather_concurrently(
+        self, func: Callable[[_T], Awaitable[_R]], items: List[_T]
+    ) -> List[_R]:
+        """Await ``func`` for every item with at most ``max_concurrency``, or
+        ``_DEFAULT_ASYNC_CONCURRENCY`` when unset, in flight.
+
+        Results are returned in the order of ``items``. If any call fails, the
+        remaining calls are cancelled and the failure is re-raised.
+        """
+        semaphore = asyncio.Semaphore(
+            self.max_concurrency or _DEFAULT_ASYNC_CONCURRENCY
+        )
+
+        async def _run(item: _T) -> _R:
+            async with semaphore:
+                return await func(item)
+
+        tasks = [asyncio.ensure_future(_run(item)) for item in items]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with Bedrock, without normalization or caching."""
+        unique_texts, positions = self._deduplicate(texts)
+        batches = self._request_batches(unique_texts)
+        embeddings = [
+            embedding
+            for batch in self._map_concurrently(self._batch_embedding_func, batches)
+            for embedding in batch
+        ]
+        return _fan_out(embeddings, positions)
+
+    async def _arequest_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously embed texts with Bedrock, without normalization or
+        caching."""
+        unique_texts, positions = self._deduplicate(texts)
+        batches = self._request_batches(unique_texts)
+        embeddings = [
+            embedding
+            for batch in await self._agather_concurrently(
+                self._abatch_embedding_func, batches
+            )
+            for embedding in batch
+        ]
+        return _fan_out(embeddings, positions)
+
+    def _deduplicate(self, texts: List[str]) -> Tuple[List[str], List[int]]:
+        """Return the unique texts, in order of first occurrence, and the position
+        of each input text among them."""
+        if not self.deduplicate:
+            return texts, list(range(len(texts)))
+
+        first_positions: Dict[str, int] = {}
+        positions = [
+            first_positions.setdefault(text, len(first_positions)) for text in texts
+        ]
+        if duplicates := len(texts) - len(first_positions):
+            self._deduplicated_texts += duplicates
+            logger.debug(
+                f"Embedding {len(first_positions)} unique texts, skipped "
+                f"{duplicates} duplicates out of {len(texts)}"
+            )
+        return list(first_positions), positions
+
+    @property
+    def deduplicated_texts(self) -> int:
+        """Number of texts this instance did not send to Bedrock because the same
+        text appeared earlier in the same call."""
+        return self._deduplicated_texts
+
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with Bedrock, bypassing the cache."""
+        embeddings = self._request_embeddings(texts)
+        if self.normalize and embeddings:
+            return _normalize_rows(np.array(embeddings)).tolist()
+        return embeddings
+
+    async def _aembed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously embed texts with Bedrock, bypassing the cache."""
+        embeddings = await self._arequest_embeddings(texts)
+        if self.normalize and embeddings:
+            return _normalize_rows(np.array(embeddings)).tolist()
+        return embeddings
+
+    def _cache_keys(self, texts: List[str]) -> List[str]:
+        """Return content-addressed cache keys for texts.
+
+        Keys combine a hash of the settings that affect the embedding (model id,
+        model kwargs and normalization) with a hash of each text.
+        """
+        settings = json.dumps(
+            [self.model_id, self.model_kwargs, self.normalize],
+            sort_keys=True,
+            default=str,
+        )
+        namespace = hashlib.sha256(settings.encode("utf-8")).hexdigest()[:16]
+        return [
+            f"{namespace}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+            for text in texts
+        ]
+
+    def _cached_embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, only sending the ones missing from `cache` to Bedrock."""
+        if self.cache is None:
+            return self._embed_texts(texts)
+
+        keys = self._cache_keys(texts)
+        embeddings = _copy_cached(self.cache.mget(keys))
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = self._embed_texts([texts[i] for i in missing])
+            self.cache.mset([(keys[i], list(e)) for i, e in zip(missing, computed)])
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+        return cast(List[List[float]], embeddings)
+
+    async def _acached_embed(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously embed texts, only sending the ones missing from `cache`
+        to Bedrock."""
+        if self.cache is None:
+            return await self._aembed_texts(texts)
+
+        keys = self._cache_keys(texts)
+        embeddings = _copy_cached(await self.cache.amget(keys))
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = await self._aembed_texts([texts[i] for i in missing])
+            await self.cache.amset(
+                [(keys[i], list(e)) for i, e in zip(missing, computed)]
+            )
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+        return cast(List[List[float]], embeddings)
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Compute doc embeddings using a Bedrock model.
@@ -173,16 +526,7 @@ class BedrockEmbeddings(BaseModel, Embeddings):
         Returns:
             List of embeddings, one for each text.
         """
-        results = []
-        for text in texts:
-            response = self._embedding_func(text)
-
-            if self.normalize:
-                response = self._normalize_vector(response)
-
-            results.append(response)
-
-        return results
+        return self._cached_embed(texts)
 
     def embed_query(self, text: str) -> List[float]:
         """Compute query embeddings using a Bedrock model.
@@ -193,12 +537,42 @@ class BedrockEmbeddings(BaseModel, Embeddings):
         Returns:
             Embeddings for the text.
         """
-        embedding = self._embedding_func(text)
+        return self._cached_embed([text])[0]
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """Compute doc embeddings using a Bedrock model as a single matrix.
+
+        Unlike `embed_documents`, the embeddings are returned as one contiguous
+        float32 array and normalization, if enabled, is applied to the whole matrix
+        at once, which avoids building a Python float object per value.
+
+        Args:
+            texts: The list of texts to embed
+
+        Returns:
+            Array of shape ``(len(texts), dim)`` with one embedding per row.
+        """
+        if self.cache is not None:
+            return _float32_matrix(self._cached_embed(texts))
+
+        matrix = _float32_matrix(self._request_embeddings(texts))
+        return _normalize_rows(matrix) if self.normalize else matrix
 
-        if self.normalize:
-            return self._normalize_vector(embedding)
+    async def aembed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """Asynchronous compute doc embeddings using a Bedrock model as a single
+        matrix.
 
-        return embedding
+        Args:
+            texts: The list of texts to embed
+
+        Returns:
+            Array of shape ``(len(texts), dim)`` with one embedding per row.
+        """
+        if self.cache is not None:
+            return _float32_matrix(await self._acached_embed(texts))
+
+        matrix = _float32_matrix(await self._arequest_embeddings(texts))
+        return _normalize_rows(matrix) if self.normalize else matrix
 
     async def aembed_query(self, text: str) -> List[float]:
         """Asynchronous compute query embeddings using a Bedrock model.
@@ -209,19 +583,18 @@ class BedrockEmbeddings(BaseModel, Embeddings):
         Returns:
             Embeddings for the text.
         """
-
-        return await run_in_executor(None, self.embed_query, text)
+        return (await self._acached_embed([text]))[0]
 
     async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
         """Asynchronous compute doc embeddings using a Bedrock model.
 
+        At most `max_concurrency` requests, 16 when unset, are in flight at a
+        time.
+
         Args:
             texts: The list of texts to embed
 
         Returns:
             List of embeddings, one for each text.
         """
-
-        result = await asyncio.gather(*[self.aembed_query(text) for text in texts])
-
-        return list(result)
+        return await self._acached_embed(texts)
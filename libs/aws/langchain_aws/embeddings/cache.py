@@ -0,0 +1,229 @@
+"""Key-value stores for caching embeddings computed by `BedrockEmbeddings`.
+
+Any `langchain_core.stores.BaseStore[str, List[float]]` can be used as the
+`BedrockEmbeddings.cache`; the stores in this module cover the common cases of an
+in-process LRU cache, a memory-mapped on-disk cache and a combination of both.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from langchain_core.stores import BaseStore, InMemoryBaseStore
+
+
+class InMemoryLRUEmbeddingStore(InMemoryBaseStore[List[float]]):
+    """In-process embedding store that evicts the least recently used entries.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_aws import BedrockEmbeddings
+            from langchain_aws.embeddings import InMemoryLRUEmbeddingStore
+
+            embeddings = BedrockEmbeddings(
+                cache=InMemoryLRUEmbeddingStore(max_size=100_000)
+            )
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """Initialize an empty store holding at most ``max_size`` embeddings."""
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive, got {max_size}.")
+        self.max_size = max_size
+        self.store: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        values: List[Optional[List[float]]] = []
+        with self._lock:
+            for key in keys:
+                value = self.store.get(key)
+                if value is not None:
+                    self.store.move_to_end(key)
+                    # Copies, so changing a returned vector does not change the cache
+                    value = list(value)
+                values.append(value)
+        return values
+
+    def mset(self, key_value_pairs: Sequence[Tuple[str, List[float]]]) -> None:
+        with self._lock:
+            for key, value in key_value_pairs:
+                self.store[key] = list(value)
+                self.store.move_to_end(key)
+            while len(self.store) > self.max_size:
+                self.store.popitem(last=False)
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self.store.pop(key, None)
+
+    def yield_keys(self, prefix: Optional[str] = None) -> Iterator[str]:
+        with self._lock:
+            keys = list(self.store)
+        for key in keys:
+            if prefix is None or key.startswith(prefix):
+                yield key
+
+
+class MemmapEmbeddingStore(BaseStore[str, List[float]]):
+    """On-disk embedding store backed by a memory-mapped float32 file.
+
+    Vectors are appended to ``vectors.f32`` in ``directory`` and located through
+    ``index.tsv``, so the cache survives process restarts and lookups read vectors
+    straight from the page cache. Values are stored as float32, so they come back
+    rounded to single precision. Deleting a key only drops it from the index; the
+    vector data is not reclaimed.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_aws import BedrockEmbeddings
+            from langchain_aws.embeddings import MemmapEmbeddingStore
+
+            embeddings = BedrockEmbeddings(
+                cache=MemmapEmbeddingStore("/tmp/bedrock-embeddings")
+            )
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """Open the store in ``directory``, creating it if it does not exist."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = self.directory / "vectors.f32"
+        self._index_path = self.directory / "index.tsv"
+        self._vectors_path.touch(exist_ok=True)
+        self._index_path.touch(exist_ok=True)
+        self._lock = threading.Lock()
+        # key -> (offset, length), both counted in float32 values.
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._mmap: Optional[np.memmap] = None
+        self._load_index()
+
+    def _load_index(self) -> None:
+        with open(self._index_path, encoding="utf-8") as f:
+            for line in f:
+                key, offset, length = line.rstrip("\n").split("\t")
+                if int(length) < 0:
+                    self._index.pop(key, None)
+                else:
+                    self._index[key] = (int(offset), int(length))
+
+    def _vectors(self, end: int) -> np.memmap:
+        """Return a memory map covering at least the first ``end`` values."""
+        if self._mmap is None or len(self._mmap) < end:
+            self._mmap = np.memmap(self._vectors_path, dtype=np.float32, mode="r")
+        return self._mmap
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        with self._lock:
+            locations = [self._index.get(key) for key in keys]
+            found = [location for location in locations if location is not None]
+            if not found:
+                return [None] * len(keys)
+            vectors = self._vectors(max(offset + length for offset, length in found))
+            values: List[Optional[List[float]]] = []
+            for location in locations:
+                if location is None:
+                    values.append(None)
+                else:
+                    offset, length = location
+                    values.append(vectors[offset : offset + length].tolist())
+            return values
+
+    def mset(self, key_value_pairs: Sequence[Tuple[str, List[float]]]) -> None:
+        if not key_value_pairs:
+            return
+        with self._lock:
+            offset = os.path.getsize(self._vectors_path) // 4
+            index_lines = []
+            with open(self._vectors_path, "ab") as f:
+                for key, value in key_value_pairs:
+                    vector = np.asarray(value, dtype=np.float32)
+                    f.write(vector.tobytes())
+                    self._index[key] = (offset, len(vector))
+                    index_lines.append(f"{key}\t{offset}\t{len(vector)}\n")
+                    offset += len(vector)
+            with open(self._index_path, "a", encoding="utf-8") as f:
+                f.writelines(index_lines)
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            deleted = [key for key in keys if self._index.pop(key, None)]
+            with open(self._index_path, "a", encoding="utf-8") as f:
+                f.writelines(f"{key}\t0\t-1\n" for key in deleted)
+
+    def yield_keys(self, prefix: Optional[str] = None) -> Iterator[str]:
+        with self._lock:
+            keys = list(self._index)
+        for key in keys:
+            if prefix is None or key.startswith(prefix):
+                yield key
+
+
+class TieredEmbeddingStore(BaseStore[str, List[float]]):
+    """Chain of embedding stores, fastest first.
+
+    Lookups go through the tiers in order and copy hits into the faster tiers that
+    missed them. Writes and deletes go to every tier.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_aws import BedrockEmbeddings
+            from langchain_aws.embeddings import (
+                InMemoryLRUEmbeddingStore,
+                MemmapEmbeddingStore,
+                TieredEmbeddingStore,
+            )
+
+            embeddings = BedrockEmbeddings(
+                cache=TieredEmbeddingStore(
+                    [
+                        InMemoryLRUEmbeddingStore(max_size=10_000),
+                        MemmapEmbeddingStore("/tmp/bedrock-embeddings"),
+                    ]
+                )
+            )
+    """
+
+    def __init__(self, stores: Sequence[BaseStore[str, List[float]]]) -> None:
+        if not stores:
+            raise ValueError("TieredEmbeddingStore requires at least one store.")
+        self.stores = list(stores)
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        values: List[Optional[List[float]]] = [None] * len(keys)
+        missing = list(range(len(keys)))
+        for tier, store in enumerate(self.stores):
+            if not missing:
+                break
+            found = store.mget([keys[i] for i in missing])
+            hits = [(i, value) for i, value in zip(missing, found) if value is not None]
+            for i, value in hits:
+                values[i] = value
+            if hits:
+                for faster_store in self.stores[:tier]:
+                    faster_store.mset([(keys[i], value) for i, value in hits])
+            missing = [i for i, value in zip(missing, found) if value is None]
+        return values
+
+    def mset(self, key_value_pairs: Sequence[Tuple[str, List[float]]]) -> None:
+        for store in self.stores:
+            store.mset(key_value_pairs)
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        for store in self.stores:
+            store.mdelete(keys)
+
+    def yield_keys(self, prefix: Optional[str] = None) -> Iterator[str]:
+        seen = set()
+        for store in self.stores:
+            for key in store.yield_keys(prefix=prefix):
+                if key not in seen:
+                    seen.add(key)
+                    yield key
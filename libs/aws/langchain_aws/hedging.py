@@ -0,0 +1,251 @@
+"""Request hedging to cut the tail latency of Bedrock model calls.
+
+A hedged call sends a duplicate request when the first one has not completed
+within a delay taken from a percentile of recent latencies, and returns whichever
+response arrives first. The duplicate can go to the same model, to a client of
+another region or to a cross-region inference profile. A budget caps the share of
+calls that are hedged, since every hedge is billed like any other request.
+
+Example:
+    .. code-block:: python
+
+        from langchain_aws import ChatBedrockConverse
+        from langchain_aws.clients import get_client
+        from langchain_aws.hedging import HedgingPolicy
+
+        llm = ChatBedrockConverse(
+            model="anthropic.claude-3-5-sonnet-20240620-v1:0",
+            region_name="us-east-1",
+            hedging_policy=HedgingPolicy(
+                percentile=95,
+                max_hedge_ratio=0.05,
+                client=get_client("bedrock-runtime", region_name="us-west-2"),
+            ),
+        )
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def _start_thread(func: Callable[..., _T], *args: Any) -> "Future[_T]":
+    """Run ``func`` on a new thread in a copy of the current context.
+
+    Hedged requests get a thread each rather than a slot in a shared pool, so
+    hedging neither caps the number of concurrent calls nor lets time spent
+    queued for a worker count towards the hedging delay.
+    """
+    future: Future = Future()
+    context = contextvars.copy_context()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(context.run(func, *args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="bedrock-hedge", daemon=True).start()
+    return future
+
+
+class HedgingPolicy:
+    """When and where to send a duplicate of a slow request.
+
+    Args:
+        percentile: Percentile of the recent latencies after which a request is
+            hedged.
+        initial_delay: Hedging delay in seconds until ``min_samples`` latencies
+            have been recorded.
+        min_delay: Lower bound in seconds of the hedging delay.
+        window: Number of recent latencies the percentile is computed over.
+        min_samples: Number of latencies needed before the percentile is used.
+        max_hedge_ratio: Maximum share of requests that are hedged, e.g. 0.05 for
+            at most one hedge per twenty requests.
+        client: Bedrock runtime client hedges are sent with, e.g. one of another
+            region. Defaults to the client of the model.
+        async_client: Asynchronous client hedges are sent with by async calls.
+            Defaults to the async client of the model.
+        model_id: Model or inference profile id hedges are sent to. Defaults to the
+            model id of the request.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        window: int = 200,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.05,
+        client: Any = None,
+        async_client: Any = None,
+        model_id: Optional[str] = None,
+    ) -> None:
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be greater than 0 and at most 100.")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be between 0 and 1.")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.client = client
+        self.async_client = async_client
+        self.model_id = model_id
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latencies: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """Seconds to wait for a response before sending a hedge."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))
+        return max(self.min_delay, latencies[index])
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def _start_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _acquire_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.max_hedge_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def _hedge_target(self, client: Any, model_id: str) -> Tuple[Any, str]:
+        return self.client or client, self.model_id or model_id
+
+    def call(
+        self,
+        request: Callable[[Any, str], _T],
+        client: Any,
+        model_id: str,
+        discard: Optional[Callable[[_T], None]] = None,
+    ) -> _T:
+        """Run ``request(client, model_id)``, hedged if it is slow.
+
+        The response of the request that loses the race is passed to ``discard``,
+        e.g. to close its stream. Requests that are already running cannot be
+        aborted, so the losing request runs to completion in the background.
+        """
+        self._start_request()
+        start = time.monotonic()
+        primary = _start_thread(request, client, model_id)
+        hedge: Optional[Future] = None
+        winner: Optional[Future] = None
+        try:
+            delay = self.delay()
+            done, _ = wait([primary], timeout=delay)
+            if done or not self._acquire_hedge():
+                winner = primary
+                result = primary.result()
+                self.record_latency(time.monotonic() - start)
+                return result
+
+            logger.debug(f"Hedging request to {model_id} after {delay:.3f}s")
+            hedge = _start_thread(request, *self._hedge_target(client, model_id))
+            pending = {primary, hedge}
+            while pending and winner is None:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                winner = next((f for f in done if f.exception() is None), None)
+            if winner is None:
+                return primary.result()
+            self._record_winner(winner is hedge, start)
+            return winner.result()
+        finally:
+            for future in (primary, hedge):
+                if future is None or future is winner:
+                    continue
+                if not future.cancel() and discard is not None:
+                    future.add_done_callback(_discard_callback(discard))
+
+    async def acall(
+        self,
+        request: Callable[[Any, str], Awaitable[_T]],
+        client: Any,
+        model_id: str,
+        discard: Optional[Callable[[_T], Any]] = None,
+    ) -> _T:
+        """Async version of `call`, which cancels the request that loses the race."""
+        self._start_request()
+        start = time.monotonic()
+        primary = asyncio.ensure_future(request(client, model_id))
+        hedge: Optional[asyncio.Future] = None
+        winner: Optional[asyncio.Future] = None
+        try:
+            delay = self.delay()
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._acquire_hedge():
+                result = await primary
+                self.record_latency(time.monotonic() - start)
+                return result
+
+            logger.debug(f"Hedging request to {model_id} after {delay:.3f}s")
+            hedge = asyncio.ensure_future(
+                request(*self._hedge_target(self.async_client or client, model_id))
+            )
+            pending = {primary, hedge}
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winner = next((f for f in done if f.exception() is None), None)
+            if winner is None:
+                return await primary
+            self._record_winner(winner is hedge, start)
+            return winner.result()
+        finally:
+            for task in (primary, hedge):
+                if task is None or task is winner:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif (
+                    discard is not None
+                    and not task.cancelled()
+                    and task.exception() is None
+                ):
+                    discarded = discard(task.result())
+                    if asyncio.iscoroutine(discarded):
+                        await discarded
+
+    def _record_winner(self, hedge_won: bool, start: float) -> None:
+        self.record_latency(time.monotonic() - start)
+        if hedge_won:
+            with self._lock:
+                self.hedge_wins += 1
+
+
+def _discard_callback(discard: Callable[[Any], None]) -> Callable[[Future], None]:
+    def callback(future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            try:
+                discard(future.result())
+            except Exception as e:
+                logger.debug(f"Error discarding hedged response: {e}")
+
+    return callback
@@ -0,0 +1,304 @@
+"""Latency and token instrumentation of Bedrock model calls.
+
+Functions registered with `add_instrumentation_hook` receive a `CallMetrics`
+record after every model call made by `BedrockLLM`, `ChatBedrock`,
+`ChatBedrockConverse` and `BedrockEmbeddings`. The record holds the time spent
+building the request and waiting for the response, the time to the first streamed
+chunk and the gaps between chunks, the token usage and the retries. Calls are not
+measured at all while no hook is registered.
+
+`OpenTelemetryHook` records the metrics as OpenTelemetry histograms and counters.
+
+Example:
+    .. code-block:: python
+
+        from langchain_aws.instrumentation import add_instrumentation_hook
+
+        def log_call(metrics):
+            print(metrics.model_id, metrics.network_time, metrics.output_tokens)
+
+        add_instrumentation_hook(log_call)
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+logger = logging.getLogger(__name__)
+
+
+class CallMetrics:
+    """Measurements of one model call.
+
+    Times are in seconds and None when they do not apply to the call, e.g. the
+    time to the first chunk of a call that does not stream.
+    """
+
+    __slots__ = (
+        "component",
+        "model_id",
+        "operation",
+        "build_time",
+        "network_time",
+        "duration",
+        "time_to_first_token",
+        "chunks",
+        "mean_inter_token_gap",
+        "max_inter_token_gap",
+        "input_tokens",
+        "output_tokens",
+        "retries",
+        "throttles",
+        "error",
+    )
+
+    def __init__(self, component: str, model_id: str, operation: str) -> None:
+        self.component = component
+        """Name of the class that made the call, e.g. "ChatBedrockConverse"."""
+        self.model_id = model_id
+        self.operation = operation
+        """The Bedrock API called, e.g. "converse_stream"."""
+        self.build_time: Optional[float] = None
+        """Time from the start of the call until the request was sent."""
+        self.network_time: Optional[float] = None
+        """Time from sending the request until the response, or for streams the
+        response headers, arrived. Includes rate limiting and retries."""
+        self.duration: Optional[float] = None
+        """Time from the start of the call until its response was read."""
+        self.time_to_first_token: Optional[float] = None
+        """Time from sending the request until the first streamed chunk arrived."""
+        self.chunks = 0
+        """Number of streamed chunks."""
+        self.mean_inter_token_gap: Optional[float] = None
+        self.max_inter_token_gap: Optional[float] = None
+        self.input_tokens: Optional[int] = None
+        self.output_tokens: Optional[int] = None
+        self.retries = 0
+        """Number of times the request was sent again, to the same or another
+        region."""
+        self.throttles = 0
+        """Number of throttling errors among the retried requests."""
+        self.error: Optional[str] = None
+        """Class name of the error the call failed with, if any."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"CallMetrics({fields})"
+
+
+InstrumentationHook = Callable[[CallMetrics], None]
+
+_hooks: List[InstrumentationHook] = []
+_current_call: ContextVar[Optional["_CallRecorder"]] = ContextVar(
+    "langchain_aws_current_call", default=None
+)
+
+
+def add_instrumentation_hook(hook: InstrumentationHook) -> None:
+    """Call ``hook`` with the `CallMetrics` of every model call."""
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_instrumentation_hook(hook: InstrumentationHook) -> None:
+    """Stop calling ``hook``."""
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def record_retry(throttled: bool) -> None:
+    """Count a retry of the request of the call being measured, if any."""
+    call = _current_call.get()
+    if call is not None:
+        call.metrics.retries += 1
+        if throttled:
+            call.metrics.throttles += 1
+
+
+def _response_usage(response: Any) -> Optional[Dict[str, int]]:
+    """Token usage of an InvokeModel or Converse response, if reported."""
+    if not isinstance(response, dict):
+        return None
+    if usage := response.get("usage"):
+        return {
+            "input_tokens": usage.get("inputTokens", 0),
+            "output_tokens": usage.get("outputTokens", 0),
+        }
+    headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+    if "x-amzn-bedrock-input-token-count" not in headers:
+        return None
+    return {
+        "input_tokens": int(headers["x-amzn-bedrock-input-token-count"]),
+        "output_tokens": int(headers.get("x-amzn-bedrock-output-token-count", 0)),
+    }
+
+
+class _CallRecorder:
+    """Measures one model call and passes its metrics to the hooks at the end."""
+
+    def __init__(self, component: str, model_id: str, operation: str) -> None:
+        self.metrics = CallMetrics(component, model_id, operation)
+        self._start = time.perf_counter()
+        self._sent: Optional[float] = None
+        self._last_chunk: Optional[float] = None
+        self._gaps = 0.0
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """Measure sending the request and receiving the response."""
+        self._sent = time.perf_counter()
+        self.metrics.build_time = self._sent - self._start
+        token = _current_call.set(self)
+        try:
+            yield
+        finally:
+            _current_call.reset(token)
+            self.metrics.network_time = time.perf_counter() - self._sent
+
+    def chunk_received(self) -> None:
+        now = time.perf_counter()
+        metrics = self.metrics
+        metrics.chunks += 1
+        if self._last_chunk is None:
+            metrics.time_to_first_token = now - (self._sent or self._start)
+        else:
+            gap = now - self._last_chunk
+            self._gaps += gap
+            metrics.mean_inter_token_gap = self._gaps / (metrics.chunks - 1)
+            if metrics.max_inter_token_gap is None or gap > metrics.max_inter_token_gap:
+                metrics.max_inter_token_gap = gap
+        self._last_chunk = now
+
+    def record_usage(self, usage: Optional[Dict[str, int]]) -> None:
+        """Record token usage with "input_tokens" and "output_tokens" counts."""
+        if usage:
+            self.metrics.input_tokens = usage.get("input_tokens")
+            self.metrics.output_tokens = usage.get("output_tokens")
+
+    def record_response(self, response: Any) -> None:
+        """Record the token usage reported by an InvokeModel or Converse response."""
+        self.record_usage(_response_usage(response))
+
+    def __enter__(self) -> "_CallRecorder":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.metrics.duration = time.perf_counter() - self._start
+        if exc_type is not None and exc_type is not GeneratorExit:
+            self.metrics.error = exc_type.__name__
+        for hook in list(_hooks):
+            try:
+                hook(self.metrics)
+            except Exception as e:
+                logger.warning(f"Error in instrumentation hook {hook}: {e}")
+
+
+class _NoopRecorder:
+    """Stands in for `_CallRecorder` while no hook is registered."""
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        yield
+
+    def chunk_received(self) -> None:
+        pass
+
+    def record_usage(self, usage: Optional[Dict[str, int]]) -> None:
+        pass
+
+    def record_response(self, response: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopRecorder":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_NOOP_RECORDER = _NoopRecorder()
+
+
+def instrument(component: Any, model_id: str, operation: str) -> Any:
+    """Return a recorder for a call of ``operation`` made by ``component``.
+
+    Use it as a context manager around the whole call, and its `request` context
+    manager around sending the request.
+    """
+    if not _hooks:
+        return _NOOP_RECORDER
+    return _CallRecorder(type(component).__name__, model_id, operation)
+
+
+class OpenTelemetryHook:
+    """Instrumentation hook recording metrics with the OpenTelemetry metrics API.
+
+    Durations are recorded as histograms in seconds, tokens, retries and
+    throttles as counters, all with the attributes ``langchain_aws.component``,
+    ``gen_ai.request.model`` and ``aws.operation``.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_aws.instrumentation import (
+                OpenTelemetryHook,
+                add_instrumentation_hook,
+            )
+
+            add_instrumentation_hook(OpenTelemetryHook())
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError as e:
+                raise ImportError(
+                    "Could not import opentelemetry python package. "
+                    "Please install it with `pip install opentelemetry-api`."
+                ) from e
+            meter = metrics.get_meter("langchain_aws")
+        self._histograms = {
+            name: meter.create_histogram(f"langchain_aws.{name}", unit="s")
+            for name in (
+                "build_time",
+                "network_time",
+                "duration",
+                "time_to_first_token",
+                "mean_inter_token_gap",
+                "max_inter_token_gap",
+            )
+        }
+        self._counters = {
+            name: meter.create_counter(f"langchain_aws.{name}")
+            for name in ("input_tokens", "output_tokens", "retries", "throttles")
+        }
+        self._errors = meter.create_counter("langchain_aws.errors")
+
+    def __call__(self, metrics: CallMetrics) -> None:
+        attributes = {
+            "langchain_aws.component": metrics.component,
+            "gen_ai.request.model": metrics.model_id,
+            "aws.operation": metrics.operation,
+        }
+        for name, histogram in self._histograms.items():
+            value = getattr(metrics, name)
+            if value is not None:
+                histogram.record(value, attributes)
+        for name, counter in self._counters.items():
+            value = getattr(metrics, name)
+            if value:
+                counter.add(value, attributes)
+        if metrics.error:
+            self._errors.add(1, {**attributes, "error.type": metrics.error})
@@ -1,3 +1,9 @@
+from langchain_aws.llms.batch import (
+    BatchStorage,
+    BedrockBatchInference,
+    LocalBatchStorage,
+    S3BatchStorage,
+)
 from langchain_aws.llms.bedrock import (
     ALTERNATION_ERROR,
     BedrockBase,
@@ -8,8 +14,12 @@ from langchain_aws.llms.sagemaker_endpoint import SagemakerEndpoint
 
 __all__ = [
     "ALTERNATION_ERROR",
+    "BatchStorage",
     "BedrockBase",
+    "BedrockBatchInference",
     "BedrockLLM",
     "LLMInputOutputAdapter",
+    "LocalBatchStorage",
+    "S3BatchStorage",
     "SagemakerEndpoint",
 ]
@@ -0,0 +1,328 @@
+"""Bulk generation with Bedrock batch inference.
+
+Batch inference runs a model invocation job over a JSONL file of model inputs and
+writes the outputs back to storage. It is billed at a discount compared to on-demand
+invocations and does not consume the on-demand request and token quotas, which
+makes it a better fit for offline workloads than calling a model once per prompt.
+"""
+
+import io
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from langchain_core.messages import BaseMessage
+
+from langchain_aws.clients import get_client
+from langchain_aws.llms.bedrock import BedrockBase, LLMInputOutputAdapter
+from langchain_aws.utils import enforce_stop_tokens
+
+logger = logging.getLogger(__name__)
+
+BatchInput = Union[str, Sequence[BaseMessage]]
+
+_COMPLETED_STATUSES = ("Completed", "PartiallyCompleted")
+_FAILED_STATUSES = ("Failed", "Stopped", "Expired")
+
+
+class BatchStorage(ABC):
+    """Storage for the input and output files of batch inference jobs."""
+
+    @abstractmethod
+    def uri(self, key: str) -> str:
+        """Return the URI under which Bedrock reads or writes ``key``."""
+
+    @abstractmethod
+    def write(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``."""
+
+    @abstractmethod
+    def read(self, key: str) -> bytes:
+        """Return the data stored under ``key``."""
+
+    @abstractmethod
+    def list_keys(self, prefix: str) -> List[str]:
+        """Return all keys starting with ``prefix``."""
+
+
+class S3BatchStorage(BatchStorage):
+    """Batch job files stored in an S3 bucket, under an optional key prefix."""
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        *,
+        client: Any = None,
+        region_name: Optional[str] = None,
+        credentials_profile_name: Optional[str] = None,
+    ) -> None:
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = client or get_client(
+            "s3",
+            region_name=region_name,
+            credentials_profile_name=credentials_profile_name,
+        )
+
+    def uri(self, key: str) -> str:
+        return f"s3://{self.bucket}/{self.prefix}{key}"
+
+    def write(self, key: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+    def read(self, key: str) -> bytes:
+        response = self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+        return response["Body"].read()
+
+    def list_keys(self, prefix: str) -> List[str]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        return [
+            obj["Key"][len(self.prefix) :]
+            for page in paginator.paginate(
+                Bucket=self.bucket, Prefix=self.prefix + prefix
+            )
+            for obj in page.get("Contents", [])
+        ]
+
+
+class LocalBatchStorage(BatchStorage):
+    """Batch job files stored in a local directory.
+
+    Bedrock cannot access local files, so this is meant for tests and for
+    stand-ins of the batch service.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def uri(self, key: str) -> str:
+        return (self.directory / key).as_uri()
+
+    def write(self, key: str, data: bytes) -> None:
+        path = self.directory / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def read(self, key: str) -> bytes:
+        return (self.directory / key).read_bytes()
+
+    def list_keys(self, prefix: str) -> List[str]:
+        return sorted(
+            key
+            for key in (
+                path.relative_to(self.directory).as_posix()
+                for path in self.directory.rglob("*")
+                if path.is_file()
+            )
+            if key.startswith(prefix)
+        )
+
+
+class BedrockBatchInference:
+    """Generate completions for many inputs with a Bedrock batch inference job.
+
+    Request bodies are built exactly like on-demand invocations of ``llm``, and
+    outputs are parsed the same way. Inputs are either prompt strings or, for chat
+    models, lists of messages. Bedrock requires a minimum number of records per job,
+    see the Bedrock batch inference quotas.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_aws import BedrockLLM
+            from langchain_aws.llms import BedrockBatchInference, S3BatchStorage
+
+            batch = BedrockBatchInference(
+                BedrockLLM(model_id="meta.llama3-8b-instruct-v1:0"),
+                storage=S3BatchStorage("my-bucket", prefix="batch/"),
+                role_arn="arn:aws:iam::123456789012:role/BedrockBatchRole",
+            )
+            summaries = batch.generate(prompts)
+    """
+
+    def __init__(
+        self,
+        llm: BedrockBase,
+        storage: BatchStorage,
+        role_arn: str,
+        *,
+        client: Any = None,
+        poll_interval: float = 60.0,
+        timeout: Optional[float] = None,
+        job_name_prefix: str = "langchain-batch",
+    ) -> None:
+        """Initialize the batch runner.
+
+        Args:
+            llm: The model whose request and response formats are used.
+            storage: Where job input and output files are stored.
+            role_arn: IAM role Bedrock assumes to access ``storage``.
+            client: A Bedrock control plane ("bedrock") client. Defaults to a shared
+                client for the model's region and profile.
+            poll_interval: Seconds between job status checks in `wait`.
+            timeout: Seconds after which `wait` gives up. No limit if None.
+            job_name_prefix: Prefix of the generated job names.
+        """
+        self.llm = llm
+        self.storage = storage
+        self.role_arn = role_arn
+        self.client = client or get_client(
+            "bedrock",
+            region_name=llm.region_name,
+            credentials_profile_name=llm.credentials_profile_name,
+        )
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.job_name_prefix = job_name_prefix
+
+    def _input_body(self, batch_input: BatchInput, **kwargs: Any) -> Dict[str, Any]:
+        prompt, system, messages = None, None, None
+        if isinstance(batch_input, str):
+            prompt = batch_input
+        else:
+            from langchain_aws.chat_models.bedrock import ChatPromptAdapter
+
+            provider = self.llm._get_provider()
+            if provider == "anthropic":
+                system, messages = ChatPromptAdapter.format_messages(
+                    provider, list(batch_input)
+                )
+            else:
+                prompt = ChatPromptAdapter.convert_messages_to_prompt(
+                    provider=provider,
+                    messages=list(batch_input),
+                    model=self.llm._get_model(),
+                )
+        _, input_body = self.llm._prepare_input_body(
+            prompt=prompt, system=system, messages=messages, **kwargs
+        )
+        return input_body
+
+    def submit(self, inputs: Sequence[BatchInput], **kwargs: Any) -> str:
+        """Write the job input file, start the job and return its ARN."""
+        if not inputs:
+            raise ValueError("A batch inference job requires at least one input.")
+
+        job_name = f"{self.job_name_prefix}-{uuid.uuid4().hex[:12]}"
+        records = (
+            json.dumps(
+                {
+                    "recordId": f"{i:011d}",
+                    "modelInput": self._input_body(batch_input, **kwargs),
+                }
+            )
+            for i, batch_input in enumerate(inputs)
+        )
+        input_key = f"{job_name}/input.jsonl"
+        self.storage.write(input_key, "\n".join(records).encode())
+
+        response = self.client.create_model_invocation_job(
+            jobName=job_name,
+            roleArn=self.role_arn,
+            modelId=self.llm.model_id,
+            inputDataConfig={
+                "s3InputDataConfig": {
+                    "s3Uri": self.storage.uri(input_key),
+                    "s3InputFormat": "JSONL",
+                }
+            },
+            outputDataConfig={
+                "s3OutputDataConfig": {"s3Uri": self.storage.uri(f"{job_name}/output/")}
+            },
+        )
+        logger.info(f"Started Bedrock batch inference job {job_name}")
+        return response["jobArn"]
+
+    def wait(self, job_arn: str) -> Dict[str, Any]:
+        """Poll the job until it completes and return its description."""
+        start = time.monotonic()
+        while True:
+            job = self.client.get_model_invocation_job(jobIdentifier=job_arn)
+            status = job["status"]
+            if status in _COMPLETED_STATUSES:
+                return job
+            if status in _FAILED_STATUSES:
+                raise ValueError(
+                    f"Bedrock batch inference job {job_arn} ended with status "
+                    f"{status}: {job.get('message', '')}"
+                )
+            if self.timeout is not None and time.monotonic() - start > self.timeout:
+                raise TimeoutError(
+                    f"Bedrock batch inference job {job_arn} did not complete within "
+                    f"{self.timeout} seconds, last status: {status}"
+                )
+            logger.debug(f"Bedrock batch inference job {job_arn} is {status}")
+            time.sleep(self.poll_interval)
+
+    def results(
+        self,
+        job_arn: str,
+        stop: Optional[List[str]] = None,
+        *,
+        return_exceptions: bool = False,
+    ) -> List[Union[str, Exception]]:
+        """Return the generated text of every input of a completed job, in order.
+
+        Records that failed or are missing from the output raise a ValueError, or are
+        returned as one if ``return_exceptions`` is True.
+        """
+        job = self.client.get_model_invocation_job(jobIdentifier=job_arn)
+        job_name = job["jobName"]
+        records: Dict[str, Dict[str, Any]] = {}
+        for key in self.storage.list_keys(f"{job_name}/output/"):
+            if not key.endswith(".jsonl.out"):
+                continue
+            for line in self.storage.read(key).decode().splitlines():
+                if line.strip():
+                    record = json.loads(line)
+                    records[record["recordId"]] = record
+
+        num_inputs = sum(
+            1
+            for line in self.storage.read(f"{job_name}/input.jsonl").splitlines()
+            if line.strip()
+        )
+        provider = self.llm._get_provider()
+        outputs: List[Union[str, Exception]] = []
+        for i in range(num_inputs):
+            record = records.get(f"{i:011d}")
+            if record is None or "modelOutput" not in record:
+                reason = (
+                    record.get("error", "no model output")
+                    if record
+                    else "missing from the output"
+                )
+                error = ValueError(f"Batch record {i} failed: {reason}")
+                if not return_exceptions:
+                    raise error
+                outputs.append(error)
+                continue
+
+            response = {"body": io.BytesIO(json.dumps(record["modelOutput"]).encode())}
+            text = LLMInputOutputAdapter.prepare_output(provider, response)["text"]
+            if stop is not None:
+                text = enforce_stop_tokens(text, stop)
+            outputs.append(text)
+        return outputs
+
+    def generate(
+        self,
+        inputs: Sequence[BatchInput],
+        stop: Optional[List[str]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Union[str, Exception]]:
+        """Run a batch inference job over ``inputs`` and return the generations.
+
+        Blocks until the job completes, see `wait`.
+        """
+        job_arn = self.submit(inputs, **kwargs)
+        self.wait(job_arn)
+        return self.results(job_arn, stop, return_exceptions=return_exceptions)
@@ -1,7 +1,8 @@
 import asyncio
-import json
+import copy
 import logging
 import os
+import threading
 import warnings
 from abc import ABC
 from typing import (
@@ -18,7 +19,6 @@ from typing import (
     Union,
 )
 
-import boto3
 from langchain_core.callbacks import (
     AsyncCallbackManagerForLLMRun,
     CallbackManagerForLLMRun,
@@ -27,12 +27,24 @@ from langchain_core.language_models import LLM, BaseLanguageModel, LangSmithPara
 from langchain_core.messages import AIMessageChunk, ToolCall
 from langchain_core.messages.tool import tool_call, tool_call_chunk
 from langchain_core.outputs import Generation, GenerationChunk, LLMResult
+from langchain_core.runnables.config import run_in_executor
 from langchain_core.utils import secret_from_env
-from pydantic import ConfigDict, Field, SecretStr, model_validator
+from pydantic import ConfigDict, Field, PrivateAttr, SecretStr, model_validator
 from typing_extensions import Self
 
+from langchain_aws.clients import get_client
 from langchain_aws.function_calling import _tools_in_params
+from langchain_aws.instrumentation import instrument
+from langchain_aws.rate_limiters import (
+    acall_with_rate_limit,
+    call_with_rate_limit,
+    record_model_usage,
+)
+from langchain_aws.region_pool import RegionPool, call_with_region_pool
+from langchain_aws.serializers import json_dumps, json_loads
+from langchain_aws.streams import ResponseStreamGuard
 from langchain_aws.utils import (
+    StopSequenceMatcher,
     anthropic_tokens_supported,
     enforce_stop_tokens,
     get_num_tokens_anthropic,
@@ -101,9 +113,8 @@ def _stream_response_to_generation_chunk(
     if messages_api:
         msg_type = stream_response.get("type")
         if msg_type == "message_start":
-            return AIMessageChunk(
-                content="" if coerce_content_to_string else [],
-            )
+            # Carries no content, so no chunk is built for it
+            return None
         elif (
             msg_type == "content_block_start"
             and stream_response["content_block"] is not None
@@ -215,16 +226,158 @@ def _combine_generation_info_for_llm_result(
 def _get_invocation_metrics_chunk(chunk: Dict[str, Any]) -> GenerationChunk:
     generation_info = {}
     if metrics := chunk.get("amazon-bedrock-invocationMetrics"):
-        input_tokens = metrics.get("inputTokenCount", 0)
+        cache_read = metrics.get("cacheReadInputTokenCount", 0)
+        cache_write = metrics.get("cacheWriteInputTokenCount", 0)
+        input_tokens = metrics.get("inputTokenCount", 0) + cache_read + cache_write
         output_tokens = metrics.get("outputTokenCount", 0)
         generation_info["usage_metadata"] = {
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
             "total_tokens": input_tokens + output_tokens,
         }
+        if cache_read or cache_write:
+            generation_info["usage_metadata"]["input_token_details"] = {
+                "cache_read": cache_read,
+                "cache_creation": cache_write,
+            }
     return GenerationChunk(text="", generation_info=generation_info)
 
 
+async def _aiter_events(stream: Any) -> AsyncIterator[Any]:
+    """Iterate over a response event stream without blocking the event loop.
+
+    Natively asynchronous streams, e.g. from aiobotocore, are iterated directly.
+    Blocking botocore streams are read on a thread of their own, rather than one
+    of the default executor's workers, which hands events over through an asyncio
+    queue. The stream is closed if iteration stops before its end, which also
+    unblocks the reading thread.
+    """
+    if hasattr(stream, "__aiter__"):
+        async for event in stream:
+            yield event
+        return
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    stopped = threading.Event()
+
+    def put(item: Tuple[Any, Optional[BaseException]]) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # The event loop was closed while the stream was being read.
+            stopped.set()
+
+    def read() -> None:
+        try:
+            for event in stream:
+                if stopped.is_set():
+                    return
+                put((event, None))
+        except Exception as e:
+            put((done, e))
+        else:
+            put((done, None))
+
+    threading.Thread(target=read, name="bedrock-stream", daemon=True).start()
+    finished = False
+    try:
+        while True:
+            event, error = await queue.get()
+            if event is done:
+                finished = True
+                if error is not None:
+                    raise error
+                return
+            yield event
+    finally:
+        stopped.set()
+        close = getattr(stream, "close", None)
+        if not finished and close is not None:
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"Error closing response stream: {e}")
+
+
+def _stop_chunk(
+    matcher: StopSequenceMatcher, chunk: GenerationChunk
+) -> Optional[GenerationChunk]:
+    text, _ = matcher.feed(chunk.text)
+    if not text:
+        return None
+    return GenerationChunk(text=text, generation_info=chunk.generation_info)
+
+
+def _enforce_stop_sequences(
+    chunks: Iterator[Union[GenerationChunk, AIMessageChunk]],
+    stop: List[str],
+    guard: ResponseStreamGuard,
+) -> Iterator[Union[GenerationChunk, AIMessageChunk]]:
+    """Cut streamed text off at the first stop sequence and cancel the stream."""
+    matcher = StopSequenceMatcher(stop)
+    for chunk in chunks:
+        if not isinstance(chunk, GenerationChunk) or not chunk.text:
+            # Held back text goes out before the metrics or stop reason chunk
+            if text := matcher.flush():
+                yield GenerationChunk(text=text)
+            yield chunk
+            continue
+        stop_chunk = _stop_chunk(matcher, chunk)
+        if stop_chunk is not None:
+            yield stop_chunk
+        if matcher.stopped:
+            if hasattr(chunks, "close"):
+                chunks.close()
+            guard.cancel()
+            return
+    text = matcher.flush()
+    if text:
+        yield GenerationChunk(text=text)
+
+
+async def _aenforce_stop_sequences(
+    chunks: AsyncIterator[Union[GenerationChunk, AIMessageChunk]],
+    stop: List[str],
+    guard: ResponseStreamGuard,
+) -> AsyncIterator[Union[GenerationChunk, AIMessageChunk]]:
+    """Async version of `_enforce_stop_sequences`."""
+    matcher = StopSequenceMatcher(stop)
+    async for chunk in chunks:
+        if not isinstance(chunk, GenerationChunk) or not chunk.text:
+            # Held back text goes out before the metrics or stop reason chunk
+            if text := matcher.flush():
+                yield GenerationChunk(text=text)
+            yield chunk
+            continue
+        stop_chunk = _stop_chunk(matcher, chunk)
+        if stop_chunk is not None:
+            yield stop_chunk
+        if matcher.stopped:
+            if hasattr(chunks, "aclose"):
+                await chunks.aclose()
+            await guard.acancel()
+            return
+    text = matcher.flush()
+    if text:
+        yield GenerationChunk(text=text)
+
+
+def _record_chunk(
+    call: Any, chunk: Union[GenerationChunk, AIMessageChunk], model_id: str
+) -> None:
+    """Record a streamed chunk, or the token usage of the final metrics chunk and
+    charge it to the model's rate limiter."""
+    if chunk.text if isinstance(chunk, GenerationChunk) else chunk.content:
+        call.chunk_received()
+    elif isinstance(chunk, GenerationChunk) and chunk.generation_info:
+        usage = chunk.generation_info.get("usage_metadata")
+        call.record_usage(usage)
+        if usage:
+            record_model_usage(model_id, usage["total_tokens"])
+
+
 def extract_tool_calls(content: List[dict]) -> List[ToolCall]:
     tool_calls = []
     for block in content:
@@ -263,7 +416,7 @@ class LLMInputOutputAdapter:
         provider: str,
         model_kwargs: Dict[str, Any],
         prompt: Optional[str] = None,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict]]] = None,
         messages: Optional[List[Dict]] = None,
         tools: Optional[List[AnthropicTool]] = None,
         *,
@@ -326,7 +479,7 @@ class LLMInputOutputAdapter:
     def prepare_output(cls, provider: str, response: Any) -> dict:
         text = ""
         tool_calls = []
-        response_body = json.loads(response.get("body").read().decode())
+        response_body = json_loads(response.get("body").read())
 
         if provider == "anthropic":
             if "completion" in response_body:
@@ -353,15 +506,25 @@ class LLMInputOutputAdapter:
         headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
         prompt_tokens = int(headers.get("x-amzn-bedrock-input-token-count", 0))
         completion_tokens = int(headers.get("x-amzn-bedrock-output-token-count", 0))
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        # Prompt caching, with input tokens that exclude the cached ones
+        if "x-amzn-bedrock-cache-read-input-token-count" in headers:
+            usage["cache_read_input_tokens"] = int(
+                headers["x-amzn-bedrock-cache-read-input-token-count"]
+            )
+        if "x-amzn-bedrock-cache-write-input-token-count" in headers:
+            usage["cache_write_input_tokens"] = int(
+                headers["x-amzn-bedrock-cache-write-input-token-count"]
+            )
         return {
             "text": text,
             "tool_calls": tool_calls,
             "body": response_body,
-            "usage": {
-                "prompt_tokens": prompt_tokens,
-                "completion_tokens": completion_tokens,
-                "total_tokens": prompt_tokens + completion_tokens,
-            },
+            "usage": usage,
             "stop_reason": response_body.get("stop_reason"),
         }
 
@@ -394,7 +557,7 @@ class LLMInputOutputAdapter:
             if not chunk:
                 continue
 
-            chunk_obj = json.loads(chunk.get("bytes").decode())
+            chunk_obj = json_loads(chunk.get("bytes"))
 
             if provider == "cohere" and (
                 chunk_obj["is_finished"] or chunk_obj[output_key] == "<EOS_TOKEN>"
@@ -447,12 +610,12 @@ class LLMInputOutputAdapter:
                 f"Unknown streaming response output key for provider: {provider}"
             )
 
-        for event in stream:
+        async for event in _aiter_events(stream):
             chunk = event.get("chunk")
             if not chunk:
                 continue
 
-            chunk_obj = json.loads(chunk.get("bytes").decode())
+            chunk_obj = json_loads(chunk.get("bytes"))
 
             if provider == "cohere" and (
                 chunk_obj["is_finished"] or chunk_obj[output_key] == "<EOS_TOKEN>"
@@ -478,6 +641,86 @@ class LLMInputOutputAdapter:
                 continue
 
 
+class _InvokeRequestBuilder:
+    """Builds `invoke_model` requests for one model configuration.
+
+    The provider, tool support, static model kwargs and guardrail options are
+    resolved once when the builder is created, so each call only merges its own
+    fields. Created and cached by `BedrockBase._get_request_builder`.
+    """
+
+    def __init__(self, llm: "BedrockBase", key: Tuple) -> None:
+        self.key = key
+        self.provider = llm._get_provider()
+        self.supports_tools = "claude-3" in llm._get_model()
+        self.model_kwargs = dict(llm.model_kwargs or {})
+        self.max_tokens = llm.max_tokens
+        self.temperature = llm.temperature
+        self.stop_sequence_key = llm.provider_stop_sequence_key_name_map.get(
+            self.provider
+        )
+        self.base_options: Dict[str, Any] = {
+            "modelId": llm.model_id,
+            "accept": "application/json",
+            "contentType": "application/json",
+        }
+        self.options = dict(self.base_options)
+        if llm._guardrails_enabled:
+            guardrails: Dict[str, Any] = llm.guardrails  # type: ignore[assignment]
+            self.options["guardrailIdentifier"] = guardrails.get(
+                "guardrailIdentifier", ""
+            )
+            self.options["guardrailVersion"] = guardrails.get("guardrailVersion", "")
+            if guardrails.get("trace"):
+                self.options["trace"] = "ENABLED"
+
+    def input_body(
+        self,
+        prompt: Optional[str] = None,
+        system: Optional[Union[str, List[Dict]]] = None,
+        messages: Optional[List[Dict]] = None,
+        stop: Optional[List[str]] = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Return the model input body and whether tools were passed to the model.
+
+        ``stop`` is only sent to the model by the streaming paths, the other paths
+        enforce it on the output. Streams also enforce it on the output, which lets
+        providers without stop sequence support stream with ``stop``.
+        """
+        params = self.model_kwargs
+        if stop or (stream and self.provider == "cohere") or kwargs:
+            params = dict(params)
+            # stop sequence from _generate() overrides
+            # stop sequences in the class attribute
+            if stop and self.stop_sequence_key:
+                params[self.stop_sequence_key] = stop
+            if stream and self.provider == "cohere":
+                params["stream"] = True
+            params.update(kwargs)
+
+        with_tools = self.supports_tools and _tools_in_params(params)
+        input_body = LLMInputOutputAdapter.prepare_input(
+            provider=self.provider,
+            model_kwargs=params,
+            prompt=prompt,
+            system=system,
+            messages=messages,
+            tools=params["tools"] if with_tools else None,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+        )
+        return input_body, with_tools
+
+    def request_options(
+        self, input_body: Dict[str, Any], guardrails: bool = True
+    ) -> Dict[str, Any]:
+        """Return the `invoke_model` request options for ``input_body``."""
+        options = self.options if guardrails else self.base_options
+        return {"body": json_dumps(input_body), **options}
+
+
 class BedrockBase(BaseLanguageModel, ABC):
     """Base class for Bedrock models."""
 
@@ -537,6 +780,12 @@ class BedrockBase(BaseLanguageModel, ABC):
     config: Any = None
     """An optional botocore.config.Config instance to pass to the client."""
 
+    region_pool: Optional[RegionPool] = Field(default=None, exclude=True)
+    """Regions to balance calls over and fail over between on throttling, server
+    and connection errors. Calls then use the clients of the pool instead of
+    `client`. See `langchain_aws.region_pool.RegionPool`.
+    """
+
     provider: Optional[str] = None
     """The model provider, e.g., amazon, cohere, ai21, etc. When not supplied, provider
     is extracted from the first part of the model_id e.g. 'amazon' in 
@@ -625,6 +874,8 @@ class BedrockBase(BaseLanguageModel, ABC):
     temperature: Optional[float] = None
     max_tokens: Optional[int] = None
 
+    _request_builder: Optional[_InvokeRequestBuilder] = PrivateAttr(default=None)
+
     @property
     def lc_secrets(self) -> Dict[str, str]:
         return {
@@ -658,7 +909,9 @@ class BedrockBase(BaseLanguageModel, ABC):
             "aws_session_token": self.aws_session_token,
         }
         if creds["aws_access_key_id"] and creds["aws_secret_access_key"]:
-            session_params = {k: v.get_secret_value() for k, v in creds.items() if v}
+            session_params: Dict[str, Any] = {
+                k: v.get_secret_value() for k, v in creds.items() if v
+            }
         elif any(creds.values()):
             raise ValueError(
                 f"If any of aws_access_key_id, aws_secret_access_key, or "
@@ -667,27 +920,20 @@ class BedrockBase(BaseLanguageModel, ABC):
                 f"{(k for k, v in creds.items() if v)}."
             )
         elif self.credentials_profile_name is not None:
-            session_params = {"profile_name": self.credentials_profile_name}
+            session_params = {"credentials_profile_name": self.credentials_profile_name}
         else:
             # use default credentials
             session_params = {}
 
         try:
-            session = boto3.Session(**session_params)
-
-            self.region_name = (
-                self.region_name
-                or os.getenv("AWS_DEFAULT_REGION")
-                or session.region_name
+            self.client = get_client(
+                "bedrock-runtime",
+                region_name=self.region_name or os.getenv("AWS_DEFAULT_REGION"),
+                endpoint_url=self.endpoint_url,
+                config=self.config,
+                **session_params,
             )
-
-            client_params = {
-                "endpoint_url": self.endpoint_url,
-                "config": self.config,
-                "region_name": self.region_name,
-            }
-            client_params = {k: v for k, v in client_params.items() if v}
-            self.client = session.client("bedrock-runtime", **client_params)
+            self.region_name = self.client.meta.region_name
         except ValueError as e:
             raise ValueError(f"Error raised by bedrock service:\n\n{e}") from e
         except Exception as e:
@@ -767,10 +1013,64 @@ class BedrockBase(BaseLanguageModel, ABC):
                 and 'guardrailVersion' keys."
             ) from e
 
+    def _get_request_builder(self) -> _InvokeRequestBuilder:
+        """Return the request builder for the current model configuration."""
+        key = (
+            self.model_id,
+            self.provider,
+            self.model_kwargs,
+            self.max_tokens,
+            self.temperature,
+            self.guardrails,
+        )
+        # Reading private attributes through pydantic's __getattr__ costs more than
+        # building a request, so the cached builder is read from the private dict.
+        builder = (self.__pydantic_private__ or {}).get("_request_builder")
+        if builder is None or builder.key != key:
+            # Copy the mutable fields so in-place changes invalidate the builder.
+            key = (
+                self.model_id,
+                self.provider,
+                copy.deepcopy(self.model_kwargs),
+                self.max_tokens,
+                self.temperature,
+                copy.deepcopy(self.guardrails),
+            )
+            builder = self._request_builder = _InvokeRequestBuilder(self, key)
+        return builder
+
+    def _prepare_input_body(
+        self,
+        prompt: Optional[str] = None,
+        system: Optional[Union[str, List[Dict]]] = None,
+        messages: Optional[List[Dict]] = None,
+        **kwargs: Any,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Return the provider and the model input body."""
+        builder = self._get_request_builder()
+        input_body, _ = builder.input_body(
+            prompt=prompt, system=system, messages=messages, **kwargs
+        )
+        return builder.provider, input_body
+
+    def _prepare_invoke_request(
+        self,
+        prompt: Optional[str] = None,
+        system: Optional[Union[str, List[Dict]]] = None,
+        messages: Optional[List[Dict]] = None,
+        **kwargs: Any,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Return the provider and the `invoke_model` request options."""
+        builder = self._get_request_builder()
+        input_body, _ = builder.input_body(
+            prompt=prompt, system=system, messages=messages, **kwargs
+        )
+        return builder.provider, builder.request_options(input_body)
+
     def _prepare_input_and_invoke(
         self,
         prompt: Optional[str] = None,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict]]] = None,
         messages: Optional[List[Dict]] = None,
         stop: Optional[List[str]] = None,
         run_manager: Optional[CallbackManagerForLLMRun] = None,
@@ -780,70 +1080,38 @@ class BedrockBase(BaseLanguageModel, ABC):
         List[ToolCall],
         Dict[str, Any],
     ]:
-        _model_kwargs = self.model_kwargs or {}
-
-        provider = self._get_provider()
-        params = {**_model_kwargs, **kwargs}
-        if "claude-3" in self._get_model() and _tools_in_params(params):
-            input_body = LLMInputOutputAdapter.prepare_input(
-                provider=provider,
-                model_kwargs=params,
-                prompt=prompt,
-                system=system,
-                messages=messages,
-                tools=params["tools"],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-            )
-        else:
-            input_body = LLMInputOutputAdapter.prepare_input(
-                provider=provider,
-                model_kwargs=params,
-                prompt=prompt,
-                system=system,
-                messages=messages,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
+        with instrument(self, self.model_id, "invoke_model") as call:
+            provider, request_options = self._prepare_invoke_request(
+                prompt=prompt, system=system, messages=messages, **kwargs
             )
-        body = json.dumps(input_body)
-        accept = "application/json"
-        contentType = "application/json"
-
-        request_options = {
-            "body": body,
-            "modelId": self.model_id,
-            "accept": accept,
-            "contentType": contentType,
-        }
-
-        if self._guardrails_enabled:
-            request_options["guardrailIdentifier"] = self.guardrails.get(  # type: ignore[union-attr]
-                "guardrailIdentifier", ""
-            )
-            request_options["guardrailVersion"] = self.guardrails.get(  # type: ignore[union-attr]
-                "guardrailVersion", ""
-            )
-            if self.guardrails.get("trace"):  # type: ignore[union-attr]
-                request_options["trace"] = "ENABLED"
 
-        try:
-            logger.debug(f"Request body sent to bedrock: {request_options}")
-            logger.info("Using Bedrock Invoke API to generate response")
-            response = self.client.invoke_model(**request_options)
-
-            (
-                text,
-                tool_calls,
-                body,
-                usage_info,
-                stop_reason,
-            ) = LLMInputOutputAdapter.prepare_output(provider, response).values()
-            logger.debug(f"Response received from Bedrock: {response}")
-        except Exception as e:
-            logging.error(f"Error raised by bedrock service: {e}")
-            if run_manager is not None:
-                run_manager.on_llm_error(e)
-            raise e
+            try:
+                logger.debug("Request body sent to bedrock: %s", request_options)
+                logger.info("Using Bedrock Invoke API to generate response")
+                with call.request():
+                    response = call_with_rate_limit(
+                        self.model_id,
+                        lambda: call_with_region_pool(
+                            self.region_pool,
+                            self.client,
+                            lambda client: client.invoke_model(**request_options),
+                        ),
+                    )
+                call.record_response(response)
+
+                (
+                    text,
+                    tool_calls,
+                    body,
+                    usage_info,
+                    stop_reason,
+                ) = LLMInputOutputAdapter.prepare_output(provider, response).values()
+                logger.debug("Response received from Bedrock: %s", response)
+            except Exception as e:
+                logging.error(f"Error raised by bedrock service: {e}")
+                if run_manager is not None:
+                    run_manager.on_llm_error(e)
+                raise e
 
         if stop is not None:
             text = enforce_stop_tokens(text, stop)
@@ -865,6 +1133,76 @@ class BedrockBase(BaseLanguageModel, ABC):
 
         return text, tool_calls, llm_output
 
+    async def _aprepare_input_and_invoke(
+        self,
+        prompt: Optional[str] = None,
+        system: Optional[Union[str, List[Dict]]] = None,
+        messages: Optional[List[Dict]] = None,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Tuple[
+        str,
+        List[ToolCall],
+        Dict[str, Any],
+    ]:
+        with instrument(self, self.model_id, "invoke_model") as call:
+            provider, request_options = self._prepare_invoke_request(
+                prompt=prompt, system=system, messages=messages, **kwargs
+            )
+            try:
+                logger.debug("Request body sent to bedrock: %s", request_options)
+                logger.info("Using Bedrock Invoke API to generate response")
+                with call.request():
+                    response = await acall_with_rate_limit(
+                        self.model_id,
+                        lambda: run_in_executor(
+                            None,
+                            lambda: call_with_region_pool(
+                                self.region_pool,
+                                self.client,
+                                lambda client: client.invoke_model(**request_options),
+                            ),
+                        ),
+                    )
+                call.record_response(response)
+
+                # Reading the response body blocks, so it is done in the executor too.
+                (
+                    text,
+                    tool_calls,
+                    body,
+                    usage_info,
+                    stop_reason,
+                ) = (
+                    await run_in_executor(
+                        None, LLMInputOutputAdapter.prepare_output, provider, response
+                    )
+                ).values()
+                logger.debug("Response received from Bedrock: %s", response)
+            except Exception as e:
+                logging.error(f"Error raised by bedrock service: {e}")
+                if run_manager is not None:
+                    await run_manager.on_llm_error(e)
+                raise e
+
+        if stop is not None:
+            text = enforce_stop_tokens(text, stop)
+
+        llm_output = {"usage": usage_info, "stop_reason": stop_reason}
+
+        services_trace = self._get_bedrock_services_signal(body)  # type: ignore[arg-type]
+
+        if run_manager is not None and services_trace.get("signal"):
+            await run_manager.on_llm_error(
+                Exception(
+                    f"Error raised by bedrock service: {services_trace.get('reason')}"
+                ),
+                **services_trace,
+            )
+
+        return text, tool_calls, llm_output
+
     def _get_bedrock_services_signal(self, body: dict) -> dict:
         """
         This function checks the response body for an interrupt flag or message that indicates
@@ -896,158 +1234,121 @@ class BedrockBase(BaseLanguageModel, ABC):
     def _prepare_input_and_invoke_stream(
         self,
         prompt: Optional[str] = None,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict]]] = None,
         messages: Optional[List[Dict]] = None,
         stop: Optional[List[str]] = None,
         run_manager: Optional[CallbackManagerForLLMRun] = None,
         **kwargs: Any,
     ) -> Iterator[Union[GenerationChunk, AIMessageChunk]]:
-        _model_kwargs = self.model_kwargs or {}
-        provider = self._get_provider()
-
-        if stop:
-            if provider not in self.provider_stop_sequence_key_name_map:
-                raise ValueError(
-                    f"Stop sequence key name for {provider} is not supported."
-                )
-
-            # stop sequence from _generate() overrides
-            # stop sequences in the class attribute
-            if k := self.provider_stop_sequence_key_name_map.get(provider):
-                _model_kwargs[k] = stop
-
-        if provider == "cohere":
-            _model_kwargs["stream"] = True
-
-        params = {**_model_kwargs, **kwargs}
-
-        input_body = LLMInputOutputAdapter.prepare_input(
-            provider=provider,
-            prompt=prompt,
-            system=system,
-            messages=messages,
-            model_kwargs=params,
-            max_tokens=self.max_tokens,
-            temperature=self.temperature,
-        )
-        coerce_content_to_string = True
-        if "claude-3" in self._get_model():
-            if _tools_in_params(params):
-                coerce_content_to_string = False
-                input_body = LLMInputOutputAdapter.prepare_input(
-                    provider=provider,
-                    model_kwargs=params,
-                    prompt=prompt,
-                    system=system,
-                    messages=messages,
-                    tools=params["tools"],
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                )
-        body = json.dumps(input_body)
-
-        request_options = {
-            "body": body,
-            "modelId": self.model_id,
-            "accept": "application/json",
-            "contentType": "application/json",
-        }
-
-        if self._guardrails_enabled:
-            request_options["guardrailIdentifier"] = self.guardrails.get(  # type: ignore[union-attr]
-                "guardrailIdentifier", ""
+        with instrument(
+            self, self.model_id, "invoke_model_with_response_stream"
+        ) as call:
+            builder = self._get_request_builder()
+            provider = builder.provider
+            input_body, with_tools = builder.input_body(
+                prompt=prompt,
+                system=system,
+                messages=messages,
+                stop=stop,
+                stream=True,
+                **kwargs,
             )
-            request_options["guardrailVersion"] = self.guardrails.get(  # type: ignore[union-attr]
-                "guardrailVersion", ""
+            coerce_content_to_string = not with_tools
+            request_options = builder.request_options(input_body)
+
+            try:
+                with call.request():
+                    response = call_with_rate_limit(
+                        self.model_id,
+                        lambda: call_with_region_pool(
+                            self.region_pool,
+                            self.client,
+                            lambda client: client.invoke_model_with_response_stream(
+                                **request_options
+                            ),
+                        ),
+                    )
+
+            except Exception as e:
+                logging.error(f"Error raised by bedrock service: {e}")
+                if run_manager is not None:
+                    run_manager.on_llm_error(e)
+                raise e
+
+            chunks = LLMInputOutputAdapter.prepare_output_stream(
+                provider,
+                response,
+                stop,
+                True if messages else False,
+                coerce_content_to_string=coerce_content_to_string,
             )
-            if self.guardrails.get("trace"):  # type: ignore[union-attr]
-                request_options["trace"] = "ENABLED"
-
-        try:
-            response = self.client.invoke_model_with_response_stream(**request_options)
-
-        except Exception as e:
-            logging.error(f"Error raised by bedrock service: {e}")
-            if run_manager is not None:
-                run_manager.on_llm_error(e)
-            raise e
-
-        for chunk in LLMInputOutputAdapter.prepare_output_stream(
-            provider,
-            response,
-            stop,
-            True if messages else False,
-            coerce_content_to_string=coerce_content_to_string,
-        ):
-            yield chunk
-            # verify and raise callback error if any middleware intervened
-            if not isinstance(chunk, AIMessageChunk):
-                self._get_bedrock_services_signal(chunk.generation_info)  # type: ignore[arg-type]
+            with ResponseStreamGuard(response.get("body"), self.max_tokens) as guard:
+                if stop:
+                    chunks = _enforce_stop_sequences(chunks, stop, guard)
+                for chunk in chunks:
+                    guard.chunks_read += 1
+                    _record_chunk(call, chunk, self.model_id)
+                    yield chunk
+                    # verify and raise callback error if any middleware intervened
+                    if not isinstance(chunk, AIMessageChunk):
+                        self._get_bedrock_services_signal(chunk.generation_info)  # type: ignore[arg-type]
+                guard.finish()
 
     async def _aprepare_input_and_invoke_stream(
         self,
         prompt: str,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict]]] = None,
         messages: Optional[List[Dict]] = None,
         stop: Optional[List[str]] = None,
         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
         **kwargs: Any,
     ) -> AsyncIterator[Union[GenerationChunk, AIMessageChunk]]:
-        _model_kwargs = self.model_kwargs or {}
-        provider = self._get_provider()
-
-        if stop:
-            if provider not in self.provider_stop_sequence_key_name_map:
-                raise ValueError(
-                    f"Stop sequence key name for {provider} is not supported."
-                )
-            if k := self.provider_stop_sequence_key_name_map.get(provider):
-                _model_kwargs[k] = stop
-
-        if provider == "cohere":
-            _model_kwargs["stream"] = True
-
-        params = {**_model_kwargs, **kwargs}
-        if "claude-3" in self._get_model() and _tools_in_params(params):
-            input_body = LLMInputOutputAdapter.prepare_input(
-                provider=provider,
-                model_kwargs=params,
-                prompt=prompt,
-                system=system,
-                messages=messages,
-                tools=params["tools"],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-            )
-        else:
-            input_body = LLMInputOutputAdapter.prepare_input(
-                provider=provider,
+        with instrument(
+            self, self.model_id, "invoke_model_with_response_stream"
+        ) as call:
+            builder = self._get_request_builder()
+            provider = builder.provider
+            input_body, _ = builder.input_body(
                 prompt=prompt,
                 system=system,
                 messages=messages,
-                model_kwargs=params,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
+                stop=stop,
+                stream=True,
+                **kwargs,
             )
-        body = json.dumps(input_body)
-
-        response = await asyncio.get_running_loop().run_in_executor(
-            None,
-            lambda: self.client.invoke_model_with_response_stream(
-                body=body,
-                modelId=self.model_id,
-                accept="application/json",
-                contentType="application/json",
-            ),
-        )
+            request_options = builder.request_options(input_body, guardrails=False)
+
+            with call.request():
+                response = await acall_with_rate_limit(
+                    self.model_id,
+                    lambda: run_in_executor(
+                        None,
+                        lambda: call_with_region_pool(
+                            self.region_pool,
+                            self.client,
+                            lambda client: client.invoke_model_with_response_stream(
+                                **request_options
+                            ),
+                        ),
+                    ),
+                )
 
-        async for chunk in LLMInputOutputAdapter.aprepare_output_stream(
-            provider,
-            response,
-            stop,
-            True if messages else False,
-        ):
-            yield chunk
+            chunks = LLMInputOutputAdapter.aprepare_output_stream(
+                provider,
+                response,
+                stop,
+                True if messages else False,
+            )
+            async with ResponseStreamGuard(
+                response.get("body"), self.max_tokens
+            ) as guard:
+                if stop:
+                    chunks = _aenforce_stop_sequences(chunks, stop, guard)
+                async for chunk in chunks:
+                    guard.chunks_read += 1
+                    _record_chunk(call, chunk, self.model_id)
+                    yield chunk
+                guard.finish()
 
 
 class BedrockLLM(LLM, BedrockBase):
@@ -1268,7 +1569,17 @@ class BedrockLLM(LLM, BedrockBase):
         """
 
         if not self.streaming:
-            raise ValueError("Streaming must be set to True for async operations. ")
+            text, tool_calls, llm_output = await self._aprepare_input_and_invoke(
+                prompt=prompt, stop=stop, run_manager=run_manager, **kwargs
+            )
+            if run_manager is not None:
+                await run_manager.on_llm_end(
+                    LLMResult(
+                        generations=[[Generation(text=text)]], llm_output=llm_output
+                    )
+                )
+
+            return text
 
         provider = self._get_provider()
         provider_stop_reason_code = self.provider_stop_reason_key_map.get(
@@ -2,7 +2,6 @@
 
 import io
 import logging
-import re
 from abc import abstractmethod
 from typing import Any, Dict, Generic, Iterator, List, Mapping, Optional, TypeVar, Union
 
@@ -12,15 +11,13 @@ from langchain_core.outputs import GenerationChunk
 from pydantic import ConfigDict, model_validator
 from typing_extensions import Self
 
+from langchain_aws.streams import ResponseStreamGuard
+from langchain_aws.utils import StopSequenceMatcher, enforce_stop_tokens
+
 INPUT_TYPE = TypeVar("INPUT_TYPE", bound=Union[str, List[str]])
 OUTPUT_TYPE = TypeVar("OUTPUT_TYPE", bound=Union[str, List[List[float]], Iterator])
 
 
-def enforce_stop_tokens(text: str, stop: List[str]) -> str:
-    """Cut off the text as soon as any stop words occur."""
-    return re.split("|".join(stop), text, maxsplit=1)[0]
-
-
 class LineIterator:
     """
     A helper class for parsing the byte stream input.
@@ -342,13 +339,32 @@ class SagemakerEndpoint(LLM):
         try:
             resp = self.client.invoke_endpoint_with_response_stream(**invocation_params)
             iterator = LineIterator(resp["Body"])
+            matcher = StopSequenceMatcher(stop) if stop else None
+
+            with ResponseStreamGuard(resp["Body"]) as guard:
+                for line in iterator:
+                    text = self.content_handler.transform_output(line)
+
+                    if matcher is not None:
+                        text, stopped = matcher.feed(text)
+                        if stopped:
+                            # Stop reading so the endpoint stops streaming
+                            guard.cancel()
+
+                    if text:
+                        guard.chunks_read += 1
+                        chunk = GenerationChunk(text=text)
+                        yield chunk
+                        if run_manager:
+                            run_manager.on_llm_new_token(chunk.text)
 
-            for line in iterator:
-                text = self.content_handler.transform_output(line)
+                    if matcher is not None and matcher.stopped:
+                        return
 
-                if stop is not None:
-                    text = enforce_stop_tokens(text, stop)
+                guard.finish()
 
+            if matcher is not None:
+                text = matcher.flush()
                 if text:
                     chunk = GenerationChunk(text=text)
                     yield chunk
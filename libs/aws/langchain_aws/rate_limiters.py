@@ -0,0 +1,287 @@
+"""Client-side rate limiting and throttling retries for Bedrock model calls.
+
+A `BedrockRateLimiter` registered for a model id with `set_model_rate_limiter` is
+shared by every `BedrockLLM`, `ChatBedrock`, `ChatBedrockConverse` and
+`BedrockEmbeddings` instance in the process that calls that model. Throttled calls
+are retried by botocore according to the client's `retries` configuration. A rate
+limiter created with `max_retries` additionally retries the calls that botocore gave
+up on, with a jittered exponential backoff. Calls to models without a rate limiter
+are made as is.
+
+Example:
+    .. code-block:: python
+
+        from langchain_aws import BedrockEmbeddings
+        from langchain_aws.rate_limiters import (
+            BedrockRateLimiter,
+            set_model_rate_limiter,
+        )
+
+        set_model_rate_limiter(
+            "amazon.titan-embed-text-v2:0",
+            BedrockRateLimiter(requests_per_second=50, tokens_per_minute=300_000),
+        )
+        embeddings = BedrockEmbeddings(
+            model_id="amazon.titan-embed-text-v2:0", max_concurrency=32
+        )
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from langchain_aws.instrumentation import record_retry
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "ServiceUnavailableException",
+        "ModelNotReadyException",
+    }
+)
+THROTTLING_STATUS_CODES = frozenset({429, 503})
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Whether ``error`` is a botocore error signalling throttling or overload."""
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return False
+    if response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+        return True
+    status_code = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return status_code in THROTTLING_STATUS_CODES
+
+
+class _TokenBucket:
+    """Bucket refilled at a constant rate that may be drawn below zero."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.available = capacity
+        self.last_refill = time.monotonic()
+
+    def refill(self, rate_factor: float) -> None:
+        now = time.monotonic()
+        self.available = min(
+            self.capacity,
+            self.available + (now - self.last_refill) * self.rate * rate_factor,
+        )
+        self.last_refill = now
+
+
+class BedrockRateLimiter(BaseRateLimiter):
+    """Token-bucket rate limiter for Bedrock model calls.
+
+    Limits the request rate and, once responses report their token usage, the
+    token throughput. When Bedrock throttles a request, the allowed rates are halved
+    and recover gradually with each successful call.
+
+    Args:
+        requests_per_second: Maximum sustained request rate. No limit if None.
+        tokens_per_minute: Maximum sustained input plus output token rate. No limit
+            if None.
+        max_retries: How many times a call still throttled after botocore's own
+            retries is retried before the error is raised. Defaults to 0, which
+            leaves retrying to the client's botocore `retries` configuration.
+        initial_backoff: Upper bound in seconds of the first retry delay. The bound
+            doubles with every retry.
+        max_backoff: Upper bound in seconds of any retry delay.
+        check_every_n_seconds: How often a blocked caller checks for capacity.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = 0,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        check_every_n_seconds: float = 0.05,
+    ) -> None:
+        self._requests = (
+            _TokenBucket(requests_per_second, max(1.0, requests_per_second))
+            if requests_per_second
+            else None
+        )
+        self._tokens = (
+            _TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+            if tokens_per_minute
+            else None
+        )
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.check_every_n_seconds = check_every_n_seconds
+        self._rate_factor = 1.0
+        self._lock = threading.Lock()
+
+    def _consume(self) -> bool:
+        with self._lock:
+            for bucket in (self._requests, self._tokens):
+                if bucket:
+                    bucket.refill(self._rate_factor)
+            if self._requests and self._requests.available < 1:
+                return False
+            if self._tokens and self._tokens.available <= 0:
+                return False
+            if self._requests:
+                self._requests.available -= 1
+            return True
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        if not blocking:
+            return self._consume()
+        while not self._consume():
+            time.sleep(self.check_every_n_seconds)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        if not blocking:
+            return self._consume()
+        while not self._consume():
+            await asyncio.sleep(self.check_every_n_seconds)
+        return True
+
+    def record_usage(self, tokens: int) -> None:
+        """Draw the tokens used by a completed call from the token budget."""
+        if self._tokens and tokens:
+            with self._lock:
+                self._tokens.refill(self._rate_factor)
+                self._tokens.available -= tokens
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._rate_factor = min(1.0, self._rate_factor + 0.05)
+
+    def record_throttle(self) -> None:
+        with self._lock:
+            self._rate_factor = max(0.05, self._rate_factor / 2)
+
+    def backoff(self, attempt: int) -> float:
+        """Delay in seconds before retry number ``attempt``, counting from zero."""
+        return random.uniform(
+            0, min(self.max_backoff, self.initial_backoff * 2**attempt)
+        )
+
+
+_MODEL_RATE_LIMITERS: Dict[str, BedrockRateLimiter] = {}
+_MODEL_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def set_model_rate_limiter(
+    model_id: str, rate_limiter: Optional[BedrockRateLimiter]
+) -> None:
+    """Share ``rate_limiter`` between all calls to ``model_id`` in this process.
+
+    Passing None removes the rate limiter registered for the model.
+    """
+    with _MODEL_RATE_LIMITERS_LOCK:
+        if rate_limiter is None:
+            _MODEL_RATE_LIMITERS.pop(model_id, None)
+        else:
+            _MODEL_RATE_LIMITERS[model_id] = rate_limiter
+
+
+def get_model_rate_limiter(model_id: str) -> Optional[BedrockRateLimiter]:
+    """Return the rate limiter registered for ``model_id``, if any."""
+    return _MODEL_RATE_LIMITERS.get(model_id)
+
+
+def _response_token_count(response: Any) -> int:
+    """Total tokens reported by an InvokeModel or Converse response."""
+    if not isinstance(response, dict):
+        return 0
+    if usage := response.get("usage"):
+        return usage.get("totalTokens", 0)
+    headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+    return int(headers.get("x-amzn-bedrock-input-token-count", 0)) + int(
+        headers.get("x-amzn-bedrock-output-token-count", 0)
+    )
+
+
+def record_model_usage(model_id: str, tokens: int) -> None:
+    """Charge ``tokens`` to the rate limiter registered for ``model_id``, if any.
+
+    Streaming responses only report their token usage in the last event of the
+    stream, so streaming calls charge it here once that event arrives.
+    """
+    rate_limiter = get_model_rate_limiter(model_id)
+    if rate_limiter is not None:
+        rate_limiter.record_usage(tokens)
+
+
+def call_with_rate_limit(model_id: str, func: Callable[[], _T]) -> _T:
+    """Call ``func`` under the rate limiter registered for ``model_id``, if any.
+
+    Throttling errors are retried with backoff up to the rate limiter's
+    ``max_retries``, other errors are raised immediately. Without a registered
+    rate limiter, ``func`` is simply called.
+    """
+    rate_limiter = get_model_rate_limiter(model_id)
+    if rate_limiter is None:
+        return func()
+
+    attempt = 0
+    while True:
+        rate_limiter.acquire()
+        try:
+            result = func()
+        except Exception as e:
+            if not is_throttling_error(e):
+                raise
+            rate_limiter.record_throttle()
+            if attempt >= rate_limiter.max_retries:
+                raise
+            record_retry(throttled=True)
+            delay = rate_limiter.backoff(attempt)
+            logger.warning(f"Bedrock throttled {model_id}, retrying in {delay:.2f}s")
+            time.sleep(delay)
+            attempt += 1
+            continue
+        rate_limiter.record_success()
+        rate_limiter.record_usage(_response_token_count(result))
+        return result
+
+
+async def acall_with_rate_limit(model_id: str, func: Callable[[], Awaitable[_T]]) -> _T:
+    """Await ``func`` under the rate limiter registered for ``model_id``, if any.
+
+    Async counterpart of `call_with_rate_limit`.
+    """
+    rate_limiter = get_model_rate_limiter(model_id)
+    if rate_limiter is None:
+        return await func()
+
+    attempt = 0
+    while True:
+        await rate_limiter.aacquire()
+        try:
+            result = await func()
+        except Exception as e:
+            if not is_throttling_error(e):
+                raise
+            rate_limiter.record_throttle()
+            if attempt >= rate_limiter.max_retries:
+                raise
+            record_retry(throttled=True)
+            delay = rate_limiter.backoff(attempt)
+            logger.warning(f"Bedrock throttled {model_id}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        rate_limiter.record_success()
+        rate_limiter.record_usage(_response_token_count(result))
+        return result
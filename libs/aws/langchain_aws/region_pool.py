@@ -0,0 +1,208 @@
+"""Load balancing and failover of Bedrock calls across regions.
+
+A `RegionPool` spreads the calls of `ChatBedrockConverse`, `ChatBedrock`,
+`BedrockLLM` and `BedrockEmbeddings` over several regions, which adds up their
+quotas. Regions are picked by smooth weighted round-robin, weighted by their
+observed latency and throttling rate. A call that is throttled, fails with a
+server error or cannot connect is retried in the next region, and the failed
+region is skipped for a cool-down period.
+
+Example:
+    .. code-block:: python
+
+        from langchain_aws import ChatBedrockConverse
+        from langchain_aws.region_pool import RegionPool
+
+        llm = ChatBedrockConverse(
+            model="anthropic.claude-3-5-sonnet-20240620-v1:0",
+            region_pool=RegionPool(["us-east-1", "us-west-2", "us-east-2"]),
+        )
+"""
+
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from botocore.exceptions import ConnectionError as BotoConnectionError
+from botocore.exceptions import HTTPClientError
+
+from langchain_aws.clients import get_client
+from langchain_aws.instrumentation import record_retry
+from langchain_aws.rate_limiters import is_throttling_error
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def is_failover_error(error: BaseException) -> bool:
+    """Whether ``error`` should be retried in another region.
+
+    These are throttling errors, server errors and connection failures.
+    """
+    if isinstance(error, (BotoConnectionError, HTTPClientError)):
+        return True
+    if is_throttling_error(error):
+        return True
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return False
+    status_code = response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+    return status_code >= 500
+
+
+class _RegionState:
+    """Health of one region of a pool."""
+
+    def __init__(self, region_name: str, client: Any) -> None:
+        self.region_name = region_name
+        self.client = client
+        self.latency: Optional[float] = None
+        self.throttle_rate = 0.0
+        self.unavailable_until = 0.0
+        self.current_weight = 0.0
+
+
+class RegionPool:
+    """A set of regions to balance Bedrock calls over and fail over between.
+
+    Args:
+        regions: Names of the regions in the pool.
+        service_name: Service of the clients, "bedrock-runtime" for model calls.
+        clients: Clients by region name, for regions that should not use a client
+            from `langchain_aws.clients.get_client`, e.g. with another endpoint.
+        credentials_profile_name: Profile the pool's clients authenticate with.
+        config: Optional botocore config of the pool's clients.
+        cooldown: Seconds a region is skipped after a failed call.
+        smoothing: Weight of the latest call in the moving averages of a region's
+            latency and throttling rate.
+    """
+
+    def __init__(
+        self,
+        regions: Sequence[str],
+        *,
+        service_name: str = "bedrock-runtime",
+        clients: Optional[Mapping[str, Any]] = None,
+        credentials_profile_name: Optional[str] = None,
+        config: Any = None,
+        cooldown: float = 30.0,
+        smoothing: float = 0.2,
+    ) -> None:
+        if not regions:
+            raise ValueError("A region pool needs at least one region.")
+        clients = clients or {}
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self._regions: Dict[str, _RegionState] = {
+            region: _RegionState(
+                region,
+                clients.get(region)
+                or get_client(
+                    service_name,
+                    region_name=region,
+                    credentials_profile_name=credentials_profile_name,
+                    config=config,
+                ),
+            )
+            for region in regions
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def regions(self) -> List[str]:
+        return list(self._regions)
+
+    def _weight(self, state: _RegionState, default_latency: float) -> float:
+        latency = state.latency if state.latency is not None else default_latency
+        return (1.0 - state.throttle_rate) / max(latency, 1e-3) + 1e-6
+
+    def _select(self) -> List[_RegionState]:
+        """Return the regions to try, the round-robin pick first."""
+        with self._lock:
+            now = time.monotonic()
+            states = list(self._regions.values())
+            available = [s for s in states if s.unavailable_until <= now]
+            if not available:
+                # Every region failed recently, try the one that recovers first
+                available = [min(states, key=lambda s: s.unavailable_until)]
+            latencies = [s.latency for s in states if s.latency is not None]
+            default_latency = sum(latencies) / len(latencies) if latencies else 1.0
+            weights = {
+                s.region_name: self._weight(s, default_latency) for s in available
+            }
+            total = sum(weights.values())
+            for state in available:
+                state.current_weight += weights[state.region_name]
+            selected = max(available, key=lambda s: s.current_weight)
+            selected.current_weight -= total
+            fallbacks = sorted(
+                (s for s in states if s is not selected),
+                key=lambda s: (
+                    s.unavailable_until > now,
+                    -self._weight(s, default_latency),
+                ),
+            )
+        return [selected, *fallbacks]
+
+    def record_success(self, region_name: str, latency: float) -> None:
+        with self._lock:
+            state = self._regions[region_name]
+            state.latency = (
+                latency
+                if state.latency is None
+                else state.latency + self.smoothing * (latency - state.latency)
+            )
+            state.throttle_rate -= self.smoothing * state.throttle_rate
+
+    def record_failure(self, region_name: str) -> None:
+        with self._lock:
+            state = self._regions[region_name]
+            state.throttle_rate += self.smoothing * (1.0 - state.throttle_rate)
+            state.unavailable_until = time.monotonic() + self.cooldown
+
+    def call(self, func: Callable[[Any], _T]) -> _T:
+        """Call ``func`` with the client of a region, failing over on errors.
+
+        Errors for which `is_failover_error` is false are raised right away,
+        otherwise the error of the last region tried is raised.
+        """
+        states = self._select()
+        for i, state in enumerate(states):
+            start = time.monotonic()
+            try:
+                result = func(state.client)
+            except Exception as e:
+                if not is_failover_error(e):
+                    raise
+                self.record_failure(state.region_name)
+                if i == len(states) - 1:
+                    raise
+                record_retry(throttled=is_throttling_error(e))
+                logger.warning(
+                    f"Bedrock call in {state.region_name} failed, failing over to "
+                    f"{states[i + 1].region_name}: {e}"
+                )
+                continue
+            self.record_success(state.region_name, time.monotonic() - start)
+            return result
+        raise AssertionError("unreachable")
+
+
+def call_with_region_pool(
+    region_pool: Optional[RegionPool], client: Any, func: Callable[[Any], _T]
+) -> _T:
+    """Call ``func`` with a client of ``region_pool``, or with ``client`` if None."""
+    if region_pool is None:
+        return func(client)
+    return region_pool.call(func)
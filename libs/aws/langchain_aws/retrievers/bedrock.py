@@ -1,7 +1,6 @@
 import json
 from typing import Any, Dict, List, Literal, Optional, Union
 
-import boto3
 from botocore.client import Config
 from botocore.exceptions import UnknownServiceError
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
@@ -10,6 +9,8 @@ from langchain_core.retrievers import BaseRetriever
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing_extensions import Annotated
 
+from langchain_aws.clients import get_client
+
 FilterValue = Union[Dict[str, Any], List[Any], int, float, str, bool, None]
 Filter = Dict[str, FilterValue]
 
@@ -99,24 +100,15 @@ class AmazonKnowledgeBasesRetriever(BaseRetriever):
             return values
 
         try:
-            if values.get("credentials_profile_name"):
-                session = boto3.Session(profile_name=values["credentials_profile_name"])
-            else:
-                # use default credentials
-                session = boto3.Session()
-
-            client_params = {
-                "config": Config(
+            values["client"] = get_client(
+                "bedrock-agent-runtime",
+                region_name=values.get("region_name"),
+                credentials_profile_name=values.get("credentials_profile_name"),
+                endpoint_url=values.get("endpoint_url"),
+                config=Config(
                     connect_timeout=120, read_timeout=120, retries={"max_attempts": 0}
-                )
-            }
-            if values.get("region_name"):
-                client_params["region_name"] = values["region_name"]
-
-            if values.get("endpoint_url"):
-                client_params["endpoint_url"] = values["endpoint_url"]
-
-            values["client"] = session.client("bedrock-agent-runtime", **client_params)
+                ),
+            )
 
             return values
         except ImportError:
@@ -384,19 +384,13 @@ class AmazonKendraRetriever(BaseRetriever):
             return values
 
         try:
-            import boto3
+            from langchain_aws.clients import get_client
 
-            if values.get("credentials_profile_name"):
-                session = boto3.Session(profile_name=values["credentials_profile_name"])
-            else:
-                # use default credentials
-                session = boto3.Session()
-
-            client_params = {}
-            if values.get("region_name"):
-                client_params["region_name"] = values["region_name"]
-
-            values["client"] = session.client("kendra", **client_params)
+            values["client"] = get_client(
+                "kendra",
+                region_name=values.get("region_name"),
+                credentials_profile_name=values.get("credentials_profile_name"),
+            )
 
             return values
         except ImportError:
@@ -0,0 +1,114 @@
+"""JSON serialization of Bedrock request and response bodies.
+
+Bodies are encoded and decoded with orjson or msgspec when one of them is installed,
+and with the standard library otherwise. Use `set_json_serializer` to choose an
+implementation explicitly or to plug in another one.
+
+Example:
+    .. code-block:: python
+
+        from langchain_aws.serializers import set_json_serializer
+
+        set_json_serializer("json")
+"""
+
+import functools
+import json
+from typing import Any, Callable, NamedTuple, Union
+
+JsonInput = Union[str, bytes, bytearray]
+
+
+class JsonSerializer(NamedTuple):
+    """A pair of JSON encoding and decoding functions."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    """Encode an object as UTF-8 JSON."""
+    loads: Callable[[JsonInput], Any]
+    """Decode JSON from text or UTF-8 bytes."""
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    return json.dumps(obj).encode()
+
+
+def _stdlib_serializer() -> JsonSerializer:
+    return JsonSerializer("json", _json_dumps_bytes, json.loads)
+
+
+def _orjson_serializer() -> JsonSerializer:
+    import orjson
+
+    return JsonSerializer(
+        "orjson",
+        functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS),
+        orjson.loads,
+    )
+
+
+def _msgspec_serializer() -> JsonSerializer:
+    import msgspec
+
+    return JsonSerializer(
+        "msgspec", msgspec.json.Encoder().encode, msgspec.json.Decoder().decode
+    )
+
+
+_SERIALIZERS = {
+    "orjson": _orjson_serializer,
+    "msgspec": _msgspec_serializer,
+    "json": _stdlib_serializer,
+}
+
+
+def _default_serializer() -> JsonSerializer:
+    for create_serializer in _SERIALIZERS.values():
+        try:
+            return create_serializer()
+        except ImportError:
+            continue
+    return _stdlib_serializer()
+
+
+_serializer = _default_serializer()
+
+
+def get_json_serializer() -> JsonSerializer:
+    """Return the JSON serializer in use."""
+    return _serializer
+
+
+def set_json_serializer(serializer: Union[str, JsonSerializer]) -> None:
+    """Set the JSON serializer used for Bedrock request and response bodies.
+
+    Args:
+        serializer: One of "orjson", "msgspec" and "json", or a custom
+            `JsonSerializer`.
+    """
+    global _serializer
+    if isinstance(serializer, JsonSerializer):
+        _serializer = serializer
+        return
+    if serializer not in _SERIALIZERS:
+        raise ValueError(
+            f"Unknown JSON serializer {serializer!r}, expected one of "
+            f"{list(_SERIALIZERS)} or a JsonSerializer."
+        )
+    try:
+        _serializer = _SERIALIZERS[serializer]()
+    except ImportError as e:
+        raise ImportError(
+            f"Could not import {serializer} python package. "
+            f"Please install it with `pip install {serializer}`."
+        ) from e
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON with the current serializer."""
+    return _serializer.dumps(obj)
+
+
+def json_loads(data: JsonInput) -> Any:
+    """Decode JSON text or UTF-8 bytes with the current serializer."""
+    return _serializer.loads(data)
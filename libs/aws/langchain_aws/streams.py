@@ -0,0 +1,138 @@
+"""Cancellation of abandoned Bedrock and SageMaker response streams.
+
+A model keeps streaming its output until the response stream is read to the end or
+closed, so a consumer that stops iterating early still occupies the connection for
+the rest of the output. The streaming paths wrap the response stream in a
+`ResponseStreamGuard`, which closes the stream as soon as its consumer stops early,
+its task is cancelled or it fails, and records the cancellation.
+
+Example:
+    .. code-block:: python
+
+        from langchain_aws.streams import get_stream_cancellation_metrics
+
+        for chunk in llm.stream("Write a story."):
+            if is_enough(chunk):
+                break
+
+        get_stream_cancellation_metrics()
+        # StreamCancellationMetrics(cancelled_streams=1, tokens_saved=1938)
+"""
+
+import inspect
+import logging
+import threading
+from types import TracebackType
+from typing import Any, NamedTuple, Optional, Type
+
+logger = logging.getLogger(__name__)
+
+
+class StreamCancellationMetrics(NamedTuple):
+    """Counts of the response streams closed before their end."""
+
+    cancelled_streams: int
+    """Number of response streams closed before their end."""
+    tokens_saved: int
+    """Estimate of the output tokens not read from cancelled streams.
+
+    For each cancelled request with a `max_tokens` limit, the limit minus the chunks
+    read, as each streamed chunk holds about one token. Requests without a limit are
+    not included."""
+
+
+_lock = threading.Lock()
+_cancelled_streams = 0
+_tokens_saved = 0
+
+
+def get_stream_cancellation_metrics() -> StreamCancellationMetrics:
+    """Return the stream cancellation counts of this process."""
+    with _lock:
+        return StreamCancellationMetrics(_cancelled_streams, _tokens_saved)
+
+
+def reset_stream_cancellation_metrics() -> None:
+    """Reset the stream cancellation counts to zero."""
+    global _cancelled_streams, _tokens_saved
+    with _lock:
+        _cancelled_streams = 0
+        _tokens_saved = 0
+
+
+def _record_cancellation(chunks_read: int, max_tokens: Optional[int]) -> None:
+    global _cancelled_streams, _tokens_saved
+    with _lock:
+        _cancelled_streams += 1
+        if max_tokens:
+            _tokens_saved += max(max_tokens - chunks_read, 0)
+
+
+class ResponseStreamGuard:
+    """Closes a response stream that is not read to its end.
+
+    Use it as a context manager around the iteration over the stream, count the
+    chunks read in `chunks_read` and call `finish` once the stream has ended.
+    Leaving the context before that, e.g. because the consumer closed the
+    generator, the task was cancelled or an error was raised, cancels the stream.
+    """
+
+    def __init__(self, stream: Any, max_tokens: Optional[int] = None) -> None:
+        self.stream = stream
+        self.max_tokens = max_tokens
+        self.chunks_read = 0
+        self.done = False
+
+    def finish(self) -> None:
+        """Mark the stream as read to its end."""
+        self.done = True
+
+    def _close(self) -> Any:
+        self.done = True
+        close = getattr(self.stream, "close", None)
+        if close is None:
+            return None
+        logger.debug(f"Cancelling response stream after {self.chunks_read} chunks")
+        _record_cancellation(self.chunks_read, self.max_tokens)
+        try:
+            return close()
+        except Exception as e:
+            logger.debug(f"Error closing response stream: {e}")
+            return None
+
+    def cancel(self) -> None:
+        """Close the stream unless it already ended."""
+        if not self.done:
+            self._close()
+
+    async def acancel(self) -> None:
+        """Close the stream unless it already ended, awaiting async streams."""
+        if not self.done:
+            result = self._close()
+            if inspect.isawaitable(result):
+                try:
+                    await result
+                except Exception as e:
+                    logger.debug(f"Error closing response stream: {e}")
+
+    def __enter__(self) -> "ResponseStreamGuard":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.cancel()
+
+    async def __aenter__(self) -> "ResponseStreamGuard":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.acancel()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING, Any, List, Optional, Pattern
+from typing import TYPE_CHECKING, Any, List, Optional, Pattern, Union
 
 import numpy as np
 
@@ -12,8 +12,10 @@ if TYPE_CHECKING:
     from redis.client import Redis as RedisType  # type: ignore[import-untyped]
 
 
-def _array_to_buffer(array: List[float], dtype: Any = np.float32) -> bytes:
-    return np.array(array).astype(dtype).tobytes()
+def _array_to_buffer(
+    array: Union[List[float], np.ndarray], dtype: Any = np.float32
+) -> bytes:
+    return np.asarray(array, dtype=dtype).tobytes()
 
 
 def _buffer_to_array(buffer: bytes, dtype: Any = np.float32) -> List[float]:
@@ -1,12 +1,129 @@
+import functools
 import re
-from typing import Any, List
+from collections import deque
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple
 
 from packaging import version
 
 
+@functools.lru_cache(maxsize=128)
+def _stop_pattern(stop: Tuple[str, ...]) -> Pattern:
+    return re.compile("|".join(stop))
+
+
 def enforce_stop_tokens(text: str, stop: List[str]) -> str:
     """Cut off the text as soon as any stop words occur."""
-    return re.split("|".join(stop), text, maxsplit=1)[0]
+    return _stop_pattern(tuple(stop)).split(text, maxsplit=1)[0]
+
+
+class StopSequenceMatcher:
+    """Find stop sequences in text that is streamed in chunks.
+
+    The end of a chunk that could be the start of a stop sequence is held back until
+    the following chunks decide it, so stop sequences split across chunks are found
+    too. Matching runs an Aho-Corasick automaton over the stop sequences, which
+    looks at each character once however many stop sequences there are. Like
+    `enforce_stop_tokens`, the text is cut before the stop sequence that starts
+    first, so a match is only final once no earlier starting stop sequence can
+    still complete.
+
+    Example:
+        .. code-block:: python
+
+            matcher = StopSequenceMatcher(["Human:"])
+            matcher.feed("Sure. Hu")  # ("Sure. ", False)
+            matcher.feed("man: next")  # ("", True)
+    """
+
+    def __init__(self, stop: Sequence[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail = [0]
+        self._depth = [0]
+        # Length of the longest stop sequence ending in each state, 0 if none
+        self._match = [0]
+        for sequence in stop:
+            if not sequence:
+                continue
+            state = 0
+            for char in sequence:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._depth.append(self._depth[state] + 1)
+                    self._match.append(0)
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._match[state] = len(sequence)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._match[next_state] = max(
+                    self._match[next_state], self._match[self._fail[next_state]]
+                )
+
+        self._state = 0
+        self._pending = ""
+        # Start in the held back text of the leftmost stop sequence found so far
+        self._cut: Optional[int] = None
+        self.stopped = False
+        """Whether a stop sequence was found."""
+
+    def feed(self, text: str) -> Tuple[str, bool]:
+        """Consume the next chunk of text.
+
+        Returns:
+            The text that can be emitted so far, and whether a stop sequence was
+            found. Once a stop sequence is found, the text ends right before it and
+            all further text is dropped.
+        """
+        if self.stopped:
+            return "", True
+        goto, fail, match, depth = self._goto, self._fail, self._match, self._depth
+        state, cut = self._state, self._cut
+        consumed = self._pending + text
+        offset = len(self._pending)
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            end = offset + i + 1
+            if match[state] and (cut is None or end - match[state] < cut):
+                cut = end - match[state]
+            # Final once no stop sequence starting before the cut is in progress
+            if cut is not None and end - depth[state] >= cut:
+                self.stopped = True
+                self._pending = ""
+                self._cut = None
+                return consumed[:cut], True
+
+        self._state = state
+        split = len(consumed) - depth[state]
+        self._pending = consumed[split:]
+        self._cut = None if cut is None else cut - split
+        return consumed[:split], False
+
+    def flush(self) -> str:
+        """Return the held back text, e.g. once the stream has ended.
+
+        A stop sequence found in the held back text cuts it off as in `feed`.
+        Otherwise, text fed afterwards is matched as if it started a new stream.
+        """
+        pending, self._pending = self._pending, ""
+        self._state = 0
+        if self._cut is not None:
+            pending = pending[: self._cut]
+            self._cut = None
+            self.stopped = True
+        return pending
 
 
 def anthropic_tokens_supported() -> bool:
@@ -646,7 +646,7 @@ class InMemoryVectorStore(VectorStore):
         self,
         texts: Iterable[str],
         metadatas: Optional[List[dict]] = None,
-        embeddings: Optional[List[List[float]]] = None,
+        embeddings: Optional[Union[List[List[float]], np.ndarray]] = None,
         batch_size: int = 1000,
         clean_metadata: bool = True,
         **kwargs: Any,
@@ -657,8 +657,9 @@ class InMemoryVectorStore(VectorStore):
             texts (Iterable[str]): Iterable of strings/text to add to the vectorstore.
             metadatas (Optional[List[dict]], optional): Optional list of metadatas.
                 Defaults to None.
-            embeddings (Optional[List[List[float]]], optional): Optional pre-generated
-                embeddings. Defaults to None.
+            embeddings (Optional[Union[List[List[float]], np.ndarray]], optional):
+                Optional pre-generated embeddings, e.g. the matrix returned by
+                `BedrockEmbeddings.embed_documents_array`. Defaults to None.
             keys (List[str]) or ids (List[str]): Identifiers of entries.
                 Defaults to None.
             batch_size (int, optional): Batch size to use for writes. Defaults to 1000.
@@ -679,7 +680,8 @@ class InMemoryVectorStore(VectorStore):
             if not (isinstance(metadatas, list) and isinstance(metadatas[0], dict)):
                 raise ValueError("Metadatas must be a list of dicts")
 
-        embeddings = embeddings or self._embeddings.embed_documents(list(texts))
+        if embeddings is None or len(embeddings) == 0:
+            embeddings = self._embeddings.embed_documents(list(texts))
         self._create_index_if_not_exist(dim=len(embeddings[0]))
 
         # Write data to InMemoryVectorStore
@@ -0,0 +1,118 @@
+"""Micro-benchmark of converting Converse content between LangChain and Bedrock keys.
+
+Compares the key conversion as it used to be, compiling the case regex on every key
+and walking into tool arguments and tool results, with the cached conversion that
+passes those payloads through, on a long conversation with tool calls.
+
+Usage: python scripts/benchmark_key_conversion.py
+"""
+
+import re
+import timeit
+from typing import Any, List
+
+from langchain_aws.chat_models.bedrock_converse import (
+    _OPAQUE_KEYS,
+    _bedrock_to_lc,
+    _camel_to_snake_keys,
+    _lc_content_to_bedrock,
+    _snake_to_camel_keys,
+)
+
+NUMBER = 200
+REPEAT = 5
+TURNS = 50
+
+RECORDS = [
+    {"recordId": i, "customerName": f"name {i}", "orderTotal": i * 1.5, "tags": []}
+    for i in range(100)
+]
+
+
+def legacy_camel_to_snake_keys(obj: Any) -> Any:
+    if isinstance(obj, list):
+        return [legacy_camel_to_snake_keys(e) for e in obj]
+    elif isinstance(obj, dict):
+        pattern = r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])"
+        return {
+            re.compile(pattern).sub("_", k).lower(): legacy_camel_to_snake_keys(v)
+            for k, v in obj.items()
+        }
+    return obj
+
+
+def legacy_snake_to_camel_keys(obj: Any) -> Any:
+    if isinstance(obj, list):
+        return [legacy_snake_to_camel_keys(e) for e in obj]
+    elif isinstance(obj, dict):
+        converted = {}
+        for k, v in obj.items():
+            split = k.split("_")
+            key = "".join(split[:1] + [s.title() for s in split[1:]])
+            converted[key] = legacy_snake_to_camel_keys(v)
+        return converted
+    return obj
+
+
+def conversation() -> List[Any]:
+    content = []
+    for turn in range(TURNS):
+        content.append(
+            {
+                "toolUse": {
+                    "toolUseId": f"tool-{turn}",
+                    "name": "search_orders",
+                    "input": {"customerName": "name", "maxResults": 100},
+                }
+            }
+        )
+        content.append(
+            {
+                "toolResult": {
+                    "toolUseId": f"tool-{turn}",
+                    "content": [{"json": {"records": RECORDS}}],
+                    "status": "success",
+                }
+            }
+        )
+        content.append({"text": "Summarize the orders above. " * 20})
+    return content
+
+
+def main() -> None:
+    bedrock_content = conversation()
+    lc_content = _bedrock_to_lc(bedrock_content)
+    assert _lc_content_to_bedrock(lc_content) == bedrock_content
+
+    for label, legacy, cached, content in [
+        (
+            "bedrock to lc",
+            legacy_camel_to_snake_keys,
+            _camel_to_snake_keys,
+            bedrock_content,
+        ),
+        (
+            "lc to bedrock",
+            legacy_snake_to_camel_keys,
+            _snake_to_camel_keys,
+            lc_content,
+        ),
+    ]:
+        before = min(
+            timeit.repeat(lambda: legacy(content), number=NUMBER, repeat=REPEAT)
+        )
+        after = min(
+            timeit.repeat(
+                lambda: cached(content, excluded_keys=_OPAQUE_KEYS),
+                number=NUMBER,
+                repeat=REPEAT,
+            )
+        )
+        print(  # noqa: T201
+            f"{label} ({TURNS} turns): legacy {before / NUMBER * 1e3:.2f}ms, "
+            f"cached {after / NUMBER * 1e3:.2f}ms ({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Micro-benchmark of building Bedrock `invoke_model` requests.
+
+Compares building the request from the model fields on every call, as the invoke
+paths used to, with the request builder cached on the model instance. Both sides
+serialize the body with the same serializer, so only the request building is
+compared.
+
+Usage: python scripts/benchmark_request_builder.py
+"""
+
+import json
+import timeit
+from unittest.mock import MagicMock
+
+from langchain_aws import ChatBedrock
+from langchain_aws.function_calling import _tools_in_params
+from langchain_aws.llms.bedrock import LLMInputOutputAdapter
+from langchain_aws.serializers import json_dumps
+
+NUMBER = 20_000
+REPEAT = 5
+
+MESSAGES = [{"role": "user", "content": "Summarize the following record: ..."}]
+TOOLS = [
+    {
+        "name": "get_weather",
+        "description": "Get the weather for a location.",
+        "input_schema": {
+            "type": "object",
+            "properties": {"location": {"type": "string"}},
+            "required": ["location"],
+        },
+    }
+]
+
+
+def per_call_request(llm: ChatBedrock, **kwargs):  # type: ignore[no-untyped-def]
+    provider = llm._get_provider()
+    params = {**(llm.model_kwargs or {}), **kwargs}
+    input_body = LLMInputOutputAdapter.prepare_input(
+        provider=provider,
+        model_kwargs=params,
+        messages=MESSAGES,
+        max_tokens=llm.max_tokens,
+        temperature=llm.temperature,
+    )
+    if "claude-3" in llm._get_model() and _tools_in_params(params):
+        input_body = LLMInputOutputAdapter.prepare_input(
+            provider=provider,
+            model_kwargs=params,
+            messages=MESSAGES,
+            tools=params["tools"],
+            max_tokens=llm.max_tokens,
+            temperature=llm.temperature,
+        )
+    request_options = {
+        "body": json_dumps(input_body),
+        "modelId": llm.model_id,
+        "accept": "application/json",
+        "contentType": "application/json",
+    }
+    if llm._guardrails_enabled:
+        request_options["guardrailIdentifier"] = llm.guardrails["guardrailIdentifier"]  # type: ignore[index]
+        request_options["guardrailVersion"] = llm.guardrails["guardrailVersion"]  # type: ignore[index]
+    return request_options
+
+
+def main() -> None:
+    llm = ChatBedrock(
+        client=MagicMock(),
+        model_id="anthropic.claude-3-haiku-20240307-v1:0",
+        region_name="us-west-2",
+        model_kwargs={"top_k": 50, "top_p": 0.9},
+        max_tokens=512,
+        temperature=0.2,
+        guardrails={"guardrailIdentifier": "id", "guardrailVersion": "1"},
+    )
+
+    for label, kwargs in [("without tools", {}), ("with tools", {"tools": TOOLS})]:
+        assert json.loads(per_call_request(llm, **kwargs)["body"]) == json.loads(
+            llm._prepare_invoke_request(messages=MESSAGES, **kwargs)[1]["body"]
+        )
+        before = min(
+            timeit.repeat(
+                lambda: per_call_request(llm, **kwargs), number=NUMBER, repeat=REPEAT
+            )
+        )
+        after = min(
+            timeit.repeat(
+                lambda: llm._prepare_invoke_request(messages=MESSAGES, **kwargs),
+                number=NUMBER,
+                repeat=REPEAT,
+            )
+        )
+        print(  # noqa: T201
+            f"{label}: per call {before / NUMBER * 1e6:.1f}us, "
+            f"builder {after / NUMBER * 1e6:.1f}us ({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@
 
 """Test chat model integration."""
 
+import json
 from contextlib import nullcontext
 from typing import Any, Callable, Dict, Literal, Type, cast
+from unittest.mock import MagicMock
 
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
@@ -13,6 +15,7 @@ from pydantic import BaseModel, Field
 
 from langchain_aws import ChatBedrock
 from langchain_aws.chat_models.bedrock import (
+    _add_anthropic_cache_control,
     _format_anthropic_messages,
     _merge_messages,
 )
@@ -101,6 +104,23 @@ def test__merge_messages_mutation() -> None:
     assert messages == original_messages
 
 
+def test__merge_messages_does_not_copy_unmerged_messages() -> None:
+    system = SystemMessage("fuzz")  # type: ignore[misc]
+    human = HumanMessage("foo")  # type: ignore[misc]
+    ai = AIMessage(
+        [{"type": "tool_use", "id": "1", "name": "bar", "input": {}, "text": "x"}]
+    )  # type: ignore[misc]
+
+    merged = _merge_messages([system, human, ai])
+    _, formatted = _format_anthropic_messages([system, human, ai])
+
+    assert all(m is o for m, o in zip(merged, [system, human, ai]))
+    assert formatted[1]["content"] == [
+        {"type": "tool_use", "id": "1", "name": "bar", "input": {}}
+    ]
+    assert "text" in ai.content[0]  # type: ignore[operator]
+
+
 def test__format_anthropic_messages_with_tool_calls() -> None:
     system = SystemMessage("fuzz")  # type: ignore[misc]
     human = HumanMessage("foo")  # type: ignore[misc]
@@ -472,3 +492,134 @@ def test__get_provider(model_id, provider, expected_provider, expectation) -> No
     llm = ChatBedrock(model_id=model_id, provider=provider, region_name="us-west-2")
     with expectation:
         assert llm._get_provider() == expected_provider
+
+
+def test__as_converse_is_cached() -> None:
+    llm = ChatBedrock(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        beta_use_converse_api=True,
+    )
+    converse = llm._as_converse
+    assert llm._as_converse is converse
+    assert converse.client is llm.client
+
+    llm.temperature = 0.5
+    assert llm._as_converse is not converse
+    assert llm._as_converse.temperature == 0.5
+
+
+def test__as_converse_sees_in_place_edits() -> None:
+    llm = ChatBedrock(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        beta_use_converse_api=True,
+        model_kwargs={"additional_model_request_fields": {"top_k": 10}},
+        guardrails={"guardrailIdentifier": "id", "guardrailVersion": "1"},
+    )
+    converse = llm._as_converse
+    assert llm._as_converse is converse
+
+    llm.model_kwargs["additional_model_request_fields"]["top_k"] = 20
+    converse = llm._as_converse
+    assert converse.additional_model_request_fields == {"top_k": 20}
+
+    llm.guardrails["guardrailVersion"] = "2"
+    assert llm._as_converse is not converse
+    assert llm._as_converse.guardrail_config["guardrailVersion"] == "2"
+
+
+def test__format_anthropic_messages_with_cache_control() -> None:
+    system = SystemMessage(["long instructions", {"type": "cache_point"}])  # type: ignore[misc]
+    human = HumanMessage(  # type: ignore[misc]
+        [
+            {"type": "text", "text": "doc", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "question"},
+            {"type": "cache_point"},
+        ]
+    )
+
+    formatted_system, messages = _format_anthropic_messages([system, human])
+
+    assert formatted_system == [
+        {
+            "type": "text",
+            "text": "long instructions",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    assert messages[0]["content"] == [
+        {"type": "text", "text": "doc", "cache_control": {"type": "ephemeral"}},
+        {
+            "type": "text",
+            "text": "question",
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+
+
+def test__add_anthropic_cache_control() -> None:
+    ephemeral = {"type": "ephemeral"}
+    tools = [{"name": "f", "description": "x" * 8000, "input_schema": {}}]
+    messages = [{"role": "user", "content": "Hi"}]
+
+    system, new_messages, new_tools = _add_anthropic_cache_control(
+        "short", messages, tools, min_tokens=1024
+    )
+
+    assert new_tools == [{**tools[0], "cache_control": ephemeral}]
+    assert system == [{"type": "text", "text": "short", "cache_control": ephemeral}]
+    assert new_messages == [
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "Hi", "cache_control": ephemeral}],
+        }
+    ]
+    assert "cache_control" not in tools[0]
+    assert _add_anthropic_cache_control("short", messages, None, 1024) == (
+        "short",
+        messages,
+        None,
+    )
+
+
+def test_prompt_caching_usage() -> None:
+    body = MagicMock()
+    body.read.return_value = json.dumps(
+        {
+            "content": [{"type": "text", "text": "Hello"}],
+            "stop_reason": "end_turn",
+        }
+    ).encode()
+    client = MagicMock()
+    client.invoke_model.return_value = {
+        "body": body,
+        "ResponseMetadata": {
+            "HTTPHeaders": {
+                "x-amzn-bedrock-input-token-count": "5",
+                "x-amzn-bedrock-output-token-count": "2",
+                "x-amzn-bedrock-cache-read-input-token-count": "2000",
+                "x-amzn-bedrock-cache-write-input-token-count": "0",
+            }
+        },
+    }
+    llm = ChatBedrock(
+        client=client,
+        model="anthropic.claude-3-7-sonnet-20250219-v1:0",
+        region_name="us-west-2",
+        prompt_caching=True,
+    )
+
+    response = llm.invoke([SystemMessage("x" * 8000), HumanMessage("Hi")])  # type: ignore[misc]
+
+    request = json.loads(client.invoke_model.call_args.kwargs["body"])
+    assert request["system"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert request["messages"][-1]["content"][-1]["cache_control"] == {
+        "type": "ephemeral"
+    }
+    assert response.usage_metadata == {
+        "input_tokens": 2005,
+        "output_tokens": 2,
+        "total_tokens": 2007,
+        "input_token_details": {"cache_read": 2000, "cache_creation": 0},
+    }
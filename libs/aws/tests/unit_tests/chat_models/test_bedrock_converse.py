@@ -1,7 +1,20 @@
 """Test chat model integration."""
 
+import asyncio
 import base64
-from typing import Dict, List, Tuple, Type, Union, cast
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from langchain_core.language_models import BaseChatModel
@@ -18,13 +31,22 @@ from pydantic import BaseModel, Field
 
 from langchain_aws import ChatBedrockConverse
 from langchain_aws.chat_models.bedrock_converse import (
+    _add_cache_points,
+    _b64str_to_bytes,
     _bedrock_to_lc,
+    _bytes_to_b64_str,
     _camel_to_snake,
     _camel_to_snake_keys,
     _extract_response_metadata,
+    _format_openai_image_url,
+    _lc_content_to_bedrock,
+    _MediaCache,
     _messages_to_bedrock,
+    _parse_stream_event,
     _snake_to_camel,
     _snake_to_camel_keys,
+    _TextDeltaCoalescer,
+    _usage_metadata,
 )
 
 
@@ -343,6 +365,17 @@ def test__messages_to_bedrock() -> None:
     assert expected_system == actual_system
 
 
+def test__messages_to_bedrock_reflects_in_place_edits() -> None:
+    message = HumanMessage([{"type": "text", "text": "draft"}])
+    _messages_to_bedrock([message])
+
+    cast(List[Dict[str, Any]], message.content)[0]["text"] = "final"
+
+    assert _messages_to_bedrock([message])[0] == [
+        {"role": "user", "content": [{"text": "final"}]}
+    ]
+
+
 def test__bedrock_to_lc() -> None:
     bedrock: List[Dict] = [
         {"text": "text1"},
@@ -449,8 +482,85 @@ def test__snake_to_camel_keys() -> None:
     assert _snake_to_camel_keys(_SNAKE_DICT) == _CAMEL_DICT
 
 
+def test__camel_to_snake_keys_excluded_keys() -> None:
+    camel = {"toolUse": {"toolUseId": "a", "input": {"cityName": "Paris"}}}
+
+    assert _camel_to_snake_keys(camel, excluded_keys={"input"}) == {
+        "tool_use": {"tool_use_id": "a", "input": {"cityName": "Paris"}}
+    }
+
+
+def test_tool_arguments_keep_their_keys() -> None:
+    bedrock: List[Dict[str, Any]] = [
+        {"toolUse": {"toolUseId": "a", "name": "f", "input": {"cityName": "Paris"}}},
+        {
+            "toolResult": {
+                "toolUseId": "a",
+                "content": [{"json": {"max_temp": 20}}],
+                "status": "success",
+            }
+        },
+    ]
+
+    lc = _bedrock_to_lc(bedrock)
+
+    assert lc[0]["input"] == {"cityName": "Paris"}
+    assert lc[1]["content"] == [{"type": "json", "json": {"max_temp": 20}}]
+    assert _lc_content_to_bedrock(cast(List[Union[str, Dict]], lc)) == bedrock
+
+
 def test__format_openai_image_url() -> None:
-    ...
+    assert _format_openai_image_url("data:image/png;base64,aGVsbG8=") == {
+        "format": "png",
+        "source": {"bytes": b"hello"},
+    }
+    for url in ["https://example.com/a.png", "data:image/png;base64,", "data:,x"]:
+        with pytest.raises(ValueError):
+            _format_openai_image_url(url)
+
+
+def test_media_bytes_are_passed_through() -> None:
+    raw = b"\x89PNG raw image"
+    content: List[Union[str, Dict[str, Any]]] = [
+        {
+            "type": "image",
+            "source": {"type": "base64", "media_type": "image/png", "data": raw},
+        },
+        {
+            "type": "image",
+            "source": {
+                "type": "base64",
+                "media_type": "image/png",
+                "data": memoryview(raw),
+            },
+        },
+    ]
+
+    first, second = _lc_content_to_bedrock(content)
+
+    assert first["image"]["source"]["bytes"] is raw
+    assert second["image"]["source"]["bytes"] == raw
+
+
+def test_media_decode_cache() -> None:
+    data = base64.b64encode(b"x" * 4096).decode()
+
+    assert _b64str_to_bytes(data) is _b64str_to_bytes(data)
+    assert _bytes_to_b64_str(_b64str_to_bytes(data)) == data
+
+
+def test_media_cache_is_bounded() -> None:
+    cache = _MediaCache(max_bytes=100, min_size=10)
+    convert = MagicMock(side_effect=lambda value: value.upper())
+
+    for value in ["a" * 20, "b" * 20, "c" * 20]:
+        cache.get(value, convert)
+    cache.get("c" * 20, convert)
+    cache.get("a" * 20, convert)
+    cache.get("short", convert)
+    cache.get("short", convert)
+
+    assert convert.call_count == 6
 
 
 def test_standard_tracing_params() -> None:
@@ -502,3 +612,300 @@ def test__extract_response_metadata() -> None:
     }
     response_metadata = _extract_response_metadata(response)
     assert response_metadata["metrics"]["latencyMs"] == [191]
+
+
+def _converse_response() -> Dict[str, Any]:
+    return {
+        "output": {"message": {"role": "assistant", "content": [{"text": "Hello!"}]}},
+        "stopReason": "end_turn",
+        "usage": {"inputTokens": 3, "outputTokens": 2, "totalTokens": 5},
+        "metrics": {"latencyMs": 100},
+    }
+
+
+async def _converse_stream_events() -> AsyncIterator[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = [
+        {"messageStart": {"role": "assistant"}},
+        {"contentBlockDelta": {"delta": {"text": "Hel"}, "contentBlockIndex": 0}},
+        {"contentBlockDelta": {"delta": {"text": "lo!"}, "contentBlockIndex": 0}},
+        {"contentBlockStop": {"contentBlockIndex": 0}},
+        {"messageStop": {"stopReason": "end_turn"}},
+    ]
+    for event in events:
+        yield event
+
+
+async def test_ainvoke_uses_async_client() -> None:
+    client = MagicMock()
+    async_client = MagicMock()
+    async_client.converse = AsyncMock(return_value=_converse_response())
+    llm = ChatBedrockConverse(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        client=client,
+        async_client=async_client,
+    )
+
+    response = await llm.ainvoke("Hi")
+
+    assert response.content == "Hello!"
+    async_client.converse.assert_awaited_once()
+    client.converse.assert_not_called()
+
+
+async def test_astream_uses_async_client() -> None:
+    client = MagicMock()
+    async_client = MagicMock()
+    async_client.converse_stream = AsyncMock(
+        return_value={"stream": _converse_stream_events()}
+    )
+    llm = ChatBedrockConverse(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        client=client,
+        async_client=async_client,
+    )
+
+    chunks = [chunk async for chunk in llm.astream("Hi")]
+
+    full = sum(chunks[1:], chunks[0])
+    assert full.content == [{"type": "text", "text": "Hello!", "index": 0}]
+    async_client.converse_stream.assert_awaited_once()
+    client.converse_stream.assert_not_called()
+
+
+async def test_ainvoke_without_async_client() -> None:
+    client = MagicMock()
+    client.converse.return_value = _converse_response()
+    llm = ChatBedrockConverse(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        client=client,
+    )
+
+    response = await llm.ainvoke("Hi")
+
+    assert response.content == "Hello!"
+    client.converse.assert_called_once()
+
+
+def _text_delta(text: str, index: int = 0) -> Dict[str, Any]:
+    return {"contentBlockDelta": {"delta": {"text": text}, "contentBlockIndex": index}}
+
+
+def test_parse_stream_event_skips_empty_events() -> None:
+    assert _parse_stream_event({"messageStart": {"role": "assistant"}}) is None
+    assert _parse_stream_event({"contentBlockStop": {"contentBlockIndex": 0}}) is None
+    chunk = _parse_stream_event(_text_delta("Hi", 1))
+    assert chunk is not None
+    assert chunk.content == [{"type": "text", "text": "Hi", "index": 1}]
+
+
+def test_text_delta_coalescer() -> None:
+    coalescer = _TextDeltaCoalescer(max_chars=5, max_delay=60)
+
+    assert coalescer.feed(_text_delta("He")) == []
+    assert coalescer.feed(_text_delta("ll")) == []
+    (chunk,) = coalescer.feed(_text_delta("o!"))
+    assert chunk.content == [{"type": "text", "text": "Hello!", "index": 0}]
+
+    assert coalescer.feed(_text_delta("a")) == []
+    (first,) = coalescer.feed(_text_delta("b", index=1))
+    assert first.content == [{"type": "text", "text": "a", "index": 0}]
+    second, stop = coalescer.feed({"messageStop": {"stopReason": "end_turn"}})
+    assert second.content == [{"type": "text", "text": "b", "index": 1}]
+    assert stop.response_metadata == {"stopReason": "end_turn"}
+    assert coalescer.flush() == []
+
+
+def test_text_delta_coalescer_flushes_after_delay() -> None:
+    coalescer = _TextDeltaCoalescer(max_chars=100, max_delay=0)
+
+    (chunk,) = coalescer.feed(_text_delta("Hi"))
+
+    assert chunk.content == [{"type": "text", "text": "Hi", "index": 0}]
+
+
+def test_stream_coalesces_text_deltas() -> None:
+    client = MagicMock()
+    client.converse_stream.return_value = {
+        "stream": [
+            {"messageStart": {"role": "assistant"}},
+            *[_text_delta(text) for text in ["Hel", "lo", " wor", "ld", "!"]],
+            {"contentBlockStop": {"contentBlockIndex": 0}},
+            {"messageStop": {"stopReason": "end_turn"}},
+        ]
+    }
+    llm = ChatBedrockConverse(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        client=client,
+        stream_coalesce_chars=5,
+        stream_coalesce_interval=60,
+    )
+
+    chunks = list(llm.stream("Hi"))
+
+    assert [chunk.content for chunk in chunks[:-1]] == [
+        [{"type": "text", "text": "Hello", "index": 0}],
+        [{"type": "text", "text": " world", "index": 0}],
+        [{"type": "text", "text": "!", "index": 0}],
+    ]
+    assert chunks[-1].response_metadata["stopReason"] == "end_turn"
+
+
+def test_stream_flushes_coalesced_text_during_pause() -> None:
+    resume = threading.Event()
+
+    def stream() -> Iterator[Dict[str, Any]]:
+        yield _text_delta("Hi")
+        # The model pauses until the first chunk has been received
+        resume.wait(5)
+        yield _text_delta(" there")
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+    client = MagicMock()
+    client.converse_stream.return_value = {"stream": stream()}
+    llm = ChatBedrockConverse(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        client=client,
+        stream_coalesce_chars=100,
+        stream_coalesce_interval=0.01,
+    )
+
+    chunks = llm.stream("Hi")
+    first = next(chunks)
+    resume.set()
+
+    assert first.content == [{"type": "text", "text": "Hi", "index": 0}]
+    assert [chunk.content for chunk in chunks][0] == [
+        {"type": "text", "text": " there", "index": 0}
+    ]
+
+
+async def test_astream_flushes_coalesced_text_during_pause() -> None:
+    resume = asyncio.Event()
+
+    async def stream() -> AsyncIterator[Dict[str, Any]]:
+        yield _text_delta("Hi")
+        await asyncio.wait_for(resume.wait(), 5)
+        yield _text_delta(" there")
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+    async_client = MagicMock()
+    async_client.converse_stream = AsyncMock(return_value={"stream": stream()})
+    llm = ChatBedrockConverse(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        client=MagicMock(),
+        async_client=async_client,
+        stream_coalesce_chars=100,
+        stream_coalesce_interval=0.01,
+    )
+
+    chunks = llm.astream("Hi")
+    first = await chunks.__anext__()
+    resume.set()
+
+    assert first.content == [{"type": "text", "text": "Hi", "index": 0}]
+    assert [chunk.content async for chunk in chunks][0] == [
+        {"type": "text", "text": " there", "index": 0}
+    ]
+
+
+def test__usage_metadata_with_cache_tokens() -> None:
+    usage = {
+        "inputTokens": 10,
+        "outputTokens": 5,
+        "totalTokens": 1515,
+        "cacheReadInputTokens": 1200,
+        "cacheWriteInputTokens": 300,
+    }
+
+    assert _usage_metadata(usage) == {
+        "input_tokens": 1510,
+        "output_tokens": 5,
+        "total_tokens": 1515,
+        "input_token_details": {"cache_read": 1200, "cache_creation": 300},
+    }
+    assert _usage_metadata({"inputTokens": 3, "outputTokens": 2, "totalTokens": 5}) == {
+        "input_tokens": 3,
+        "output_tokens": 2,
+        "total_tokens": 5,
+    }
+
+
+def test__lc_content_to_bedrock_cache_points() -> None:
+    content: List[Union[str, Dict[str, Any]]] = [
+        {"type": "text", "text": "long instructions"},
+        {"type": "cache_point"},
+        {"type": "text", "text": "more", "cache_control": {"type": "ephemeral"}},
+    ]
+
+    assert _lc_content_to_bedrock(content) == [
+        {"text": "long instructions"},
+        {"cachePoint": {"type": "default"}},
+        {"text": "more"},
+        {"cachePoint": {"type": "default"}},
+    ]
+
+
+def test__add_cache_points() -> None:
+    cache_point = {"cachePoint": {"type": "default"}}
+    tools = [{"toolSpec": {"name": "f", "description": "x" * 8000}}]
+    system = [{"text": "short system prompt"}]
+    messages = [{"role": "user", "content": [{"text": "Hi"}]}]
+    params: Dict[str, Any] = {"modelId": "model", "toolConfig": {"tools": tools}}
+
+    new_messages, new_system, new_params = _add_cache_points(
+        messages, system, params, min_tokens=1024
+    )
+
+    assert new_params["toolConfig"]["tools"] == [*tools, cache_point]
+    assert new_system == [*system, cache_point]
+    assert new_messages == [{"role": "user", "content": [{"text": "Hi"}, cache_point]}]
+    # The inputs are not modified
+    assert params["toolConfig"]["tools"] == tools
+    assert messages[0]["content"] == [{"text": "Hi"}]
+
+    assert _add_cache_points(messages, system, {}, min_tokens=1024) == (
+        messages,
+        system,
+        {},
+    )
+    marked = [{"role": "user", "content": [{"text": "x" * 8000}, cache_point]}]
+    assert _add_cache_points(marked, system, params, min_tokens=1024)[2] is params
+
+
+def test_prompt_caching() -> None:
+    client = MagicMock()
+    client.converse.return_value = {
+        **_converse_response(),
+        "usage": {
+            "inputTokens": 3,
+            "outputTokens": 2,
+            "totalTokens": 2005,
+            "cacheReadInputTokens": 2000,
+            "cacheWriteInputTokens": 0,
+        },
+    }
+    llm = ChatBedrockConverse(
+        model="anthropic.claude-3-7-sonnet-20250219-v1:0",
+        region_name="us-west-2",
+        client=client,
+        prompt_caching=True,
+    )
+
+    response = llm.invoke([SystemMessage("x" * 8000), HumanMessage("Hi")])
+
+    request = client.converse.call_args.kwargs
+    assert request["system"][-1] == {"cachePoint": {"type": "default"}}
+    assert request["messages"][-1]["content"][-1] == {"cachePoint": {"type": "default"}}
+    assert isinstance(response, AIMessage)
+    assert response.usage_metadata is not None
+    assert response.usage_metadata["input_tokens"] == 2003
+    assert response.usage_metadata["input_token_details"] == {
+        "cache_read": 2000,
+        "cache_creation": 0,
+    }
@@ -0,0 +1,213 @@
+# type:ignore
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from langchain_core.stores import InMemoryStore
+
+from langchain_aws import BedrockEmbeddings
+from langchain_aws.embeddings import InMemoryLRUEmbeddingStore
+from langchain_aws.embeddings.bedrock import (
+    COHERE_MAX_TEXTS_PER_REQUEST,
+    _batch_texts,
+)
+
+
+def _titan_response(text: str) -> Dict[str, Any]:
+    body = MagicMock()
+    body.read.return_value = json.dumps({"embedding": [float(len(text)), 1.0]})
+    return {"body": body}
+
+
+@pytest.fixture
+def titan_client() -> MagicMock:
+    def invoke_model(body: str, **kwargs: Any) -> Dict[str, Any]:
+        time.sleep(random.uniform(0, 0.01))
+        return _titan_response(json.loads(body)["inputText"])
+
+    client = MagicMock()
+    client.invoke_model.side_effect = invoke_model
+    return client
+
+
+def test_embed_documents_concurrently_preserves_order(titan_client) -> None:
+    embeddings = BedrockEmbeddings(client=titan_client, max_concurrency=4)
+    texts = ["a" * i for i in range(1, 21)]
+
+    output = embeddings.embed_documents(texts)
+
+    assert output == [[float(i), 1.0] for i in range(1, 21)]
+    assert titan_client.invoke_model.call_count == 20
+
+
+def test_embed_documents_concurrently_raises_item_failure(titan_client) -> None:
+    invoke_model = titan_client.invoke_model.side_effect
+
+    def failing_invoke_model(body: str, **kwargs: Any) -> Dict[str, Any]:
+        if json.loads(body)["inputText"] == "bad":
+            raise ValueError("bad input")
+        return invoke_model(body, **kwargs)
+
+    titan_client.invoke_model.side_effect = failing_invoke_model
+    embeddings = BedrockEmbeddings(client=titan_client, max_concurrency=4)
+
+    with pytest.raises(ValueError, match="bad input"):
+        embeddings.embed_documents(["foo", "bad", "bar"])
+
+
+def test__batch_texts() -> None:
+    texts = ["aa", "bbb", "c", "dddd", "ee"]
+
+    assert _batch_texts(texts, max_texts=2, max_characters=100) == [
+        ["aa", "bbb"],
+        ["c", "dddd"],
+        ["ee"],
+    ]
+    assert _batch_texts(texts, max_texts=10, max_characters=5) == [
+        ["aa", "bbb"],
+        ["c", "dddd"],
+        ["ee"],
+    ]
+    assert _batch_texts(["aaaaaaaa", "b"], max_texts=10, max_characters=5) == [
+        ["aaaaaaaa"],
+        ["b"],
+    ]
+
+
+def test_embed_documents_batches_cohere_requests() -> None:
+    def invoke_model(body: str, **kwargs: Any) -> Dict[str, Any]:
+        texts = json.loads(body)["texts"]
+        response_body = MagicMock()
+        response_body.read.return_value = json.dumps(
+            {"embeddings": [[float(text), 0.0] for text in texts]}
+        )
+        return {"body": response_body}
+
+    client = MagicMock()
+    client.invoke_model.side_effect = invoke_model
+    embeddings = BedrockEmbeddings(client=client, model_id="cohere.embed-english-v3")
+    texts = [str(i) for i in range(200)]
+
+    output = embeddings.embed_documents(texts)
+
+    assert output == [[float(i), 0.0] for i in range(200)]
+    assert client.invoke_model.call_count == 3
+    first_body = json.loads(client.invoke_model.call_args_list[0].kwargs["body"])
+    assert first_body["input_type"] == "search_document"
+    assert len(first_body["texts"]) == COHERE_MAX_TEXTS_PER_REQUEST
+
+
+@pytest.mark.parametrize("max_concurrency, expected", [(3, 3), (None, 16)])
+async def test_aembed_documents_bounds_concurrency(max_concurrency, expected) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    class AsyncBody:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+        async def read(self) -> str:
+            return json.dumps({"embedding": [float(len(self.text)), 1.0]})
+
+    async def invoke_model(body: str, **kwargs: Any) -> Dict[str, Any]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(random.uniform(0, 0.01))
+        in_flight -= 1
+        return {"body": AsyncBody(json.loads(body)["inputText"])}
+
+    async_client = MagicMock()
+    async_client.invoke_model.side_effect = invoke_model
+    embeddings = BedrockEmbeddings(
+        client=MagicMock(), async_client=async_client, max_concurrency=max_concurrency
+    )
+    texts = ["a" * i for i in range(1, 41)]
+
+    output = await embeddings.aembed_documents(texts)
+
+    assert output == [[float(i), 1.0] for i in range(1, 41)]
+    assert max_in_flight == expected
+    embeddings.client.invoke_model.assert_not_called()
+
+
+async def test_aembed_query_without_async_client(titan_client) -> None:
+    embeddings = BedrockEmbeddings(client=titan_client)
+
+    assert await embeddings.aembed_query("foo") == [3.0, 1.0]
+
+
+def test_embed_documents_only_sends_cache_misses(titan_client) -> None:
+    embeddings = BedrockEmbeddings(
+        client=titan_client, cache=InMemoryLRUEmbeddingStore()
+    )
+
+    assert embeddings.embed_documents(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    assert embeddings.embed_documents(["bb", "ccc"]) == [[2.0, 1.0], [3.0, 1.0]]
+    assert embeddings.embed_query("a") == [1.0, 1.0]
+
+    sent = [
+        json.loads(call.kwargs["body"])["inputText"]
+        for call in titan_client.invoke_model.call_args_list
+    ]
+    assert sent == ["a", "bb", "ccc"]
+
+
+def test_mutating_results_does_not_change_cache(titan_client) -> None:
+    embeddings = BedrockEmbeddings(client=titan_client, cache=InMemoryStore())
+
+    embeddings.embed_query("a")[0] = 0.0
+    embeddings.embed_query("a")[0] = 0.0
+
+    assert embeddings.embed_query("a") == [1.0, 1.0]
+    assert titan_client.invoke_model.call_count == 1
+
+
+def test_cache_keys_depend_on_model_settings(titan_client) -> None:
+    embeddings = BedrockEmbeddings(client=titan_client)
+    normalized = BedrockEmbeddings(client=titan_client, normalize=True)
+
+    assert embeddings._cache_keys(["a"]) == embeddings._cache_keys(["a"])
+    assert embeddings._cache_keys(["a"]) != embeddings._cache_keys(["b"])
+    assert embeddings._cache_keys(["a"]) != normalized._cache_keys(["a"])
+
+
+def test_embed_documents_array(titan_client) -> None:
+    embeddings = BedrockEmbeddings(client=titan_client, normalize=True)
+
+    output = embeddings.embed_documents_array(["a", "bbb"])
+
+    assert output.dtype == np.float32
+    assert output.shape == (2, 2)
+    assert output.flags["C_CONTIGUOUS"]
+    np.testing.assert_allclose(np.linalg.norm(output, axis=1), [1.0, 1.0], rtol=1e-6)
+    np.testing.assert_allclose(
+        output, np.array(embeddings.embed_documents(["a", "bbb"])), rtol=1e-6
+    )
+    assert embeddings.embed_documents_array([]).shape == (0, 0)
+
+
+def test_embed_documents_deduplicates_texts(titan_client) -> None:
+    embeddings = BedrockEmbeddings(client=titan_client, max_concurrency=2)
+
+    output = embeddings.embed_documents(["a", "bb", "a", "a", "ccc"])
+
+    assert output == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0], [1.0, 1.0], [3.0, 1.0]]
+    assert output[0] is not output[2]
+    assert titan_client.invoke_model.call_count == 3
+    assert embeddings.deduplicated_texts == 2
+
+
+def test_embed_documents_without_deduplication(titan_client) -> None:
+    embeddings = BedrockEmbeddings(client=titan_client, deduplicate=False)
+
+    embeddings.embed_documents(["a", "a"])
+
+    assert titan_client.invoke_model.call_count == 2
+    assert embeddings.deduplicated_texts == 0
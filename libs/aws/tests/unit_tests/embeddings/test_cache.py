@@ -0,0 +1,62 @@
+# type:ignore
+
+from pathlib import Path
+
+import pytest
+
+from langchain_aws.embeddings import (
+    InMemoryLRUEmbeddingStore,
+    MemmapEmbeddingStore,
+    TieredEmbeddingStore,
+)
+
+
+def test_in_memory_lru_store_evicts_least_recently_used() -> None:
+    store = InMemoryLRUEmbeddingStore(max_size=2)
+    store.mset([("a", [1.0]), ("b", [2.0])])
+    store.mget(["a"])
+    store.mset([("c", [3.0])])
+
+    assert store.mget(["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+
+def test_in_memory_lru_store_returns_copies() -> None:
+    store = InMemoryLRUEmbeddingStore()
+    vector = [1.0, 2.0]
+    store.mset([("a", vector)])
+    vector[0] = 0.0
+    store.mget(["a"])[0][1] = 0.0
+
+    assert store.mget(["a"]) == [[1.0, 2.0]]
+
+
+def test_in_memory_lru_store_rejects_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        InMemoryLRUEmbeddingStore(max_size=0)
+
+
+def test_memmap_store_persists_across_instances(tmp_path: Path) -> None:
+    store = MemmapEmbeddingStore(tmp_path)
+    assert store.mget(["a"]) == [None]
+
+    store.mset([("a", [0.5, 1.5]), ("b", [2.0, 3.0, 4.0])])
+    store.mset([("c", [5.0])])
+    store.mdelete(["b"])
+
+    reopened = MemmapEmbeddingStore(tmp_path)
+    assert reopened.mget(["a", "b", "c"]) == [[0.5, 1.5], None, [5.0]]
+    assert sorted(reopened.yield_keys()) == ["a", "c"]
+
+
+def test_tiered_store_promotes_hits(tmp_path: Path) -> None:
+    memory = InMemoryLRUEmbeddingStore()
+    disk = MemmapEmbeddingStore(tmp_path)
+    disk.mset([("a", [1.0])])
+    store = TieredEmbeddingStore([memory, disk])
+
+    assert store.mget(["a", "b"]) == [[1.0], None]
+    assert memory.mget(["a"]) == [[1.0]]
+
+    store.mset([("b", [2.0])])
+    assert memory.mget(["b"]) == [[2.0]]
+    assert disk.mget(["b"]) == [[2.0]]
@@ -0,0 +1,130 @@
+# type:ignore
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from langchain_aws import BedrockLLM, ChatBedrock
+from langchain_aws.llms import BedrockBatchInference, LocalBatchStorage
+
+JOB_ARN = "arn:aws:bedrock:us-west-2:123456789012:model-invocation-job/abc123"
+
+
+def _fake_bedrock_client(storage, model_output, statuses=("Completed",)):
+    """Bedrock client that runs jobs by applying ``model_output`` to each input."""
+    client = MagicMock()
+    jobs = {}
+
+    def create_model_invocation_job(jobName, **kwargs):
+        jobs[JOB_ARN] = jobName
+        input_key = f"{jobName}/input.jsonl"
+        output = []
+        for line in storage.read(input_key).decode().splitlines():
+            record = json.loads(line)
+            record["modelOutput"] = model_output(record["modelInput"])
+            if record["modelOutput"] is None:
+                del record["modelOutput"]
+                record["error"] = {"errorMessage": "ValidationException"}
+            output.append(json.dumps(record))
+        storage.write(
+            f"{jobName}/output/abc123/input.jsonl.out", "\n".join(output).encode()
+        )
+        return {"jobArn": JOB_ARN}
+
+    status_iter = iter(statuses)
+
+    def get_model_invocation_job(jobIdentifier):
+        return {
+            "jobName": jobs[jobIdentifier],
+            "status": next(status_iter, statuses[-1]),
+        }
+
+    client.create_model_invocation_job.side_effect = create_model_invocation_job
+    client.get_model_invocation_job.side_effect = get_model_invocation_job
+    return client
+
+
+def test_generate_with_llm(tmp_path) -> None:
+    storage = LocalBatchStorage(tmp_path)
+    client = _fake_bedrock_client(
+        storage,
+        lambda body: {"generation": body["prompt"].upper(), "stop_reason": "stop"},
+        statuses=("InProgress", "Completed"),
+    )
+    llm = BedrockLLM(
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+        client=MagicMock(),
+    )
+    batch = BedrockBatchInference(
+        llm, storage, role_arn="role", client=client, poll_interval=0
+    )
+
+    assert batch.generate(["first", "second", "third"]) == ["FIRST", "SECOND", "THIRD"]
+
+    job_kwargs = client.create_model_invocation_job.call_args.kwargs
+    assert job_kwargs["modelId"] == "meta.llama3-8b-instruct-v1:0"
+    assert job_kwargs["roleArn"] == "role"
+    assert client.get_model_invocation_job.call_count == 3
+
+
+def test_generate_with_chat_messages(tmp_path) -> None:
+    storage = LocalBatchStorage(tmp_path)
+    client = _fake_bedrock_client(
+        storage,
+        lambda body: {
+            "content": [{"type": "text", "text": body["system"]}],
+            "stop_reason": "end_turn",
+        },
+    )
+    llm = ChatBedrock(
+        model_id="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        client=MagicMock(),
+    )
+    batch = BedrockBatchInference(llm, storage, role_arn="role", client=client)
+
+    outputs = batch.generate(
+        [[SystemMessage(content="Be brief."), HumanMessage(content="Hi")]]
+    )
+
+    assert outputs == ["Be brief."]
+
+
+def test_results_with_failed_records(tmp_path) -> None:
+    storage = LocalBatchStorage(tmp_path)
+    client = _fake_bedrock_client(
+        storage,
+        lambda body: None if body["prompt"] == "bad" else {"generation": "ok"},
+    )
+    llm = BedrockLLM(
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+        client=MagicMock(),
+    )
+    batch = BedrockBatchInference(llm, storage, role_arn="role", client=client)
+
+    with pytest.raises(ValueError, match="Batch record 1 failed"):
+        batch.generate(["good", "bad"])
+
+    outputs = batch.generate(["good", "bad"], return_exceptions=True)
+    assert outputs[0] == "ok"
+    assert isinstance(outputs[1], ValueError)
+
+
+def test_wait_raises_on_failed_job(tmp_path) -> None:
+    storage = LocalBatchStorage(tmp_path)
+    client = _fake_bedrock_client(
+        storage, lambda body: {"generation": "ok"}, statuses=("Failed",)
+    )
+    llm = BedrockLLM(
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+        client=MagicMock(),
+    )
+    batch = BedrockBatchInference(llm, storage, role_arn="role", client=client)
+
+    with pytest.raises(ValueError, match="Failed"):
+        batch.generate(["prompt"])
@@ -1,6 +1,10 @@
 # type:ignore
 
+import asyncio
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import AsyncGenerator, Dict
 from unittest.mock import MagicMock, patch
 
@@ -10,8 +14,14 @@ from langchain_aws import BedrockLLM
 from langchain_aws.llms.bedrock import (
     ALTERNATION_ERROR,
     LLMInputOutputAdapter,
+    _aiter_events,
     _human_assistant_format,
 )
+from langchain_aws.streams import (
+    StreamCancellationMetrics,
+    get_stream_cancellation_metrics,
+    reset_stream_cancellation_metrics,
+)
 
 TEST_CASES = {
     """Hey""": """
@@ -414,6 +424,30 @@ def response_with_stop_reason():
     return response
 
 
+async def test_bedrock_async_invoke_without_streaming(cohere_response) -> None:
+    client = MagicMock()
+    client.invoke_model.return_value = cohere_response
+    llm = BedrockLLM(
+        client=client, model_id="cohere.command-text-v14", region_name="us-west-2"
+    )
+
+    assert await llm.ainvoke("Hey, how are you?") == "This is the Cohere output text."
+    client.invoke_model.assert_called_once()
+    assert json.loads(client.invoke_model.call_args.kwargs["body"])["prompt"] == (
+        "Hey, how are you?"
+    )
+
+
+async def test_bedrock_async_invoke_enforces_stop(anthropic_response) -> None:
+    client = MagicMock()
+    client.invoke_model.return_value = anthropic_response
+    llm = BedrockLLM(
+        client=client, model_id="anthropic.claude-v2", region_name="us-west-2"
+    )
+
+    assert await llm.ainvoke("Hey", stop=["output"]) == "This is the "
+
+
 def test_prepare_output_for_mistral(mistral_response):
     result = LLMInputOutputAdapter.prepare_output("mistral", mistral_response)
     assert result["text"] == "This is the Mistral output text."
@@ -435,6 +469,53 @@ def test_prepare_output_stream_for_mistral(mistral_streaming_response) -> None:
     assert results[1] == "you."
 
 
+async def test_aprepare_output_stream_for_mistral(mistral_streaming_response) -> None:
+    results = [
+        chunk.text
+        async for chunk in LLMInputOutputAdapter.aprepare_output_stream(
+            "mistral", mistral_streaming_response
+        )
+    ]
+
+    assert results == ["Thank"]
+
+
+async def test_aprepare_output_stream_does_not_block_event_loop() -> None:
+    def slow_stream():
+        for event in MOCK_STREAMING_RESPONSE_MISTRAL:
+            time.sleep(0.05)
+            yield event
+
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    async for _ in LLMInputOutputAdapter.aprepare_output_stream(
+        "mistral", {"body": slow_stream()}
+    ):
+        pass
+    ticker.cancel()
+
+    assert ticks >= 5
+
+
+async def test_aprepare_output_stream_raises_stream_errors() -> None:
+    def failing_stream():
+        yield MOCK_STREAMING_RESPONSE_MISTRAL[0]
+        raise RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError, match="connection reset"):
+        async for _ in LLMInputOutputAdapter.aprepare_output_stream(
+            "mistral", {"body": failing_stream()}
+        ):
+            pass
+
+
 def test_prepare_output_for_cohere(cohere_response):
     result = LLMInputOutputAdapter.prepare_output("cohere", cohere_response)
     assert result["text"] == "This is the Cohere output text."
@@ -481,3 +562,239 @@ def test_standard_tracing_params():
         "ls_model_type": "llm",
         "ls_model_name": "foo",
     }
+
+
+def test_request_builder_is_cached() -> None:
+    llm = BedrockLLM(
+        client=MagicMock(),
+        model_id="anthropic.claude-v2",
+        region_name="us-west-2",
+        model_kwargs={"top_k": 10},
+    )
+    builder = llm._get_request_builder()
+    assert llm._get_request_builder() is builder
+
+    llm.model_kwargs["top_k"] = 20
+    assert llm._get_request_builder() is not builder
+    assert llm._prepare_input_body(prompt="Hi")[1]["top_k"] == 20
+
+    builder = llm._get_request_builder()
+
+    llm.temperature = 0.3
+    assert llm._get_request_builder() is not builder
+    assert llm._prepare_input_body(prompt="Hi")[1]["temperature"] == 0.3
+
+
+def test_request_builder_guardrail_options() -> None:
+    llm = BedrockLLM(
+        client=MagicMock(),
+        model_id="anthropic.claude-v2",
+        region_name="us-west-2",
+        guardrails={
+            "guardrailIdentifier": "id",
+            "guardrailVersion": "1",
+            "trace": True,
+        },
+    )
+    _, request_options = llm._prepare_invoke_request(prompt="Hi")
+
+    assert request_options["modelId"] == "anthropic.claude-v2"
+    assert request_options["guardrailIdentifier"] == "id"
+    assert request_options["guardrailVersion"] == "1"
+    assert request_options["trace"] == "ENABLED"
+
+
+def test_stream_stop_does_not_change_model_kwargs(mistral_streaming_response) -> None:
+    client = MagicMock()
+    client.invoke_model_with_response_stream.return_value = mistral_streaming_response
+    llm = BedrockLLM(
+        client=client,
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+        model_kwargs={"top_k": 10},
+    )
+
+    list(llm._prepare_input_and_invoke_stream(prompt="Hi", stop=["\n"]))
+
+    body = json.loads(client.invoke_model_with_response_stream.call_args.kwargs["body"])
+    assert body["stop_sequences"] == ["\n"]
+    assert llm.model_kwargs == {"top_k": 10}
+
+
+class _MetaStream:
+    """Meta streaming response body that records how far it was read."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self):
+        for text in self.texts:
+            self.read += 1
+            yield {
+                "chunk": {
+                    "bytes": json.dumps(
+                        {"generation": text, "stop_reason": None}
+                    ).encode()
+                }
+            }
+
+    def close(self):
+        self.closed = True
+
+
+def test_stream_stops_at_stop_sequence_split_across_chunks() -> None:
+    stream = _MetaStream(["Hello", " Hu", "man: next", " turn", " more"])
+    client = MagicMock()
+    client.invoke_model_with_response_stream.return_value = {"body": stream}
+    llm = BedrockLLM(
+        client=client,
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+
+    chunks = list(llm._stream("Hi", stop=["Human:"]))
+
+    assert "".join(chunk.text for chunk in chunks) == "Hello "
+    assert stream.closed
+    assert stream.read == 3
+
+
+async def test_astream_stops_at_stop_sequence() -> None:
+    stream = _MetaStream(["Hello", " Hu", "man: next", " turn"])
+    client = MagicMock()
+    client.invoke_model_with_response_stream.return_value = {"body": stream}
+    llm = BedrockLLM(
+        client=client,
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+
+    chunks = [chunk async for chunk in llm._astream("Hi", stop=["Human:"])]
+
+    assert "".join(chunk.text for chunk in chunks) == "Hello "
+    assert stream.closed
+
+
+def test_stream_flushes_partial_stop_sequence() -> None:
+    stream = _MetaStream(["Hello", " Hu"])
+    client = MagicMock()
+    client.invoke_model_with_response_stream.return_value = {"body": stream}
+    llm = BedrockLLM(
+        client=client,
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+
+    chunks = list(llm._stream("Hi", stop=["Human:"]))
+
+    assert "".join(chunk.text for chunk in chunks) == "Hello Hu"
+    assert not stream.closed
+
+
+def test_stream_flushes_held_back_text_before_metrics_chunk() -> None:
+    events = [
+        {"generation": "Hello", "stop_reason": None},
+        {"generation": " Hu", "stop_reason": None},
+        {
+            "generation": "",
+            "stop_reason": "stop",
+            "amazon-bedrock-invocationMetrics": {
+                "inputTokenCount": 3,
+                "outputTokenCount": 2,
+            },
+        },
+    ]
+    client = MagicMock()
+    client.invoke_model_with_response_stream.return_value = {
+        "body": [{"chunk": {"bytes": json.dumps(event).encode()}} for event in events]
+    }
+    llm = BedrockLLM(
+        client=client,
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+
+    chunks = list(llm._stream("Hi", stop=["Human:"]))
+
+    texts = [chunk.text for chunk in chunks]
+    assert "".join(texts) == "Hello Hu"
+    assert texts.index("Hu") < texts.index("")
+    assert chunks[-1].generation_info["usage_metadata"]["total_tokens"] == 5
+
+
+def test_stream_closes_response_when_consumer_stops() -> None:
+    reset_stream_cancellation_metrics()
+    stream = _MetaStream(["one", " two", " three", " four"])
+    client = MagicMock()
+    client.invoke_model_with_response_stream.return_value = {"body": stream}
+    llm = BedrockLLM(
+        client=client,
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+        max_tokens=100,
+    )
+
+    chunks = llm._stream("Hi")
+    assert next(chunks).text == "one"
+    chunks.close()
+
+    assert stream.closed
+    assert stream.read == 1
+    assert get_stream_cancellation_metrics() == StreamCancellationMetrics(1, 99)
+    reset_stream_cancellation_metrics()
+
+
+async def test_astream_closes_response_on_cancellation() -> None:
+    release = threading.Event()
+
+    class BlockingStream(_MetaStream):
+        def __iter__(self):
+            for event in super().__iter__():
+                yield event
+                release.wait(5)
+
+    stream = BlockingStream(["one", " two"])
+    client = MagicMock()
+    client.invoke_model_with_response_stream.return_value = {"body": stream}
+    llm = BedrockLLM(
+        client=client,
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+    started = asyncio.Event()
+
+    async def consume():
+        async for _ in llm._astream("Hi"):
+            started.set()
+
+    task = asyncio.create_task(consume())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    release.set()
+
+    assert stream.closed
+
+
+async def test_aiter_events_reads_streams_outside_default_executor() -> None:
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(1))
+    release = threading.Event()
+
+    def stream():
+        yield "first"
+        release.wait(5)
+        yield "second"
+
+    streams = [_aiter_events(stream()) for _ in range(4)]
+    try:
+        first_events = await asyncio.wait_for(
+            asyncio.gather(*(events.__anext__() for events in streams)), 1
+        )
+        assert first_events == ["first"] * 4
+    finally:
+        release.set()
+        for events in streams:
+            await events.aclose()
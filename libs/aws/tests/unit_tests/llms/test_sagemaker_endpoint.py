@@ -0,0 +1,59 @@
+# type:ignore
+
+import json
+from typing import Dict
+from unittest.mock import Mock
+
+from langchain_aws.llms import SagemakerEndpoint
+from langchain_aws.llms.sagemaker_endpoint import LLMContentHandler
+
+
+class StreamingHandler(LLMContentHandler):
+    accepts = "application/json"
+    content_type = "application/json"
+
+    def transform_input(self, prompt: str, model_kwargs: Dict) -> bytes:
+        return prompt.encode()
+
+    def transform_output(self, output: bytes) -> str:
+        return json.loads(output.decode())["outputs"][0]
+
+
+class PayloadStream:
+    def __init__(self, parts):
+        self.parts = parts
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self):
+        for part in self.parts:
+            self.read += 1
+            yield {"PayloadPart": {"Bytes": part}}
+
+    def close(self):
+        self.closed = True
+
+
+def test_stream_stops_at_stop_sequence_split_across_lines() -> None:
+    stream = PayloadStream(
+        [
+            b'{"outputs": ["Hello"]}\n',
+            b'{"outputs": [" Hu"]}\n',
+            b'{"outputs": ["man: next"]}\n',
+            b'{"outputs": [" turn"]}\n',
+        ]
+    )
+    client = Mock()
+    client.invoke_endpoint_with_response_stream.return_value = {"Body": stream}
+    llm = SagemakerEndpoint(
+        endpoint_name="my-endpoint",
+        region_name="us-west-2",
+        content_handler=StreamingHandler(),
+        client=client,
+    )
+
+    chunks = list(llm._stream("Hi", stop=["Human:"]))
+
+    assert "".join(chunk.text for chunk in chunks) == "Hello "
+    assert stream.closed
+    assert stream.read == 3
@@ -0,0 +1,130 @@
+# type:ignore
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.config import Config
+
+from langchain_aws import BedrockEmbeddings, ChatBedrockConverse
+from langchain_aws.clients import (
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    clear_clients,
+    get_client,
+    get_session,
+    set_max_pool_connections,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_clients():
+    clear_clients()
+    yield
+    set_max_pool_connections(DEFAULT_MAX_POOL_CONNECTIONS)
+    clear_clients()
+
+
+def test_get_client_is_shared() -> None:
+    client = get_client("bedrock-runtime", region_name="us-west-2")
+    assert get_client("bedrock-runtime", region_name="us-west-2") is client
+    assert get_client("bedrock-runtime", region_name="us-east-1") is not client
+    assert get_client("bedrock-agent-runtime", region_name="us-west-2") is not client
+    assert (
+        get_client(
+            "bedrock-runtime",
+            region_name="us-west-2",
+            endpoint_url="http://localhost:8080",
+        )
+        is not client
+    )
+
+
+def test_get_client_keys_on_config_options() -> None:
+    client = get_client(
+        "bedrock-runtime", region_name="us-west-2", config=Config(read_timeout=30)
+    )
+    assert (
+        get_client(
+            "bedrock-runtime", region_name="us-west-2", config=Config(read_timeout=30)
+        )
+        is client
+    )
+    assert (
+        get_client(
+            "bedrock-runtime", region_name="us-west-2", config=Config(read_timeout=60)
+        )
+        is not client
+    )
+
+
+def test_slow_client_creation_only_blocks_its_key() -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def create_client(service_name, **kwargs):
+        if service_name == "slow":
+            started.set()
+            release.wait(5)
+        return MagicMock(name=service_name)
+
+    with patch("langchain_aws.clients.boto3.Session") as mock_session:
+        mock_session.return_value.client.side_effect = create_client
+        threads = [
+            threading.Thread(target=get_client, args=("slow",)) for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5)
+
+        start = time.monotonic()
+        get_client("fast")
+        assert time.monotonic() - start < 1
+
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    services = [
+        call.args[0] for call in mock_session.return_value.client.call_args_list
+    ]
+    assert sorted(services) == ["fast", "slow"]
+
+
+def test_get_session_keys_on_credentials() -> None:
+    session = get_session(aws_access_key_id="a", aws_secret_access_key="b")
+    assert get_session(aws_access_key_id="a", aws_secret_access_key="b") is session
+    assert get_session(aws_access_key_id="a", aws_secret_access_key="c") is not session
+    assert get_session() is not session
+
+
+def test_get_client_creates_session_once() -> None:
+    with patch("langchain_aws.clients.boto3.Session") as mock_session:
+        get_client("bedrock-runtime", region_name="us-west-2")
+        get_client("bedrock-agent-runtime", region_name="us-west-2")
+    mock_session.assert_called_once_with()
+
+
+def test_max_pool_connections() -> None:
+    set_max_pool_connections(32)
+    client = get_client("bedrock-runtime", region_name="us-west-2")
+    assert client.meta.config.max_pool_connections == 32
+
+    client = get_client(
+        "bedrock-runtime", region_name="us-west-2", max_pool_connections=64
+    )
+    assert client.meta.config.max_pool_connections == 64
+
+    with pytest.raises(ValueError):
+        set_max_pool_connections(0)
+
+
+def test_instances_share_client() -> None:
+    embeddings = BedrockEmbeddings(region_name="us-west-2")
+    assert BedrockEmbeddings(region_name="us-west-2").client is embeddings.client
+
+    chat = ChatBedrockConverse(
+        model="anthropic.claude-3-sonnet-20240229-v1:0", region_name="us-west-2"
+    )
+    assert chat.client is embeddings.client
+    assert chat.region_name == "us-west-2"
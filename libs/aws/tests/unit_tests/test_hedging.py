@@ -0,0 +1,179 @@
+# type:ignore
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from langchain_aws import ChatBedrockConverse
+from langchain_aws.hedging import HedgingPolicy
+
+
+def _policy(**kwargs):
+    # Hedge every request after 10ms
+    return HedgingPolicy(initial_delay=0.01, max_hedge_ratio=1.0, **kwargs)
+
+
+def test_fast_request_is_not_hedged() -> None:
+    policy = _policy()
+    request = MagicMock(return_value="response")
+
+    assert policy.call(request, "client", "model") == "response"
+
+    request.assert_called_once_with("client", "model")
+    assert policy.hedges == 0
+
+
+def test_slow_request_is_hedged() -> None:
+    release = threading.Event()
+    discarded = []
+
+    def request(client, model_id):
+        if client == "primary":
+            release.wait(5)
+        return f"{client}:{model_id}"
+
+    policy = _policy(client="secondary", model_id="us.model")
+
+    assert (
+        policy.call(request, "primary", "model", discard=discarded.append)
+        == "secondary:us.model"
+    )
+    assert policy.hedges == 1
+    assert policy.hedge_wins == 1
+
+    release.set()
+    for _ in range(100):
+        if discarded:
+            break
+        time.sleep(0.01)
+    assert discarded == ["primary:model"]
+
+
+def test_hedge_budget() -> None:
+    policy = HedgingPolicy(initial_delay=0.01, max_hedge_ratio=0.5)
+    calls = []
+
+    def request(client, model_id):
+        calls.append(client)
+        time.sleep(0.05)
+        return client
+
+    for _ in range(4):
+        policy.call(request, "client", "model")
+
+    assert policy.requests == 4
+    assert policy.hedges == 2
+    assert len(calls) == 6
+
+
+def test_failed_request_falls_back_to_hedge() -> None:
+    def request(client, model_id):
+        if client == "primary":
+            time.sleep(0.05)
+            raise ValueError("primary failed")
+        return "hedged"
+
+    policy = _policy(client="secondary")
+
+    assert policy.call(request, "primary", "model") == "hedged"
+
+
+def test_failed_requests_raise_primary_error() -> None:
+    def request(client, model_id):
+        if client == "primary":
+            time.sleep(0.05)
+            raise ValueError("primary failed")
+        raise RuntimeError("hedge failed")
+
+    policy = _policy(client="secondary")
+
+    with pytest.raises(ValueError):
+        policy.call(request, "primary", "model", discard=MagicMock())
+
+
+def test_hedging_does_not_limit_concurrent_calls() -> None:
+    policy = HedgingPolicy(max_hedge_ratio=0.0)
+
+    def request(client, model_id):
+        time.sleep(0.2)
+        return client
+
+    threads = [
+        threading.Thread(target=policy.call, args=(request, "client", "model"))
+        for _ in range(64)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start < 1.0
+    assert policy.requests == 64
+
+
+def test_delay_uses_latency_percentile() -> None:
+    policy = HedgingPolicy(percentile=90, min_samples=10, min_delay=0.0)
+    assert policy.delay() == policy.initial_delay
+
+    for i in range(1, 11):
+        policy.record_latency(i / 10)
+
+    assert policy.delay() == 1.0
+
+    with pytest.raises(ValueError):
+        HedgingPolicy(percentile=0)
+
+
+async def test_acall_cancels_slow_request() -> None:
+    cancelled = asyncio.Event()
+
+    async def request(client, model_id):
+        if client == "primary":
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return client
+
+    policy = _policy(async_client="secondary")
+
+    assert await policy.acall(request, "primary", "model") == "secondary"
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+def test_chat_bedrock_converse_hedges_converse() -> None:
+    release = threading.Event()
+    response = {
+        "output": {"message": {"role": "assistant", "content": [{"text": "Hi!"}]}},
+        "stopReason": "end_turn",
+        "usage": {"inputTokens": 1, "outputTokens": 2, "totalTokens": 3},
+    }
+    client = MagicMock()
+    client.converse.side_effect = lambda **kwargs: release.wait(5) and response
+    hedge_client = MagicMock()
+    hedge_client.converse.return_value = response
+    llm = ChatBedrockConverse(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        client=client,
+        hedging_policy=_policy(
+            client=hedge_client,
+            model_id="us.anthropic.claude-3-sonnet-20240229-v1:0",
+        ),
+    )
+
+    assert llm.invoke("Hello").content == "Hi!"
+    release.set()
+
+    assert (
+        hedge_client.converse.call_args.kwargs["modelId"]
+        == "us.anthropic.claude-3-sonnet-20240229-v1:0"
+    )
+    assert client.converse.call_args.kwargs["modelId"] == (
+        "anthropic.claude-3-sonnet-20240229-v1:0"
+    )
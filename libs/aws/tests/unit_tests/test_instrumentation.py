@@ -0,0 +1,275 @@
+# type:ignore
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from langchain_aws import BedrockEmbeddings, BedrockLLM, ChatBedrockConverse
+from langchain_aws.instrumentation import (
+    OpenTelemetryHook,
+    add_instrumentation_hook,
+    instrument,
+    remove_instrumentation_hook,
+)
+from langchain_aws.region_pool import RegionPool
+
+CONVERSE_MODEL_ID = "anthropic.claude-3-sonnet-20240229-v1:0"
+
+
+@pytest.fixture
+def recorded():
+    calls = []
+    add_instrumentation_hook(calls.append)
+    yield calls
+    remove_instrumentation_hook(calls.append)
+
+
+def _converse_response():
+    return {
+        "output": {"message": {"role": "assistant", "content": [{"text": "Hi!"}]}},
+        "stopReason": "end_turn",
+        "usage": {"inputTokens": 3, "outputTokens": 5, "totalTokens": 8},
+    }
+
+
+def test_no_recording_without_hooks() -> None:
+    calls = []
+    add_instrumentation_hook(calls.append)
+    remove_instrumentation_hook(calls.append)
+
+    with instrument(object(), "model", "converse") as call:
+        with call.request():
+            pass
+
+    assert calls == []
+    assert not hasattr(call, "metrics")
+
+
+def test_bedrock_llm_invoke_records_token_headers(recorded) -> None:
+    body = MagicMock()
+    body.read.return_value = json.dumps(
+        {"generation": "Hello", "stop_reason": "stop"}
+    ).encode()
+    client = MagicMock()
+    client.invoke_model.return_value = {
+        "body": body,
+        "ResponseMetadata": {
+            "HTTPHeaders": {
+                "x-amzn-bedrock-input-token-count": "4",
+                "x-amzn-bedrock-output-token-count": "2",
+            }
+        },
+    }
+    llm = BedrockLLM(
+        client=client,
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+
+    assert llm.invoke("Hi") == "Hello"
+
+    (metrics,) = recorded
+    assert metrics.component == "BedrockLLM"
+    assert metrics.operation == "invoke_model"
+    assert (metrics.input_tokens, metrics.output_tokens) == (4, 2)
+    assert metrics.build_time >= 0
+    assert metrics.network_time >= 0
+    assert metrics.duration >= metrics.network_time
+    assert metrics.time_to_first_token is None
+    assert metrics.error is None
+
+
+def test_bedrock_llm_stream_records_chunks(recorded) -> None:
+    events = [
+        {
+            "chunk": {
+                "bytes": json.dumps({"generation": text, "stop_reason": None}).encode()
+            }
+        }
+        for text in ["one", " two", " three"]
+    ]
+    client = MagicMock()
+    client.invoke_model_with_response_stream.return_value = {"body": events}
+    llm = BedrockLLM(
+        client=client,
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+
+    assert "".join(llm.stream("Hi")) == "one two three"
+
+    (metrics,) = recorded
+    assert metrics.operation == "invoke_model_with_response_stream"
+    assert metrics.chunks == 3
+    assert metrics.time_to_first_token >= 0
+    assert metrics.max_inter_token_gap >= metrics.mean_inter_token_gap >= 0
+
+
+def test_converse_records_usage(recorded) -> None:
+    client = MagicMock()
+    client.converse.return_value = _converse_response()
+    llm = ChatBedrockConverse(
+        model=CONVERSE_MODEL_ID, region_name="us-west-2", client=client
+    )
+
+    llm.invoke("Hello")
+
+    (metrics,) = recorded
+    assert metrics.component == "ChatBedrockConverse"
+    assert metrics.model_id == CONVERSE_MODEL_ID
+    assert metrics.operation == "converse"
+    assert (metrics.input_tokens, metrics.output_tokens) == (3, 5)
+
+
+def test_converse_stream_records_chunks_and_usage(recorded) -> None:
+    client = MagicMock()
+    client.converse_stream.return_value = {
+        "stream": [
+            {"messageStart": {"role": "assistant"}},
+            {"contentBlockDelta": {"delta": {"text": "Hi"}, "contentBlockIndex": 0}},
+            {"contentBlockDelta": {"delta": {"text": "!"}, "contentBlockIndex": 0}},
+            {"messageStop": {"stopReason": "end_turn"}},
+            {
+                "metadata": {
+                    "usage": {"inputTokens": 3, "outputTokens": 2, "totalTokens": 5},
+                    "metrics": {"latencyMs": 10},
+                }
+            },
+        ]
+    }
+    llm = ChatBedrockConverse(
+        model=CONVERSE_MODEL_ID, region_name="us-west-2", client=client
+    )
+
+    list(llm.stream("Hello"))
+
+    (metrics,) = recorded
+    assert metrics.operation == "converse_stream"
+    assert metrics.chunks == 2
+    assert (metrics.input_tokens, metrics.output_tokens) == (3, 2)
+
+
+async def test_converse_records_errors(recorded) -> None:
+    client = MagicMock()
+    client.converse.side_effect = ValueError("bad request")
+    llm = ChatBedrockConverse(
+        model=CONVERSE_MODEL_ID, region_name="us-west-2", client=client
+    )
+
+    with pytest.raises(ValueError):
+        await llm.ainvoke("Hello")
+
+    (metrics,) = recorded
+    assert metrics.error == "ValueError"
+
+
+def test_region_pool_failover_counts_retries(recorded) -> None:
+    throttled = ClientError(
+        {
+            "Error": {"Code": "ThrottlingException", "Message": "slow down"},
+            "ResponseMetadata": {"HTTPStatusCode": 429},
+        },
+        "Converse",
+    )
+    regions = ["us-east-1", "us-west-2", "eu-central-1"]
+    clients = {region: MagicMock(name=region) for region in regions}
+    for client in clients.values():
+        client.converse.side_effect = throttled
+    clients["eu-central-1"].converse.side_effect = None
+    clients["eu-central-1"].converse.return_value = _converse_response()
+    llm = ChatBedrockConverse(
+        model=CONVERSE_MODEL_ID,
+        region_name="us-west-2",
+        client=MagicMock(),
+        region_pool=RegionPool(regions, clients=clients),
+    )
+
+    llm.invoke("Hello")
+
+    (metrics,) = recorded
+    assert metrics.retries == 2
+    assert metrics.throttles == 2
+
+
+async def test_bedrock_llm_ainvoke_counts_region_pool_retries(recorded) -> None:
+    throttled = ClientError(
+        {
+            "Error": {"Code": "ThrottlingException", "Message": "slow down"},
+            "ResponseMetadata": {"HTTPStatusCode": 429},
+        },
+        "InvokeModel",
+    )
+    body = MagicMock()
+    body.read.return_value = json.dumps(
+        {"generation": "Hello", "stop_reason": "stop"}
+    ).encode()
+    regions = ["us-east-1", "us-west-2"]
+    clients = {region: MagicMock(name=region) for region in regions}
+    clients["us-east-1"].invoke_model.side_effect = throttled
+    clients["us-west-2"].invoke_model.return_value = {"body": body}
+    llm = BedrockLLM(
+        client=MagicMock(),
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+        region_pool=RegionPool(regions, clients=clients),
+    )
+
+    assert await llm.ainvoke("Hi") == "Hello"
+
+    (metrics,) = recorded
+    assert metrics.retries == 1
+    assert metrics.throttles == 1
+
+
+def test_embeddings_record_calls(recorded) -> None:
+    body = MagicMock()
+    body.read.return_value = json.dumps({"embedding": [1.0, 2.0]})
+    client = MagicMock()
+    client.invoke_model.return_value = {"body": body}
+    embeddings = BedrockEmbeddings(
+        model_id="amazon.titan-embed-text-v2:0", client=client
+    )
+
+    embeddings.embed_documents(["one", "two"])
+
+    assert [m.component for m in recorded] == ["BedrockEmbeddings"] * 2
+
+
+def test_hook_errors_do_not_fail_calls(recorded) -> None:
+    def failing_hook(metrics):
+        raise RuntimeError("hook failed")
+
+    add_instrumentation_hook(failing_hook)
+    try:
+        with instrument(object(), "model", "converse"):
+            pass
+    finally:
+        remove_instrumentation_hook(failing_hook)
+
+    assert len(recorded) == 1
+
+
+def test_opentelemetry_hook() -> None:
+    meter = MagicMock()
+    hook = OpenTelemetryHook(meter=meter)
+    add_instrumentation_hook(hook)
+    try:
+        with instrument(object(), "model", "converse") as call:
+            with call.request():
+                pass
+            call.record_usage({"input_tokens": 3, "output_tokens": 5})
+    finally:
+        remove_instrumentation_hook(hook)
+
+    attributes = {
+        "langchain_aws.component": "object",
+        "gen_ai.request.model": "model",
+        "aws.operation": "converse",
+    }
+    meter.create_counter.return_value.add.assert_any_call(3, attributes)
+    meter.create_counter.return_value.add.assert_any_call(5, attributes)
+    meter.create_histogram.return_value.record.assert_any_call(
+        pytest.approx(0, abs=1), attributes
+    )
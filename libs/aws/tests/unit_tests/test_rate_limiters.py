@@ -0,0 +1,186 @@
+# type:ignore
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from langchain_aws import BedrockEmbeddings, ChatBedrockConverse
+from langchain_aws.rate_limiters import (
+    BedrockRateLimiter,
+    acall_with_rate_limit,
+    call_with_rate_limit,
+    get_model_rate_limiter,
+    is_throttling_error,
+    set_model_rate_limiter,
+)
+
+MODEL_ID = "amazon.titan-embed-text-v2:0"
+
+
+def _client_error(code: str, status_code: int = 400) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": code},
+            "ResponseMetadata": {"HTTPStatusCode": status_code},
+        },
+        "InvokeModel",
+    )
+
+
+@pytest.fixture
+def rate_limiter():
+    rate_limiter = BedrockRateLimiter(
+        max_retries=3, initial_backoff=0.001, max_backoff=0.001
+    )
+    set_model_rate_limiter(MODEL_ID, rate_limiter)
+    yield rate_limiter
+    set_model_rate_limiter(MODEL_ID, None)
+
+
+def test_is_throttling_error() -> None:
+    assert is_throttling_error(_client_error("ThrottlingException"))
+    assert is_throttling_error(_client_error("InternalFailure", 503))
+    assert not is_throttling_error(_client_error("ValidationException"))
+    assert not is_throttling_error(ValueError("boom"))
+
+
+def test_set_model_rate_limiter(rate_limiter) -> None:
+    assert get_model_rate_limiter(MODEL_ID) is rate_limiter
+    set_model_rate_limiter(MODEL_ID, None)
+    assert get_model_rate_limiter(MODEL_ID) is None
+
+
+def test_call_without_rate_limiter_does_not_retry() -> None:
+    func = MagicMock(side_effect=_client_error("ThrottlingException"))
+    with patch("langchain_aws.rate_limiters.time.sleep") as sleep:
+        with pytest.raises(ClientError):
+            call_with_rate_limit("unregistered-model", func)
+    assert func.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_call_leaves_retries_to_botocore_by_default() -> None:
+    rate_limiter = BedrockRateLimiter()
+    set_model_rate_limiter(MODEL_ID, rate_limiter)
+    func = MagicMock(side_effect=_client_error("ThrottlingException"))
+    try:
+        with pytest.raises(ClientError):
+            call_with_rate_limit(MODEL_ID, func)
+    finally:
+        set_model_rate_limiter(MODEL_ID, None)
+    assert func.call_count == 1
+    assert rate_limiter._rate_factor == 0.5
+
+
+def test_call_retries_throttling_errors(rate_limiter) -> None:
+    func = MagicMock(
+        side_effect=[_client_error("ThrottlingException"), {"result": "ok"}]
+    )
+    assert call_with_rate_limit(MODEL_ID, func) == {"result": "ok"}
+    assert func.call_count == 2
+
+
+def test_call_raises_other_errors(rate_limiter) -> None:
+    func = MagicMock(side_effect=_client_error("ValidationException"))
+    with pytest.raises(ClientError):
+        call_with_rate_limit(MODEL_ID, func)
+    assert func.call_count == 1
+
+
+def test_call_gives_up_after_max_retries(rate_limiter) -> None:
+    func = MagicMock(side_effect=_client_error("ThrottlingException"))
+    with pytest.raises(ClientError):
+        call_with_rate_limit(MODEL_ID, func)
+    assert func.call_count == rate_limiter.max_retries + 1
+
+
+async def test_acall_retries_throttling_errors(rate_limiter) -> None:
+    results = iter([_client_error("ServiceUnavailableException", 503), "ok"])
+
+    async def func():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert await acall_with_rate_limit(MODEL_ID, func) == "ok"
+
+
+def test_request_rate_limit() -> None:
+    rate_limiter = BedrockRateLimiter(requests_per_second=1)
+    assert rate_limiter.acquire(blocking=False)
+    assert not rate_limiter.acquire(blocking=False)
+
+
+def test_token_rate_limit() -> None:
+    rate_limiter = BedrockRateLimiter(tokens_per_minute=60)
+    assert rate_limiter.acquire(blocking=False)
+    rate_limiter.record_usage(100)
+    assert not rate_limiter.acquire(blocking=False)
+
+
+def test_call_records_token_usage() -> None:
+    rate_limiter = BedrockRateLimiter(tokens_per_minute=60)
+    set_model_rate_limiter(MODEL_ID, rate_limiter)
+    response = {
+        "ResponseMetadata": {
+            "HTTPHeaders": {
+                "x-amzn-bedrock-input-token-count": "50",
+                "x-amzn-bedrock-output-token-count": "50",
+            }
+        }
+    }
+    try:
+        call_with_rate_limit(MODEL_ID, lambda: response)
+    finally:
+        set_model_rate_limiter(MODEL_ID, None)
+    assert not rate_limiter.acquire(blocking=False)
+
+
+def test_converse_stream_records_token_usage() -> None:
+    model_id = "anthropic.claude-3-sonnet-20240229-v1:0"
+    rate_limiter = BedrockRateLimiter(tokens_per_minute=60)
+    set_model_rate_limiter(model_id, rate_limiter)
+    client = MagicMock()
+    client.converse_stream.return_value = {
+        "stream": [
+            {"contentBlockDelta": {"delta": {"text": "Hi"}, "contentBlockIndex": 0}},
+            {"messageStop": {"stopReason": "end_turn"}},
+            {
+                "metadata": {
+                    "usage": {"inputTokens": 50, "outputTokens": 50, "totalTokens": 100}
+                }
+            },
+        ]
+    }
+    llm = ChatBedrockConverse(model=model_id, region_name="us-west-2", client=client)
+    try:
+        list(llm.stream("Hello"))
+    finally:
+        set_model_rate_limiter(model_id, None)
+    assert not rate_limiter.acquire(blocking=False)
+
+
+def test_throttling_slows_down_rate_limiter() -> None:
+    rate_limiter = BedrockRateLimiter(requests_per_second=10)
+    rate_limiter.record_throttle()
+    assert rate_limiter._rate_factor == 0.5
+    rate_limiter.record_success()
+    assert rate_limiter._rate_factor == pytest.approx(0.55)
+
+
+def test_embeddings_retry_throttling_errors(rate_limiter) -> None:
+    body = MagicMock()
+    body.read.return_value = json.dumps({"embedding": [1.0, 2.0]})
+    client = MagicMock()
+    client.invoke_model.side_effect = [
+        _client_error("ThrottlingException"),
+        {"body": body},
+    ]
+    embeddings = BedrockEmbeddings(model_id=MODEL_ID, client=client)
+
+    with patch("langchain_aws.rate_limiters.time.sleep"):
+        assert embeddings.embed_query("hello") == [1.0, 2.0]
+    assert client.invoke_model.call_count == 2
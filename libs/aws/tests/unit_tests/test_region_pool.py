@@ -0,0 +1,140 @@
+# type:ignore
+
+import json
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from langchain_aws import BedrockEmbeddings, ChatBedrockConverse
+from langchain_aws.region_pool import RegionPool, is_failover_error
+
+REGIONS = ["us-east-1", "us-west-2", "eu-central-1"]
+
+
+def _client_error(code: str, status_code: int = 400) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": code},
+            "ResponseMetadata": {"HTTPStatusCode": status_code},
+        },
+        "InvokeModel",
+    )
+
+
+def _pool(**kwargs):
+    clients = {region: MagicMock(name=region) for region in REGIONS}
+    for region, client in clients.items():
+        client.region = region
+    return RegionPool(REGIONS, clients=clients, **kwargs), clients
+
+
+def test_is_failover_error() -> None:
+    assert is_failover_error(_client_error("ThrottlingException", 429))
+    assert is_failover_error(_client_error("InternalServerException", 500))
+    assert is_failover_error(EndpointConnectionError(endpoint_url="https://x"))
+    assert not is_failover_error(_client_error("ValidationException", 400))
+    assert not is_failover_error(ValueError("bad input"))
+
+
+def test_calls_are_balanced_over_regions() -> None:
+    pool, _ = _pool()
+
+    regions = [pool.call(lambda client: client.region) for _ in range(6)]
+
+    assert sorted(regions) == sorted(REGIONS * 2)
+
+
+def test_faster_regions_get_more_calls() -> None:
+    pool, _ = _pool()
+    pool.record_success("us-east-1", 0.1)
+    pool.record_success("us-west-2", 1.0)
+    pool.record_success("eu-central-1", 1.0)
+
+    regions = [pool._select()[0].region_name for _ in range(12)]
+
+    assert regions.count("us-east-1") == 10
+
+
+def test_failover_on_throttling() -> None:
+    pool, clients = _pool()
+    failed = []
+
+    def call(client):
+        if not failed:
+            failed.append(client.region)
+            raise _client_error("ThrottlingException", 429)
+        return client.region
+
+    region = pool.call(call)
+
+    assert region != failed[0]
+    # The throttled region is skipped during its cool-down
+    assert failed[0] not in {pool.call(lambda c: c.region) for _ in range(6)}
+
+
+def test_no_failover_on_client_errors() -> None:
+    pool, _ = _pool()
+    calls = []
+
+    def call(client):
+        calls.append(client.region)
+        raise _client_error("ValidationException", 400)
+
+    with pytest.raises(ClientError):
+        pool.call(call)
+    assert len(calls) == 1
+
+
+def test_raises_when_all_regions_fail() -> None:
+    pool, _ = _pool()
+
+    def call(client):
+        raise _client_error("ServiceUnavailableException", 503)
+
+    with pytest.raises(ClientError):
+        pool.call(call)
+    with pytest.raises(ClientError):
+        pool.call(call)
+
+
+def test_embeddings_use_region_pool() -> None:
+    pool, clients = _pool()
+    for client in clients.values():
+        client.invoke_model.side_effect = lambda **kwargs: {
+            "body": BytesIO(json.dumps({"embedding": [0.1, 0.2]}).encode())
+        }
+    embeddings = BedrockEmbeddings(
+        model_id="amazon.titan-embed-text-v2:0",
+        client=MagicMock(),
+        region_pool=pool,
+    )
+
+    for text in ["a", "b", "c"]:
+        assert embeddings.embed_query(text) == [0.1, 0.2]
+
+    assert all(client.invoke_model.call_count == 1 for client in clients.values())
+    embeddings.client.invoke_model.assert_not_called()
+
+
+def test_converse_fails_over() -> None:
+    pool, clients = _pool()
+    response = {
+        "output": {"message": {"role": "assistant", "content": [{"text": "Hi!"}]}},
+        "stopReason": "end_turn",
+        "usage": {"inputTokens": 1, "outputTokens": 2, "totalTokens": 3},
+    }
+    for client in clients.values():
+        client.converse.side_effect = _client_error("ThrottlingException", 429)
+    clients["eu-central-1"].converse.side_effect = None
+    clients["eu-central-1"].converse.return_value = response
+    llm = ChatBedrockConverse(
+        model="anthropic.claude-3-sonnet-20240229-v1:0",
+        region_name="us-west-2",
+        client=MagicMock(),
+        region_pool=pool,
+    )
+
+    assert llm.invoke("Hello").content == "Hi!"
+    clients["eu-central-1"].converse.assert_called_once()
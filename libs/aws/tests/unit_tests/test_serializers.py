@@ -0,0 +1,59 @@
+# type:ignore
+
+import importlib.util
+import json
+
+import pytest
+
+from langchain_aws.serializers import (
+    JsonSerializer,
+    get_json_serializer,
+    json_dumps,
+    json_loads,
+    set_json_serializer,
+)
+
+BACKENDS = [
+    name
+    for name in ("json", "orjson", "msgspec")
+    if importlib.util.find_spec(name) is not None
+]
+
+
+@pytest.fixture(autouse=True)
+def _restore_serializer():
+    serializer = get_json_serializer()
+    yield
+    set_json_serializer(serializer)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_roundtrip(name) -> None:
+    set_json_serializer(name)
+    body = {"prompt": "Hi é", "max_tokens": 10, "stop": ["\n"], "top_p": 0.5}
+
+    data = json_dumps(body)
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == body
+    assert json_loads(data) == body
+    assert json_loads(data.decode()) == body
+    assert get_json_serializer().name == name
+
+
+def test_custom_serializer() -> None:
+    calls = []
+
+    def dumps(obj):
+        calls.append(obj)
+        return json.dumps(obj).encode()
+
+    set_json_serializer(JsonSerializer("custom", dumps, json.loads))
+
+    assert json_loads(json_dumps({"a": 1})) == {"a": 1}
+    assert calls == [{"a": 1}]
+
+
+def test_unknown_serializer() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON serializer"):
+        set_json_serializer("yaml")
@@ -0,0 +1,68 @@
+# type:ignore
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from langchain_aws.streams import (
+    ResponseStreamGuard,
+    StreamCancellationMetrics,
+    get_stream_cancellation_metrics,
+    reset_stream_cancellation_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    reset_stream_cancellation_metrics()
+    yield
+    reset_stream_cancellation_metrics()
+
+
+def test_guard_cancels_unfinished_stream() -> None:
+    stream = MagicMock()
+
+    with ResponseStreamGuard(stream, max_tokens=100) as guard:
+        guard.chunks_read = 10
+
+    stream.close.assert_called_once_with()
+    assert get_stream_cancellation_metrics() == StreamCancellationMetrics(1, 90)
+
+
+def test_guard_keeps_finished_stream() -> None:
+    stream = MagicMock()
+
+    with ResponseStreamGuard(stream, max_tokens=100) as guard:
+        guard.finish()
+
+    stream.close.assert_not_called()
+    assert get_stream_cancellation_metrics() == StreamCancellationMetrics(0, 0)
+
+
+def test_guard_cancels_on_error() -> None:
+    stream = MagicMock()
+
+    with pytest.raises(RuntimeError):
+        with ResponseStreamGuard(stream):
+            raise RuntimeError("consumer failed")
+
+    stream.close.assert_called_once_with()
+    assert get_stream_cancellation_metrics() == StreamCancellationMetrics(1, 0)
+
+
+def test_guard_ignores_streams_without_close() -> None:
+    with ResponseStreamGuard([{"chunk": {}}], max_tokens=100):
+        pass
+
+    assert get_stream_cancellation_metrics() == StreamCancellationMetrics(0, 0)
+
+
+async def test_guard_awaits_async_close() -> None:
+    stream = MagicMock()
+    stream.close = AsyncMock()
+
+    async with ResponseStreamGuard(stream, max_tokens=50) as guard:
+        guard.chunks_read = 60
+
+    stream.close.assert_awaited_once_with()
+    assert get_stream_cancellation_metrics() == StreamCancellationMetrics(1, 0)
@@ -0,0 +1,64 @@
+# type:ignore
+
+import pytest
+
+from langchain_aws.utils import StopSequenceMatcher, enforce_stop_tokens
+
+
+def _feed_all(matcher, chunks):
+    output = ""
+    for chunk in chunks:
+        text, stopped = matcher.feed(chunk)
+        output += text
+        if stopped:
+            return output, True
+    return output + matcher.flush(), matcher.stopped
+
+
+@pytest.mark.parametrize(
+    "chunks,stop,expected",
+    [
+        (["Hello Human: bye"], ["Human:"], ("Hello ", True)),
+        (["Hello H", "um", "an: bye"], ["Human:"], ("Hello ", True)),
+        (["Hello Hum", "ble pie"], ["Human:"], ("Hello Humble pie", False)),
+        (["a\n", "b\n", "\nc"], ["\n\n", "END"], ("a\nb", True)),
+        (["aa", "a", "ab"], ["aab"], ("aa", True)),
+        (["x ab", "cd"], ["abcd", "bc"], ("x ", True)),
+        (["ccabac"], ["aba", "b"], ("cc", True)),
+        (["cca", "b", "ac"], ["aba", "b"], ("cc", True)),
+        (["ccab"], ["aba", "b"], ("cca", True)),
+        (["ccab", "x"], ["aba", "b"], ("cca", True)),
+        (["Hi", " there"], [""], ("Hi there", False)),
+    ],
+)
+def test_stop_sequence_matcher(chunks, stop, expected) -> None:
+    assert _feed_all(StopSequenceMatcher(stop), chunks) == expected
+
+
+def test_stop_sequence_matcher_drops_text_after_stop() -> None:
+    matcher = StopSequenceMatcher(["STOP"])
+
+    assert matcher.feed("one STOP two") == ("one ", True)
+    assert matcher.feed("three") == ("", True)
+    assert matcher.stopped
+
+
+@pytest.mark.parametrize(
+    "text,stop",
+    [
+        ("ccabac", ["aba", "b"]),
+        ("xabcdx", ["bc", "abcd"]),
+        ("aaaab", ["aab", "aaa", "ab"]),
+        ("hello world", ["lo w", "o", "wor"]),
+    ],
+)
+def test_stop_sequence_matcher_matches_enforce_stop_tokens(text, stop) -> None:
+    expected = enforce_stop_tokens(text, stop)
+    for size in range(1, len(text) + 1):
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        assert _feed_all(StopSequenceMatcher(stop), chunks)[0] == expected
+
+
+def test_enforce_stop_tokens() -> None:
+    assert enforce_stop_tokens("Hello Human: bye", ["Human:", "AI:"]) == "Hello "
+    assert enforce_stop_tokens("Hello", ["Human:"]) == "Hello"